@@ -1,90 +1,3129 @@
 # dashboard_guyane_aerospatiale.py
+import time
+DEBUT_SCRIPT = time.time()
+
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial, wraps
 from datetime import datetime, timedelta
-import time
+import asyncio
+import atexit
+import hashlib
+import html
+import importlib
+import json
+import multiprocessing
+import os
+import pickle
+import sys
+import threading
 import random
+import sqlite3
 import warnings
 warnings.filterwarnings('ignore')
+FIN_IMPORTS = time.time()
+
+# Durée (en secondes) des imports différés effectués pendant l'exécution
+IMPORTS_DIFFERES = {}
+
+
+class ModuleDiffere:
+    """Module importé au premier accès à l'un de ses attributs.
+
+    Plotly n'est chargé qu'au rendu de la première section qui construit une
+    figure, et non au démarrage du script.
+    """
+
+    def __init__(self, nom):
+        self._nom = nom
+        self._module = None
+
+    def __getattr__(self, attribut):
+        if self._module is None:
+            debut = time.perf_counter()
+            self._module = importlib.import_module(self._nom)
+            IMPORTS_DIFFERES.setdefault(self._nom, time.perf_counter() - debut)
+        return getattr(self._module, attribut)
+
+
+px = ModuleDiffere('plotly.express')
+go = ModuleDiffere('plotly.graph_objects')
+pio = ModuleDiffere('plotly.io')
+couleurs_plotly = ModuleDiffere('plotly.colors')
+
+# Profil du premier affichage : "stderr" ou chemin du rapport JSON (vide = désactivé)
+PROFIL_DEMARRAGE = os.environ.get('CSG_PROFIL_DEMARRAGE', '')
+
+
+def debut_processus():
+    """Instant de lancement du processus (horloge système), lu dans /proc sous Linux"""
+    try:
+        with open('/proc/self/stat') as fichier:
+            champs = fichier.read().rsplit(')', 1)[1].split()
+        with open('/proc/uptime') as fichier:
+            depuis_amorcage = float(fichier.read().split()[0])
+        return time.time() - depuis_amorcage + int(champs[19]) / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class ProfilDemarrage:
+    """Chronologie du premier affichage du processus, du lancement au rendu de la première section.
+
+    Chaque jalon clôt une étape (interpréteur et serveur, imports, style,
+    données, sidebar et métriques, première section) ; le rapport est
+    produit une seule fois, à la fin de la première exécution du script,
+    avec la durée des imports différés.
+    """
+
+    def __init__(self, destination, debut_script, fin_imports):
+        self.destination = destination
+        self.debut = debut_processus() or debut_script
+        self.jalons = [('interpréteur et serveur', debut_script), ('imports', fin_imports)]
+        self.termine = False
+        self.verrou = threading.Lock()
+
+    def jalon(self, nom):
+        if not self.termine:
+            self.jalons.append((nom, time.time()))
+
+    def rapport(self, imports_differes):
+        etapes, precedent = [], self.debut
+        for nom, instant in self.jalons:
+            etapes.append({'etape': nom, 'duree_ms': (instant - precedent) * 1000,
+                           'depuis_lancement_ms': (instant - self.debut) * 1000})
+            precedent = instant
+        return {
+            'premier_affichage_ms': (precedent - self.debut) * 1000,
+            'etapes': etapes,
+            'imports_differes_ms': {module: duree * 1000 for module, duree in imports_differes.items()}
+        }
+
+    def terminer(self, imports_differes):
+        with self.verrou:
+            if self.termine:
+                return
+            self.termine = True
+        if not self.destination:
+            return
+        rapport = self.rapport(imports_differes)
+        if self.destination == 'stderr':
+            lignes = [f"Premier affichage en {rapport['premier_affichage_ms']:.0f} ms"]
+            lignes += [f"  {etape['etape']:<25} {etape['duree_ms']:8.0f} ms" for etape in rapport['etapes']]
+            if rapport['imports_differes_ms']:
+                lignes.append("  imports différés :")
+                lignes += [f"    {module:<23} {duree:8.0f} ms" for module, duree in rapport['imports_differes_ms'].items()]
+            print('\n'.join(lignes), file=sys.stderr)
+        else:
+            with open(self.destination, 'w', encoding='utf-8') as fichier:
+                json.dump(rapport, fichier, indent=2, ensure_ascii=False)
+
+
+@st.cache_resource(show_spinner=False)
+def obtenir_profil_demarrage(destination=PROFIL_DEMARRAGE):
+    """Profil du premier affichage, unique pour le processus"""
+    return ProfilDemarrage(destination, DEBUT_SCRIPT, FIN_IMPORTS)
+
+
+profil_demarrage = obtenir_profil_demarrage()
+
+# Configuration de la page
+st.set_page_config(
+    page_title="Centre Spatial Guyanais - Dashboard Live",
+    page_icon="🚀",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# CSS personnalisé
+st.markdown("""
+<style>
+    .main-header {
+        font-size: 2.5rem;
+        background: linear-gradient(45deg, #0d3b66, #1e5a8a, #e37222);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        text-align: center;
+        margin-bottom: 2rem;
+        font-weight: bold;
+    }
+    .live-badge {
+        background: linear-gradient(45deg, #0d3b66, #e37222);
+        color: white;
+        padding: 0.3rem 1rem;
+        border-radius: 20px;
+        font-weight: bold;
+        display: inline-block;
+        animation: pulse 2s infinite;
+    }
+    @keyframes pulse {
+        0% { transform: scale(1); }
+        50% { transform: scale(1.05); }
+        100% { transform: scale(1); }
+    }
+    .metric-card {
+        background-color: #f0f2f6;
+        padding: 1rem;
+        border-radius: 10px;
+        border-left: 4px solid #0d3b66;
+        margin: 0.5rem 0;
+    }
+    .section-header {
+        color: #0d3b66;
+        border-bottom: 2px solid #e37222;
+        padding-bottom: 0.5rem;
+        margin-top: 2rem;
+    }
+    .mission-card {
+        padding: 1rem;
+        border-radius: 10px;
+        margin: 0.5rem 0;
+        border-left: 5px solid #0d3b66;
+        background-color: #f8f9fa;
+    }
+    .mission-status {
+        padding: 0.5rem;
+        border-radius: 5px;
+        margin: 0.2rem 0;
+        font-size: 0.9rem;
+    }
+    .success { background-color: #d4edda; border-left: 4px solid #28a745; }
+    .failure { background-color: #f8d7da; border-left: 4px solid #dc3545; }
+    .planned { background-color: #cce7ff; border-left: 4px solid #007bff; }
+    .in-progress { background-color: #fff3cd; border-left: 4px solid #ffc107; }
+    .mission-table {
+        width: 100%;
+        border-collapse: collapse;
+    }
+    .mission-table td {
+        padding: 0.5rem;
+        border: none;
+        border-bottom: 1px solid #dee2e6;
+        vertical-align: top;
+    }
+</style>
+""", unsafe_allow_html=True)
+profil_demarrage.jalon('style')
+
+# Version des données de référence : l'incrémenter invalide le cache partagé
+VERSION_DONNEES = 2
+
+
+# Graine du générateur de données simulées (CSG_GRAINE pour des exécutions reproductibles)
+GRAINE_DONNEES = int(os.environ['CSG_GRAINE']) if os.environ.get('CSG_GRAINE') else None
+# Nombre de missions simulées (CSG_MISSIONS, pour mesurer le dashboard à plus grande échelle)
+NOMBRE_MISSIONS = int(os.environ.get('CSG_MISSIONS', 100))
+
+# Valeurs possibles des données simulées
+TYPES_MISSION = ['Commercial', 'Institutionnel', 'Scientifique', 'Militaire', 'Observation Terre']
+CLIENTS_MISSION = ['ESA', 'NASA', 'CNES', 'Eutelsat', 'SES', 'Intelsat', 'OneWeb', 'Airbus', 'Thales', 'SpaceX (Transports)']
+ORBITES = ['GEO', 'LEO', 'SSO', 'MEO', 'HEO', 'Lunar Transfer']
+SITES_LANCEMENT = ['ELA-3', 'ELS', 'ELV']
+PREFIXES_MISSION = ['VA', 'VV', 'VS', 'AR']
+TYPES_CHARGE_UTILE = ['Telecom', 'Observation', 'Scientifique', 'Navigation']
+STATUTS_ECHEC = ['Échec', 'Succès partiel']
+POIDS_ECHEC = [0.7, 0.3]
+TAUX_SUCCES = 0.9
+
+# Base de lancements par an (1 pour les lanceurs non listés)
+BASE_LANCEMENTS_ANNUELS = {'Ariane 5': 7, 'Vega': 3, 'Soyuz': 2, 'Vega C': 2}
+DEBUT_VEGA_C = 2022
+
+
+# Catégories fixes du schéma compact des missions
+STATUTS_MISSION = ['Succès', 'Échec', 'Succès partiel', 'Planifié']
+SITES_CSG = ['ELA-3', 'ELA-4', 'ELS', 'ELV']
+NUMEROS_CHARGE_UTILE = 200
+CATEGORIES_MISSION_ID = [f'{prefixe}{numero}' for prefixe in PREFIXES_MISSION for numero in range(200, 300)]
+CATEGORIES_CHARGE_UTILE = [f'Satellite {type_charge} {numero}' for type_charge in TYPES_CHARGE_UTILE
+                           for numero in range(1, NUMEROS_CHARGE_UTILE + 1)]
+
+
+def schema_missions(lanceurs):
+    """Types des colonnes de la table des missions.
+
+    Les colonnes textuelles sont des Categoricals à catégories fixes (les noms
+    de charge utile et identifiants de mission sont encodés par dictionnaire),
+    ce qui garde les concaténations catégorielles et accélère groupby/value_counts.
+    """
+    return {
+        'mission_id': pd.CategoricalDtype(CATEGORIES_MISSION_ID),
+        'lanceur': pd.CategoricalDtype(list(lanceurs.keys())),
+        'date_lancement': np.dtype('datetime64[ns]'),
+        'client': pd.CategoricalDtype(CLIENTS_MISSION),
+        'type_mission': pd.CategoricalDtype(TYPES_MISSION),
+        'orbite': pd.CategoricalDtype(ORBITES),
+        'statut': pd.CategoricalDtype(STATUTS_MISSION),
+        'charge_utile': pd.CategoricalDtype(CATEGORIES_CHARGE_UTILE),
+        'masse_charge_utile': np.dtype('int32'),
+        'site_lancement': pd.CategoricalDtype(SITES_CSG)
+    }
+
+
+def typer_missions(missions, lanceurs):
+    """Convertit une table de missions au schéma compact.
+
+    Les valeurs absentes des catégories fixes sont ajoutées en fin de liste
+    plutôt que perdues.
+    """
+    colonnes = {}
+    for colonne, dtype in schema_missions(lanceurs).items():
+        if colonne not in missions:
+            continue
+        if isinstance(dtype, pd.CategoricalDtype):
+            inconnues = pd.Index(missions[colonne].dropna().unique()).difference(dtype.categories)
+            if len(inconnues):
+                dtype = pd.CategoricalDtype(list(dtype.categories) + list(inconnues))
+        colonnes[colonne] = missions[colonne].astype(dtype)
+    return missions.assign(**colonnes)
+
+
+def concatener_missions(tables):
+    """Concatène des tables de missions en conservant le schéma de la première"""
+    reference = tables[0]
+    colonnes = {}
+    for colonne, dtype in reference.dtypes.items():
+        series = [table[colonne] for table in tables]
+        if isinstance(dtype, pd.CategoricalDtype):
+            colonnes[colonne] = pd.api.types.union_categoricals(
+                [serie if isinstance(serie.dtype, pd.CategoricalDtype) else serie.astype('category')
+                 for serie in series]
+            )
+        else:
+            colonnes[colonne] = pd.concat(series, ignore_index=True).astype(dtype)
+    return pd.DataFrame(colonnes)
+
+
+def rapport_memoire(tables):
+    """Compare l'empreinte mémoire (octets, profonde) de plusieurs tables colonne par colonne"""
+    rapport = pd.DataFrame({nom: table.memory_usage(index=False, deep=True) for nom, table in tables.items()})
+    rapport.loc['TOTAL'] = rapport.sum()
+    premiere, derniere = rapport.columns[0], rapport.columns[-1]
+    rapport['gain'] = rapport[premiere] / rapport[derniere]
+    return rapport
+
+
+class GenerateurDonnees:
+    """Générateur vectorisé des données simulées.
+
+    Chaque table est produite en quelques opérations sur des tableaux NumPy
+    (numpy.random.Generator), avec les mêmes schémas et distributions que les
+    anciennes boucles Python. Une graine fixe rend les données reproductibles.
+    """
+
+    def __init__(self, lanceurs, graine=None):
+        self.lanceurs = lanceurs
+        self.rng = np.random.default_rng(graine)
+
+    def _codes(self, n, k, p=None):
+        """Tire n codes dans [0, k) uniformément (ou selon p)"""
+        if p is None:
+            return self.rng.integers(0, k, n)
+        return self.rng.choice(k, n, p=p)
+
+    def missions(self, n):
+        """Génère n missions (90% de succès, échecs répartis 70/30) au schéma compact"""
+        rng = self.rng
+        schema = schema_missions(self.lanceurs)
+        annees = rng.integers(2002, 2026, n)
+        mois = rng.integers(1, 13, n)
+        jours = rng.integers(1, 29, n)
+        dates = (((annees - 1970) * 12 + mois - 1).astype('datetime64[M]').astype('datetime64[D]')
+                 + (jours - 1).astype('timedelta64[D]'))
+
+        # Les colonnes catégorielles sont construites directement à partir de leurs codes
+        def categorie(colonne, codes):
+            return pd.Categorical.from_codes(codes, dtype=schema[colonne])
+
+        def code_de(colonne, valeurs):
+            return schema[colonne].categories.get_indexer(valeurs)
+
+        statuts = code_de('statut', STATUTS_ECHEC)[self._codes(n, len(STATUTS_ECHEC), p=POIDS_ECHEC)]
+        statuts[rng.random(n) < TAUX_SUCCES] = code_de('statut', ['Succès'])[0]
+
+        return pd.DataFrame({
+            'mission_id': categorie('mission_id', self._codes(n, len(PREFIXES_MISSION)) * 100 + rng.integers(0, 100, n)),
+            'lanceur': categorie('lanceur', self._codes(n, len(self.lanceurs))),
+            'date_lancement': dates.astype('datetime64[ns]'),
+            'client': categorie('client', self._codes(n, len(CLIENTS_MISSION))),
+            'type_mission': categorie('type_mission', self._codes(n, len(TYPES_MISSION))),
+            'orbite': categorie('orbite', self._codes(n, len(ORBITES))),
+            'statut': categorie('statut', statuts),
+            'charge_utile': categorie('charge_utile', self._codes(n, len(TYPES_CHARGE_UTILE)) * NUMEROS_CHARGE_UTILE
+                                      + rng.integers(0, 100, n)),
+            'masse_charge_utile': rng.integers(100, 10001, n).astype(schema['masse_charge_utile']),
+            'site_lancement': categorie('site_lancement', code_de('site_lancement', SITES_LANCEMENT)[
+                self._codes(n, len(SITES_LANCEMENT))])
+        })
+
+    def trafic(self, debut, fin, freq='ME'):
+        """Génère le trafic par période et par lanceur depuis son premier vol"""
+        dates = pd.date_range(debut, fin, freq=freq)
+        noms = list(self.lanceurs.keys())
+
+        # Grille période × lanceur (même ordre que les boucles imbriquées d'origine)
+        annees = np.repeat(dates.year.to_numpy(), len(noms))
+        idx_lanceur = np.tile(np.arange(len(noms)), len(dates))
+        premier_vol = np.array([int(info['premier_vol']) for info in self.lanceurs.values()])
+        base = np.array([BASE_LANCEMENTS_ANNUELS.get(nom, 1) for nom in noms])
+        debut_lanceur = np.where(np.array(noms) == 'Vega C',
+                                 np.maximum(premier_vol, DEBUT_VEGA_C), premier_vol)
+
+        actifs = annees >= debut_lanceur[idx_lanceur]
+        idx_lanceur = idx_lanceur[actifs]
+        n = len(idx_lanceur)
+
+        # Variation saisonnière et aléatoire
+        lancements = np.maximum(0, np.floor(base[idx_lanceur] / 12 * self.rng.uniform(0.8, 1.2, n))).astype(np.int64)
+        types = np.array([info['type'] for info in self.lanceurs.values()], dtype=object)
+
+        return pd.DataFrame({
+            'date': np.repeat(dates.to_numpy(), len(noms))[actifs],
+            'lanceur': np.array(noms, dtype=object)[idx_lanceur],
+            'lancements': lancements,
+            'satellites_lances': self.rng.integers(1, 5, n) * lancements,
+            'masse_totale': self.rng.integers(1000, 20001, n) * lancements,
+            'type_lanceur': types[idx_lanceur]
+        })
+
+
+class CubeMissions:
+    """Index d'agrégats : nombre de missions par lanceur × statut × année.
+
+    Construit en une seule passe (bincount sur les codes catégoriels) puis mis
+    à jour mission par mission : les métriques et graphiques qui le lisent ont
+    un coût indépendant du nombre de missions historiques.
+    """
+
+    def __init__(self, lanceurs, statuts, annee_min, annee_max):
+        self.lanceurs = list(lanceurs)
+        self.statuts = list(statuts)
+        self.annee_min = annee_min
+        self.comptes = np.zeros((len(self.lanceurs), len(self.statuts), annee_max - annee_min + 1), dtype=np.int64)
+        # Dates des missions planifiées, pour compter celles encore à venir
+        self.dates_planifiees = np.array([], dtype='datetime64[ns]')
+
+    @classmethod
+    def depuis_missions(cls, missions):
+        """Construit le cube à partir d'une table de missions au schéma compact"""
+        annees = missions['date_lancement'].dt.year.to_numpy()
+        annee_min = int(annees.min()) if len(annees) else datetime.now().year
+        annee_max = int(annees.max()) if len(annees) else annee_min
+        lanceurs = missions['lanceur'].cat.categories
+        statuts = missions['statut'].cat.categories
+        cube = cls(lanceurs, statuts, annee_min, annee_max)
+
+        forme = cube.comptes.shape
+        index = np.ravel_multi_index((missions['lanceur'].cat.codes.to_numpy(),
+                                      missions['statut'].cat.codes.to_numpy(),
+                                      annees - annee_min), forme)
+        cube.comptes = np.bincount(index, minlength=cube.comptes.size).reshape(forme)
+        cube.dates_planifiees = np.sort(
+            missions.loc[missions['statut'] == 'Planifié', 'date_lancement'].to_numpy())
+        return cube
+
+    def copie(self):
+        """Copie indépendante (pour les modifications propres à une session)"""
+        cube = CubeMissions(self.lanceurs, self.statuts, self.annee_min, self.annee_max)
+        cube.comptes = self.comptes.copy()
+        cube.dates_planifiees = self.dates_planifiees.copy()
+        return cube
+
+    def __eq__(self, autre):
+        return (isinstance(autre, CubeMissions) and self.lanceurs == autre.lanceurs
+                and self.statuts == autre.statuts and self.annee_min == autre.annee_min
+                and np.array_equal(self.comptes, autre.comptes)
+                and np.array_equal(self.dates_planifiees, autre.dates_planifiees))
+
+    def _position(self, valeurs, valeur, axe):
+        """Position d'une valeur sur un axe, en l'ajoutant si elle est nouvelle"""
+        if valeur not in valeurs:
+            valeurs.append(valeur)
+            largeur = [(0, 0)] * 3
+            largeur[axe] = (0, 1)
+            self.comptes = np.pad(self.comptes, largeur)
+        return valeurs.index(valeur)
+
+    def ajouter(self, lanceur, statut, date_lancement):
+        """Ajoute une mission au cube en O(1) (hors extension d'un axe)"""
+        date_lancement = pd.Timestamp(date_lancement)
+        annee = date_lancement.year - self.annee_min
+        if annee < 0:
+            self.comptes = np.pad(self.comptes, [(0, 0), (0, 0), (-annee, 0)])
+            self.annee_min += annee
+            annee = 0
+        elif annee >= self.comptes.shape[2]:
+            self.comptes = np.pad(self.comptes, [(0, 0), (0, 0), (0, annee - self.comptes.shape[2] + 1)])
+
+        i = self._position(self.lanceurs, lanceur, 0)
+        j = self._position(self.statuts, statut, 1)
+        self.comptes[i, j, annee] += 1
+        if statut == 'Planifié':
+            position = np.searchsorted(self.dates_planifiees, date_lancement.to_datetime64())
+            self.dates_planifiees = np.insert(self.dates_planifiees, position, date_lancement.to_datetime64())
+
+    # Lectures
+
+    @property
+    def annee_max(self):
+        return self.annee_min + self.comptes.shape[2] - 1
+
+    @property
+    def annees(self):
+        return np.arange(self.annee_min, self.annee_max + 1)
+
+    def total(self):
+        return int(self.comptes.sum())
+
+    def missions_annee(self, annee):
+        """Nombre de missions d'une année"""
+        position = annee - self.annee_min
+        if position < 0 or position >= self.comptes.shape[2]:
+            return 0
+        return int(self.comptes[:, :, position].sum())
+
+    def par_statut(self):
+        """Nombre de missions par statut (toutes années confondues)"""
+        return pd.Series(self.comptes.sum(axis=(0, 2)), index=self.statuts)
+
+    def vols_par_lanceur(self):
+        """Nombre de missions par lanceur"""
+        return pd.Series(self.comptes.sum(axis=(1, 2)), index=self.lanceurs)
+
+    def succes_par_lanceur(self):
+        """Nombre de missions réussies par lanceur"""
+        if 'Succès' not in self.statuts:
+            return pd.Series(0, index=self.lanceurs)
+        return pd.Series(self.comptes[:, self.statuts.index('Succès'), :].sum(axis=1), index=self.lanceurs)
+
+    def planifiees_apres(self, date):
+        """Nombre de missions planifiées après une date"""
+        position = np.searchsorted(self.dates_planifiees, np.datetime64(pd.Timestamp(date)), side='right')
+        return len(self.dates_planifiees) - int(position)
+
+    def lancements_annuels(self, par_lanceur=False):
+        """Nombre de lancements par année (et par lanceur), années vides exclues"""
+        if par_lanceur:
+            comptes = self.comptes.sum(axis=1)
+            lanceurs, annees = np.nonzero(comptes)
+            return pd.DataFrame({
+                'date_lancement': self.annees[annees],
+                'lanceur': np.asarray(self.lanceurs, dtype=object)[lanceurs],
+                'nombre_lancements': comptes[lanceurs, annees]
+            }).sort_values(['date_lancement', 'lanceur'], ignore_index=True)
+        comptes = self.comptes.sum(axis=(0, 1))
+        annees = np.nonzero(comptes)[0]
+        return pd.DataFrame({'date_lancement': self.annees[annees], 'nombre_lancements': comptes[annees]})
+
+
+# Tableaux croisés maintenus par le cache de matrices : nom → (dimension des lignes, dimension des colonnes).
+# Une dimension est une colonne catégorielle des missions ou une dimension dérivée ci-dessous ;
+# ajouter une entrée (par exemple 'site_annee': ('site_lancement', 'annee')) suffit à la maintenir.
+MATRICES_CONTINGENCE = {
+    'lanceur_orbite': ('lanceur', 'orbite'),
+    'type_orbite': ('type_mission', 'orbite'),
+}
+
+# Dimensions dérivées : nom → (colonne source, valeurs d'une série, valeur d'une mission)
+DIMENSIONS_DERIVEES = {
+    'annee': ('date_lancement', lambda dates: dates.dt.year, lambda date: pd.Timestamp(date).year),
+}
+
+
+class MatricesContingence:
+    """Cache de tableaux croisés des missions, en comptes denses indexés par codes catégoriels.
+
+    Construit en une passe bincount par matrice, puis mis à jour en O(1) par
+    mission ajoutée : la carte de chaleur et les répartitions lues ici ne
+    parcourent jamais la table des missions.
+    """
+
+    def __init__(self, definitions=MATRICES_CONTINGENCE):
+        self.definitions = dict(definitions)
+        self.valeurs = {dimension: [] for dimensions in self.definitions.values() for dimension in dimensions}
+        self.comptes = {nom: np.zeros((0, 0), dtype=np.int64) for nom in self.definitions}
+
+    @classmethod
+    def depuis_missions(cls, missions, definitions=MATRICES_CONTINGENCE):
+        """Construit les matrices à partir d'une table de missions au schéma compact"""
+        matrices = cls(definitions)
+        codes = {}
+        for dimension in matrices.valeurs:
+            if dimension in DIMENSIONS_DERIVEES:
+                colonne, valeurs_serie, _ = DIMENSIONS_DERIVEES[dimension]
+                codes[dimension], valeurs = pd.factorize(valeurs_serie(missions[colonne]), sort=True)
+            else:
+                codes[dimension], valeurs = missions[dimension].cat.codes.to_numpy(), missions[dimension].cat.categories
+            matrices.valeurs[dimension] = list(valeurs)
+
+        for nom, (ligne, colonne) in matrices.definitions.items():
+            forme = (len(matrices.valeurs[ligne]), len(matrices.valeurs[colonne]))
+            valides = (codes[ligne] >= 0) & (codes[colonne] >= 0)
+            index = np.ravel_multi_index((codes[ligne][valides], codes[colonne][valides]), forme)
+            matrices.comptes[nom] = np.bincount(index, minlength=forme[0] * forme[1]).reshape(forme)
+        return matrices
+
+    def copie(self):
+        """Copie indépendante (pour les modifications propres à une session)"""
+        matrices = MatricesContingence(self.definitions)
+        matrices.valeurs = {dimension: list(valeurs) for dimension, valeurs in self.valeurs.items()}
+        matrices.comptes = {nom: comptes.copy() for nom, comptes in self.comptes.items()}
+        return matrices
+
+    def _position(self, dimension, valeur):
+        """Position d'une valeur sur les axes d'une dimension, en l'ajoutant si elle est nouvelle"""
+        valeurs = self.valeurs[dimension]
+        if valeur not in valeurs:
+            valeurs.append(valeur)
+            for nom, dimensions in self.definitions.items():
+                largeurs = [(0, int(dimension == dimensions[0])), (0, int(dimension == dimensions[1]))]
+                self.comptes[nom] = np.pad(self.comptes[nom], largeurs)
+        return valeurs.index(valeur)
+
+    def ajouter(self, mission):
+        """Ajoute une mission (dictionnaire) : une case incrémentée par matrice"""
+        positions = {}
+        for dimension in self.valeurs:
+            if dimension in DIMENSIONS_DERIVEES:
+                colonne, _, valeur_mission = DIMENSIONS_DERIVEES[dimension]
+                positions[dimension] = self._position(dimension, valeur_mission(mission[colonne]))
+            else:
+                positions[dimension] = self._position(dimension, mission[dimension])
+        for nom, (ligne, colonne) in self.definitions.items():
+            self.comptes[nom][positions[ligne], positions[colonne]] += 1
+
+    def table(self, nom):
+        """Tableau croisé (équivalent de pd.crosstab), lignes et colonnes vides exclues"""
+        ligne, colonne = self.definitions[nom]
+        table = pd.DataFrame(self.comptes[nom], index=pd.Index(self.valeurs[ligne], name=ligne),
+                             columns=pd.Index(self.valeurs[colonne], name=colonne))
+        table = table.loc[table.sum(axis=1) > 0, table.sum(axis=0) > 0]
+        for axe, dimension in enumerate((ligne, colonne)):
+            if dimension in DIMENSIONS_DERIVEES:
+                table = table.sort_index(axis=axe)
+        return table
+
+    def repartition(self, dimension):
+        """Nombre de missions par valeur d'une dimension (équivalent de value_counts), lu dans une matrice"""
+        for nom, dimensions in self.definitions.items():
+            if dimension in dimensions:
+                comptes = self.comptes[nom].sum(axis=1 - dimensions.index(dimension))
+                return pd.Series(comptes, index=pd.Index(self.valeurs[dimension], name=dimension),
+                                 name='count').sort_values(ascending=False)
+        raise KeyError(f"Aucune matrice de contingence ne porte la dimension {dimension!r}")
+
+
+# Résolutions des cumuls temporels, de la plus fine à la plus grossière, et leur durée en mois
+RESOLUTIONS_CUMULS = ('jour', 'mois', 'trimestre', 'annee')
+MOIS_PAR_PERIODE = {'mois': 1, 'trimestre': 3, 'annee': 12}
+
+
+def periodes(jours, resolution):
+    """Ordinal (depuis 1970) de la période de chaque jour, lui-même compté depuis le 1er janvier 1970"""
+    if resolution == 'jour':
+        return jours
+    mois = np.asarray(jours).astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+    return mois // MOIS_PAR_PERIODE[resolution]
+
+
+def premiers_jours(ordinaux, resolution):
+    """Premier jour (ordinal depuis 1970) de chaque période"""
+    if resolution == 'jour':
+        return ordinaux
+    mois = np.asarray(ordinaux) * MOIS_PAR_PERIODE[resolution]
+    return mois.astype('datetime64[M]').astype('datetime64[D]').astype(np.int64)
+
+
+def libelles_periodes(ordinaux, resolution):
+    """Libellés des périodes : année entière, sinon date du premier jour"""
+    if resolution == 'annee':
+        return 1970 + np.asarray(ordinaux)
+    return pd.to_datetime(premiers_jours(ordinaux, resolution).astype('datetime64[D]'))
+
+
+class CumulsTemporels:
+    """Cumuls d'une table par jour, mois, trimestre et année, pour chaque combinaison de dimensions.
+
+    Un tableau NumPy par résolution (dimensions × périodes × mesures), le
+    nombre de lignes étant toujours la première mesure. Les lignes sont
+    ajoutées par lots (bincount) ou une à une, en incrémentant une case par
+    résolution. Une requête découpe sa période en années, trimestres, mois
+    et jours entiers et lit chaque morceau dans la résolution la plus
+    grossière qui le couvre exactement : un graphique sur vingt ans lit une
+    vingtaine d'années et quelques périodes en bordure, jamais les lignes.
+    """
+
+    def __init__(self, dimensions, mesures, colonne_date):
+        self.dimensions = {dimension: [] for dimension in dimensions}
+        self.mesures = ['lignes'] + list(mesures)
+        self.colonne_date = colonne_date
+        self.origines = {resolution: 0 for resolution in RESOLUTIONS_CUMULS}
+        self.cumuls = {resolution: np.zeros((0,) * (len(self.dimensions) + 1) + (len(self.mesures),), dtype=np.int64)
+                       for resolution in RESOLUTIONS_CUMULS}
+        # Lignes déjà intégrées d'une table suivie en ajout seul (flux direct)
+        self.lignes_suivies = 0
+        self.verrou = threading.RLock()
+
+    @classmethod
+    def depuis_table(cls, table, dimensions, mesures, colonne_date):
+        cumuls = cls(dimensions, mesures, colonne_date)
+        cumuls.ajouter_lot(table)
+        return cumuls
+
+    # Écritures
+
+    def _etendre(self, resolution, premier, dernier):
+        """Étend l'axe des périodes d'une résolution pour couvrir [premier, dernier]"""
+        tableau, origine = self.cumuls[resolution], self.origines[resolution]
+        nombre = tableau.shape[-2]
+        if nombre == 0:
+            origine = self.origines[resolution] = premier
+        avant, apres = max(origine - premier, 0), max(dernier - (origine + nombre - 1), 0) if nombre else dernier - premier + 1
+        if avant or apres:
+            largeurs = [(0, 0)] * tableau.ndim
+            largeurs[-2] = (avant, apres)
+            self.cumuls[resolution] = np.pad(tableau, largeurs)
+            self.origines[resolution] = origine - avant
+
+    def _positions(self, dimension, valeurs):
+        """Position de chaque valeur sur l'axe d'une dimension, en ajoutant les nouvelles valeurs"""
+        connues = self.dimensions[dimension]
+        nouvelles = [valeur for valeur in valeurs if valeur not in connues]
+        if nouvelles:
+            connues.extend(nouvelles)
+            axe = list(self.dimensions).index(dimension)
+            for resolution, tableau in self.cumuls.items():
+                largeurs = [(0, 0)] * tableau.ndim
+                largeurs[axe] = (0, len(nouvelles))
+                self.cumuls[resolution] = np.pad(tableau, largeurs)
+        return np.array([connues.index(valeur) for valeur in valeurs], dtype=np.int64)
+
+    def _codes(self, colonne):
+        """Positions des valeurs d'une colonne (-1 pour les valeurs manquantes)"""
+        if isinstance(colonne.dtype, pd.CategoricalDtype):
+            codes, valeurs = colonne.cat.codes.to_numpy(), colonne.cat.categories
+        else:
+            codes, valeurs = pd.factorize(colonne)
+        correspondance = np.append(self._positions(colonne.name, list(valeurs)), -1)
+        return correspondance[codes]
+
+    def ajouter_lot(self, table):
+        """Ajoute les lignes d'une table : une passe bincount par résolution"""
+        if not len(table):
+            return
+        with self.verrou:
+            codes = [self._codes(table[dimension]) for dimension in self.dimensions]
+            jours = table[self.colonne_date].to_numpy().astype('datetime64[D]').astype(np.int64)
+            valides = np.logical_and.reduce([code >= 0 for code in codes]) & ~pd.isna(table[self.colonne_date]).to_numpy()
+            codes, jours = [code[valides] for code in codes], jours[valides]
+            if not len(jours):
+                return
+            poids = [None] + [table[mesure].to_numpy()[valides].astype(np.float64) for mesure in self.mesures[1:]]
+            for resolution in RESOLUTIONS_CUMULS:
+                ordinaux = periodes(jours, resolution)
+                self._etendre(resolution, int(ordinaux.min()), int(ordinaux.max()))
+                tableau = self.cumuls[resolution]
+                forme = tableau.shape[:-1]
+                index = np.ravel_multi_index(codes + [ordinaux - self.origines[resolution]], forme)
+                for position, ponderation in enumerate(poids):
+                    sommes = np.bincount(index, weights=ponderation, minlength=int(np.prod(forme)))
+                    tableau[..., position] += np.rint(sommes).astype(np.int64).reshape(forme)
+
+    def ajouter(self, ligne):
+        """Ajoute une ligne (dictionnaire) : une case incrémentée par résolution"""
+        with self.verrou:
+            positions = [int(self._positions(dimension, [ligne[dimension]])[0]) for dimension in self.dimensions]
+            jour = int(np.datetime64(pd.Timestamp(ligne[self.colonne_date]), 'D').astype(np.int64))
+            valeurs = np.array([1] + [ligne[mesure] for mesure in self.mesures[1:]], dtype=np.int64)
+            for resolution in RESOLUTIONS_CUMULS:
+                ordinal = int(periodes(jour, resolution))
+                self._etendre(resolution, ordinal, ordinal)
+                self.cumuls[resolution][tuple(positions) + (ordinal - self.origines[resolution],)] += valeurs
+
+    def suivre(self, table):
+        """Intègre les lignes d'une table en ajout seul arrivées depuis le dernier appel"""
+        with self.verrou:
+            if len(table) > self.lignes_suivies:
+                self.ajouter_lot(table.iloc[self.lignes_suivies:])
+                self.lignes_suivies = len(table)
+
+    # Lectures
+
+    def _decouper(self, premier, dernier, resolutions):
+        """Découpe les jours [premier, dernier] en périodes entières, des plus grossières aux plus fines"""
+        if premier > dernier:
+            return []
+        resolution = resolutions[0]
+        if resolution == 'jour':
+            return [('jour', premier, dernier)]
+        debut = int(periodes(premier, resolution))
+        if premiers_jours(debut, resolution) < premier:
+            debut += 1
+        fin = int(periodes(dernier, resolution))
+        if premiers_jours(fin + 1, resolution) - 1 > dernier:
+            fin -= 1
+        if debut > fin:
+            return self._decouper(premier, dernier, resolutions[1:])
+        return (self._decouper(premier, int(premiers_jours(debut, resolution)) - 1, resolutions[1:])
+                + [(resolution, debut, fin)]
+                + self._decouper(int(premiers_jours(fin + 1, resolution)), dernier, resolutions[1:]))
+
+    def _agreger(self, resolution, par=None, filtres=None):
+        """Tableau (périodes de la résolution × [valeurs de `par`] × mesures) et ordinal de la première période"""
+        filtres = filtres or {}
+        selections = []
+        for dimension, valeurs in self.dimensions.items():
+            cle = IndexMissions.COLONNES.get(dimension, dimension)
+            retenues = filtres.get(cle)
+            selections.append(None if retenues is None else np.isin(valeurs, list(retenues)))
+        inconnus = set(filtres) - {IndexMissions.COLONNES.get(dimension, dimension) for dimension in self.dimensions}
+        if inconnus - {'debut', 'fin'}:
+            raise ValueError(f"Filtres sans dimension dans les cumuls : {sorted(inconnus - {'debut', 'fin'})}")
+
+        with self.verrou:
+            jours = self.cumuls['jour']
+            premier, dernier = self.origines['jour'], self.origines['jour'] + jours.shape[-2] - 1
+            if filtres.get('debut') is not None:
+                premier = max(premier, int(np.datetime64(pd.Timestamp(filtres['debut']), 'D').astype(np.int64)))
+            if filtres.get('fin') is not None:
+                dernier = min(dernier, int(np.datetime64(pd.Timestamp(filtres['fin']), 'D').astype(np.int64)))
+            origine = int(periodes(premier, resolution))
+            largeur = [len(self.dimensions[par])] if par is not None else []
+            resultat = np.zeros([max(int(periodes(dernier, resolution)) - origine + 1, 0)] + largeur
+                                + [len(self.mesures)], dtype=np.int64)
+            resolutions = RESOLUTIONS_CUMULS[:RESOLUTIONS_CUMULS.index(resolution) + 1][::-1]
+            for niveau, debut, fin in self._decouper(premier, dernier, resolutions):
+                debut_local = debut - self.origines[niveau]
+                morceau = self.cumuls[niveau][..., debut_local:fin - self.origines[niveau] + 1, :]
+                for axe, (dimension, selection) in enumerate(zip(self.dimensions, selections)):
+                    if selection is not None and dimension != par:
+                        morceau = morceau.compress(selection, axis=axe)
+                axes = tuple(axe for axe, dimension in enumerate(self.dimensions) if dimension != par)
+                morceau = np.moveaxis(morceau.sum(axis=axes), -2, 0)
+                ordinaux = periodes(premiers_jours(np.arange(debut, fin + 1), niveau), resolution) - origine
+                np.add.at(resultat, ordinaux, morceau)
+        if par is not None and selections[list(self.dimensions).index(par)] is not None:
+            resultat[:, ~selections[list(self.dimensions).index(par)]] = 0
+        return resultat, origine
+
+    def requete(self, resolution, par=None, filtres=None):
+        """Table des cumuls par période (et par valeur de `par`), périodes sans ligne exclues.
+
+        `filtres` utilise les clés du moteur de filtres (lanceurs, clients,
+        statuts, debut, fin) ; les dates sont prises au jour près. La colonne
+        de la période porte le nom de la colonne de date de la table.
+        """
+        resultat, origine = self._agreger(resolution, par, filtres)
+        if par is None:
+            periodes_retenues = np.nonzero(resultat[:, 0] > 0)[0]
+            colonnes = {self.colonne_date: libelles_periodes(origine + periodes_retenues, resolution)}
+            valeurs = resultat[periodes_retenues]
+        else:
+            periodes_retenues, positions = np.nonzero(resultat[:, :, 0] > 0)
+            colonnes = {self.colonne_date: libelles_periodes(origine + periodes_retenues, resolution),
+                        par: np.asarray(self.dimensions[par], dtype=object)[positions]}
+            valeurs = resultat[periodes_retenues, positions]
+        colonnes.update({mesure: valeurs[:, position] for position, mesure in enumerate(self.mesures)})
+        return pd.DataFrame(colonnes)
+
+    def somme(self, mesure, filtres=None):
+        """Total d'une mesure sur les filtres"""
+        resultat, _ = self._agreger('annee', filtres=filtres)
+        return int(resultat[:, self.mesures.index(mesure)].sum())
+
+
+class CumulsComposes:
+    """Cumuls partagés complétés par les cumuls des seuls ajouts d'une session.
+
+    Les cumuls partagés ne sont jamais recopiés : chaque requête est faite
+    sur les deux, puis les lignes d'une même période (et valeur de `par`)
+    sont additionnées, dans l'ordre des cumuls partagés.
+    """
+
+    def __init__(self, partages, ajouts):
+        self.partages = partages
+        self.ajouts = ajouts
+
+    def requete(self, resolution, par=None, filtres=None):
+        tables = [cumuls.requete(resolution, par, filtres) for cumuls in (self.partages, self.ajouts)]
+        if not len(tables[1]):
+            return tables[0]
+        date = self.partages.colonne_date
+        cles = [date] + ([par] if par is not None else [])
+        table = pd.concat(tables, ignore_index=True).groupby(cles, sort=False).sum().reset_index()
+        return table.sort_values(date, kind='stable', ignore_index=True)
+
+    def somme(self, mesure, filtres=None):
+        return self.partages.somme(mesure, filtres) + self.ajouts.somme(mesure, filtres)
+
+
+# Projections : scénarios simulés, dernière année projetée et quantiles des bandes
+SCENARIOS_PROJECTION = int(os.environ.get('CSG_SCENARIOS_PROJECTION', 10_000))
+ANNEE_FIN_PROJECTION = 2030
+QUANTILES_PROJECTION = {'p5': 5, 'p50': 50, 'p95': 95}
+# Dispersion (en log) retenue quand l'historique est trop court pour l'estimer
+DISPERSION_PROJECTION = 0.1
+
+
+def projeter_lancements(annees, lancements, annee_fin=ANNEE_FIN_PROJECTION, scenarios=SCENARIOS_PROJECTION, graine=0):
+    """Bandes de projection des lancements annuels (p5, p50, p95) par simulation de Monte Carlo.
+
+    La tendance est ajustée en log-linéaire sur l'historique. Chaque scénario
+    tire sa croissance autour de la pente ajustée (selon l'incertitude de
+    celle-ci) puis un écart annuel à sa tendance (selon la dispersion des
+    résidus) : tous les scénarios sont calculés en une opération sur un
+    tableau scénarios × années. La première ligne, à la dernière année
+    historique, porte la valeur ajustée et raccorde les bandes à l'historique.
+    """
+    annees = np.asarray(annees, dtype=np.int64)
+    lancements = np.asarray(lancements, dtype=np.float64)
+    retenues = lancements > 0
+    annees, logs = annees[retenues], np.log(lancements[retenues])
+    if not len(annees):
+        return pd.DataFrame(columns=['annee', *QUANTILES_PROJECTION])
+
+    derniere = int(annees.max())
+    if len(annees) > 2:
+        pente, ordonnee = np.polyfit(annees - derniere, logs, 1)
+        residus = logs - (ordonnee + pente * (annees - derniere))
+        dispersion = max(np.sqrt((residus ** 2).sum() / (len(annees) - 2)), 1e-6)
+        incertitude_pente = dispersion / np.sqrt(((annees - annees.mean()) ** 2).sum())
+    else:
+        pente, ordonnee = 0.0, logs.mean()
+        dispersion, incertitude_pente = DISPERSION_PROJECTION, DISPERSION_PROJECTION
+
+    horizon = np.arange(1, max(annee_fin - derniere, 0) + 1)
+    generateur = np.random.default_rng(graine)
+    croissances = generateur.normal(pente, incertitude_pente, (scenarios, 1))
+    ecarts = generateur.normal(0.0, dispersion, (scenarios, len(horizon)))
+    trajectoires = np.exp(ordonnee + croissances * horizon + ecarts)
+    bandes = np.percentile(trajectoires, list(QUANTILES_PROJECTION.values()), axis=0)
+
+    projection = pd.DataFrame({'annee': np.append(derniere, derniere + horizon)})
+    for position, nom in enumerate(QUANTILES_PROJECTION):
+        projection[nom] = np.append(np.exp(ordonnee), bandes[position])
+    return projection
+
+
+class TamponMissions:
+    """Tampon d'ajout de missions, stocké en colonnes.
+
+    Chaque colonne est un tableau NumPy préalloué dont la capacité double
+    quand il est plein, ce qui amortit la croissance. La vue DataFrame
+    est faite de tranches de ces tableaux, sans copie des lignes : un ajout
+    suivi d'une vue coûte O(1) amorti, quel que soit le nombre de missions.
+    Une réallocation laisse les vues existantes sur les anciens tableaux.
+    """
+
+    def __init__(self, schema, capacite_initiale=64):
+        self.schema = schema
+        self.capacite_initiale = capacite_initiale
+        # Les colonnes catégorielles sont stockées sous forme de codes
+        self.categories = {colonne: list(dtype.categories) for colonne, dtype in schema.items()
+                           if isinstance(dtype, pd.CategoricalDtype)}
+        self._codes = {colonne: {valeur: code for code, valeur in enumerate(valeurs)}
+                       for colonne, valeurs in self.categories.items()}
+        # Types catégoriels des vues, reconstruits seulement quand une catégorie est ajoutée
+        self._dtypes = {}
+        self.colonnes = {colonne: np.empty(0, dtype=self._type_stockage(colonne)) for colonne in schema}
+        self.capacite = 0
+        self.taille = 0
+        self._vue = None
+
+    def __len__(self):
+        return self.taille
+
+    def _type_stockage(self, colonne):
+        dtype = self.schema[colonne]
+        if isinstance(dtype, pd.CategoricalDtype):
+            # Codes au type que pandas retient pour ce nombre de catégories : la vue n'a pas à les convertir
+            nombre = len(self.categories[colonne])
+            return np.int8 if nombre < 127 else np.int16 if nombre < 32767 else np.int32
+        return dtype
+
+    def _reserver(self, n):
+        """Garantit la place de n lignes supplémentaires (capacité au moins doublée à chaque réallocation)"""
+        if self.taille + n <= self.capacite:
+            return
+        capacite = max(self.capacite_initiale, 2 * self.capacite, self.taille + n)
+        for colonne, tableau in self.colonnes.items():
+            agrandi = np.empty(capacite, dtype=tableau.dtype)
+            agrandi[:self.taille] = tableau[:self.taille]
+            self.colonnes[colonne] = agrandi
+        self.capacite = capacite
+
+    def _code(self, colonne, valeur):
+        """Code d'une valeur catégorielle (ajoutée aux catégories si nouvelle)"""
+        codes = self._codes[colonne]
+        code = codes.get(valeur)
+        if code is None:
+            code = codes[valeur] = len(self.categories[colonne])
+            self.categories[colonne].append(valeur)
+            self._dtypes.pop(colonne, None)
+            if self._type_stockage(colonne) != self.colonnes[colonne].dtype:
+                self.colonnes[colonne] = self.colonnes[colonne].astype(self._type_stockage(colonne))
+        return code
+
+    def ajouter(self, mission):
+        """Ajoute une mission (dictionnaire colonne → valeur)"""
+        self._reserver(1)
+        for colonne in self.schema:
+            valeur = mission[colonne]
+            if colonne in self._codes:
+                valeur = self._code(colonne, valeur)
+            elif colonne == 'date_lancement':
+                valeur = np.datetime64(pd.Timestamp(valeur), 'ns')
+            self.colonnes[colonne][self.taille] = valeur
+        self.taille += 1
+        self._vue = None
+
+    def ajouter_lot(self, missions):
+        """Ajoute un lot de missions (DataFrame) en quelques copies de tableaux"""
+        n = len(missions)
+        if n == 0:
+            return
+        self._reserver(n)
+        for colonne in self.schema:
+            valeurs = missions[colonne]
+            if colonne in self._codes:
+                valeurs = pd.Index(self.categories[colonne]).get_indexer(valeurs)
+                if (valeurs < 0).any():
+                    valeurs = np.array([self._code(colonne, valeur) for valeur in missions[colonne]])
+            self.colonnes[colonne][self.taille:self.taille + n] = \
+                np.asarray(valeurs).astype(self._type_stockage(colonne), copy=False)
+        self.taille += n
+        self._vue = None
+
+    def modifier(self, position, colonne, valeur):
+        """Remplace une valeur de la mission ajoutée à cette position"""
+        if not 0 <= position < self.taille:
+            raise IndexError(position)
+        self.colonnes[colonne][position] = self._code(colonne, valeur) if colonne in self._codes else valeur
+        self._vue = None
+
+    def vue(self):
+        """Vue DataFrame des missions ajoutées (tranches des tableaux, sans copie des lignes)"""
+        if self._vue is None:
+            colonnes = {}
+            for colonne in self.schema:
+                valeurs = self.colonnes[colonne][:self.taille]
+                if colonne in self._codes:
+                    if colonne not in self._dtypes:
+                        self._dtypes[colonne] = pd.CategoricalDtype(self.categories[colonne])
+                    colonnes[colonne] = pd.Categorical.from_codes(valeurs, dtype=self._dtypes[colonne],
+                                                                  validate=False)
+                else:
+                    colonnes[colonne] = valeurs
+            self._vue = pd.DataFrame(colonnes, copy=False)
+        return self._vue
+
+
+class IndexMissions:
+    """Moteur de filtres : index inversés (catégorie → positions) et index trié des dates.
+
+    Une combinaison de filtres est résolue en partant de l'ensemble candidat
+    le plus petit (liste de positions d'une catégorie, ou plage de l'index
+    des dates trouvée par recherche dichotomique), puis en le réduisant par
+    les autres contraintes : le coût dépend de la taille de la sélection,
+    pas de celle de l'historique.
+    """
+
+    # Colonne indexée → clé du filtre correspondant
+    COLONNES = {'lanceur': 'lanceurs', 'statut': 'statuts', 'client': 'clients'}
+
+    def __init__(self, missions, tableaux=None):
+        """`tableaux` (voir `tableaux()`) évite de retrier les colonnes, par exemple depuis un instantané"""
+        self.taille = len(missions)
+        self.codes = {}
+        self.categories = {}
+        self.positions = {}
+        self.ordres = {}
+        self.bornes = {}
+        for colonne in self.COLONNES:
+            serie = missions[colonne]
+            codes = serie.cat.codes.to_numpy()
+            if tableaux is None:
+                ordre = np.argsort(codes, kind='stable')
+                bornes = np.searchsorted(codes[ordre], np.arange(len(serie.cat.categories) + 1))
+            else:
+                ordre, bornes = tableaux[f'ordre_{colonne}'], tableaux[f'bornes_{colonne}']
+            self.codes[colonne] = codes
+            self.categories[colonne] = serie.cat.categories
+            self.ordres[colonne] = ordre
+            self.bornes[colonne] = bornes
+            self.positions[colonne] = [ordre[bornes[i]:bornes[i + 1]] for i in range(len(serie.cat.categories))]
+
+        self.dates = missions['date_lancement'].to_numpy()
+        if tableaux is None:
+            self.ordre_dates = np.argsort(self.dates, kind='stable')
+            self.dates_triees = self.dates[self.ordre_dates]
+        else:
+            self.ordre_dates, self.dates_triees = tableaux['ordre_dates'], tableaux['dates_triees']
+
+    def tableaux(self):
+        """Tableaux triés de l'index, à enregistrer avec les missions"""
+        tableaux = {'ordre_dates': self.ordre_dates, 'dates_triees': self.dates_triees}
+        for colonne in self.COLONNES:
+            tableaux[f'ordre_{colonne}'] = self.ordres[colonne]
+            tableaux[f'bornes_{colonne}'] = self.bornes[colonne]
+        return tableaux
+
+    def _contraintes(self, filtres):
+        """Contraintes actives : (positions candidates, test vectorisé sur des positions)"""
+        contraintes = []
+        for colonne, cle in self.COLONNES.items():
+            valeurs = filtres.get(cle)
+            if valeurs is None:
+                continue
+            voulus = self.categories[colonne].get_indexer(list(valeurs))
+            voulus = np.unique(voulus[voulus >= 0])
+            if len(voulus) == len(self.categories[colonne]):
+                continue
+            candidates = np.concatenate([self.positions[colonne][code] for code in voulus] + [np.empty(0, np.intp)])
+            contraintes.append((candidates, lambda positions, codes=self.codes[colonne], voulus=voulus:
+                                np.isin(codes[positions], voulus)))
+
+        debut, fin = filtres.get('debut'), filtres.get('fin')
+        i = 0 if debut is None else np.searchsorted(self.dates_triees, np.datetime64(debut, 'ns'), side='left')
+        j = self.taille if fin is None else np.searchsorted(self.dates_triees, np.datetime64(fin, 'ns'), side='right')
+        if i > 0 or j < self.taille:
+            premiere, derniere = (self.dates_triees[i], self.dates_triees[j - 1]) if j > i else (None, None)
+            contraintes.append((self.ordre_dates[i:j], lambda positions:
+                                (self.dates[positions] >= premiere) & (self.dates[positions] <= derniere)))
+        return contraintes
+
+    def selectionner(self, filtres):
+        """Positions (croissantes) des missions retenues, None si aucun filtre n'est actif"""
+        contraintes = self._contraintes(filtres)
+        if not contraintes:
+            return None
+        contraintes.sort(key=lambda contrainte: len(contrainte[0]))
+        positions = contraintes[0][0]
+        for _, test in contraintes[1:]:
+            if len(positions) == 0:
+                break
+            positions = positions[test(positions)]
+        return np.sort(positions)
+
+
+def masque_missions(missions, filtres, colonne_date='date_lancement'):
+    """Masque booléen des filtres sur une petite table (missions ajoutées en direct, trafic).
+
+    Les filtres portant sur une colonne absente de la table sont ignorés.
+    """
+    masque = np.ones(len(missions), dtype=bool)
+    for colonne, cle in IndexMissions.COLONNES.items():
+        if filtres.get(cle) is not None and colonne in missions:
+            masque &= missions[colonne].isin(list(filtres[cle])).to_numpy()
+    if filtres.get('debut') is not None:
+        masque &= (missions[colonne_date] >= filtres['debut']).to_numpy()
+    if filtres.get('fin') is not None:
+        masque &= (missions[colonne_date] <= filtres['fin']).to_numpy()
+    return masque
+
+
+# Périodes comparées par défaut (référence, comparée) : avant et pendant la pandémie de COVID-19
+PERIODES_COMPAREES = ((pd.Timestamp(2018, 1, 1), pd.Timestamp(2019, 12, 31)),
+                      (pd.Timestamp(2020, 1, 1), pd.Timestamp(2021, 12, 31)))
+
+
+def variation(reference, valeur):
+    """Variation relative en % (None si la référence est nulle ou absente)"""
+    if reference is None or valeur is None or reference == 0:
+        return None
+    return (valeur - reference) / reference * 100
+
+
+class ComparateurPeriodes:
+    """Mesures de missions sur des fenêtres de dates quelconques, par sommes préfixes.
+
+    Les missions sont triées par lanceur puis par date, et les sommes
+    cumulées de chaque mesure sont calculées une fois : le total d'une
+    fenêtre est la différence de deux sommes cumulées, trouvées par
+    recherche dichotomique dans les dates de chaque lanceur (O(lanceurs ×
+    log n) par fenêtre, quelle que soit sa longueur).
+
+    Un comparateur peut compléter un comparateur `partage` (missions de
+    référence, commun aux sessions) : ses propres missions ne sont alors que
+    les ajouts, et les totaux des deux sont additionnés.
+    """
+
+    MESURES = ('lancements', 'masse_charge_utile', 'succes')
+
+    def __init__(self, missions, partage=None):
+        codes = missions['lanceur'].cat.codes.to_numpy()
+        dates = missions['date_lancement'].to_numpy().astype('datetime64[ns]')
+        ordre = np.lexsort((dates, codes))
+        propres = list(missions['lanceur'].cat.categories)
+        self.partage = partage
+        self.lanceurs = propres if partage is None else (
+            list(partage.lanceurs) + [lanceur for lanceur in propres if lanceur not in partage.lanceurs])
+        # Ligne des totaux de chaque lanceur des missions propres
+        self._lignes = [self.lanceurs.index(lanceur) for lanceur in propres]
+        self.dates = dates[ordre]
+        valeurs = np.column_stack([
+            np.ones(len(ordre), dtype=np.int64),
+            missions['masse_charge_utile'].to_numpy().astype(np.int64)[ordre],
+            (missions['statut'] == 'Succès').to_numpy()[ordre]
+        ]).astype(np.int64)
+        self.cumuls = np.vstack([np.zeros((1, len(self.MESURES)), dtype=np.int64), np.cumsum(valeurs, axis=0)])
+        # Positions de début de chaque lanceur dans l'ordre (lanceur, date) ; codes -1 (absents) exclus
+        self.bornes = np.searchsorted(codes[ordre], np.arange(len(propres) + 1))
+
+    def fenetre(self, debut, fin):
+        """Totaux (lanceurs × mesures) des missions du jour `debut` au jour `fin` inclus (nuls si `fin` précède `debut`)"""
+        limites = np.array([pd.Timestamp(debut).normalize(), pd.Timestamp(fin).normalize() + pd.Timedelta(days=1)],
+                           dtype='datetime64[ns]')
+        totaux = np.zeros((len(self.lanceurs), len(self.MESURES)), dtype=np.int64)
+        if self.partage is not None:
+            totaux[:len(self.partage.lanceurs)] = self.partage.fenetre(debut, fin)
+        for position, ligne in enumerate(self._lignes):
+            premier, dernier = self.bornes[position], self.bornes[position + 1]
+            i, j = premier + np.searchsorted(self.dates[premier:dernier], limites)
+            totaux[ligne] += self.cumuls[max(i, j)] - self.cumuls[i]
+        return totaux
+
+    @staticmethod
+    def indicateurs(totaux):
+        """Lancements, masse, succès et taux de réussite (None sans lancement) de totaux par lanceur"""
+        lancements, masse, succes = (int(total) for total in totaux.sum(axis=0))
+        return {'lancements': lancements, 'masse_charge_utile': masse, 'succes': succes,
+                'taux_reussite': succes / lancements * 100 if lancements else None}
+
+    def comparer(self, reference, comparee):
+        """Indicateurs des deux fenêtres (couples début, fin) et détail par lanceur"""
+        totaux_reference, totaux_comparee = self.fenetre(*reference), self.fenetre(*comparee)
+        detail = pd.DataFrame({
+            'lanceur': self.lanceurs,
+            'lancements_reference': totaux_reference[:, 0],
+            'lancements_comparee': totaux_comparee[:, 0],
+            'masse_reference': totaux_reference[:, 1],
+            'masse_comparee': totaux_comparee[:, 1],
+        })
+        detail['variation_lancements'] = [variation(int(a), int(b)) for a, b in
+                                          zip(totaux_reference[:, 0], totaux_comparee[:, 0])]
+        detail = detail[(detail['lancements_reference'] > 0) | (detail['lancements_comparee'] > 0)]
+        return self.indicateurs(totaux_reference), self.indicateurs(totaux_comparee), detail
+
+
+def premiers_rangs(cles, nombre):
+    """Masque des `nombre` plus petites clés (à égalité, les premières positions), en temps linéaire"""
+    masque = np.zeros(len(cles), dtype=bool)
+    if nombre >= len(cles):
+        masque[:] = True
+    elif nombre > 0:
+        seuil = np.partition(cles, nombre - 1)[nombre - 1]
+        masque = cles < seuil
+        masque[np.flatnonzero(cles == seuil)[:nombre - masque.sum()]] = True
+    return masque
+
+
+def decoder_categories(table):
+    """Petite table dont les colonnes catégorielles sont décodées en objets, sans parcourir leurs catégories"""
+    colonnes = {}
+    for colonne, dtype in table.dtypes.items():
+        colonnes[colonne] = table[colonne]
+        if isinstance(dtype, pd.CategoricalDtype):
+            codes = table[colonne].cat.codes.to_numpy()
+            valeurs = np.full(len(codes), None, dtype=object)
+            valeurs[codes >= 0] = dtype.categories.take(codes[codes >= 0])
+            colonnes[colonne] = valeurs
+    return pd.DataFrame(colonnes, index=table.index)
+
+
+class SelectionMissions:
+    """Missions retenues par un jeu de filtres, avec leurs agrégats calculés à la demande.
+
+    Les missions de référence (partagées par les sessions) et les ajouts
+    (flux direct, missions de la session) restent deux tables distinctes :
+    une sélection ne recopie jamais l'historique. Les agrégats sont
+    construits sur les seules colonnes utiles des deux tables, et le
+    comparateur de périodes complète celui, partagé, de la référence.
+    """
+
+    def __init__(self, reference, ajouts=None, cube=None, matrices=None, comparateur_reference=None):
+        self.reference = reference
+        self.ajouts = ajouts if ajouts is not None and len(ajouts) else None
+        self._cube = cube
+        self._matrices = matrices
+        self._comparateur_reference = comparateur_reference
+        self._comparateur = None
+
+    def __len__(self):
+        return len(self.reference) + (len(self.ajouts) if self.ajouts is not None else 0)
+
+    def colonnes(self, colonnes):
+        """Colonnes de la référence et des ajouts, concaténées (table temporaire pour un agrégat)"""
+        if self.ajouts is None:
+            return self.reference[colonnes]
+        return concatener_missions([self.reference[colonnes], self.ajouts[colonnes]])
+
+    @property
+    def missions(self):
+        """Table complète ; avec des ajouts, c'est une copie de la référence à réserver aux petites tables"""
+        return self.reference if self.ajouts is None else self.colonnes(list(self.reference.columns))
+
+    def page(self, numero, taille):
+        """Missions de la page `numero` (à partir de 1), de la plus récente à la plus ancienne.
+
+        Les pages précédentes et la page demandée sont isolées par partition
+        (linéaire) ; seules les `taille` missions de la page sont triées. À
+        date égale, l'ordre des lignes départage : les pages restent disjointes.
+        """
+        tables = [table for table in (self.reference, self.ajouts) if table is not None]
+        dates = np.concatenate([table['date_lancement'].to_numpy().astype('datetime64[ns]') for table in tables])
+        # Clé croissante de la plus récente à la plus ancienne, dates manquantes en dernier
+        cles = np.where(np.isnat(dates), np.iinfo(np.int64).max, -dates.astype(np.int64))
+        positions = np.flatnonzero(premiers_rangs(cles, numero * taille) & ~premiers_rangs(cles, (numero - 1) * taille))
+        positions = positions[np.argsort(cles[positions], kind='stable')]
+
+        if len(tables) == 1:
+            return self.reference.take(positions)
+        dans_reference = positions < len(self.reference)
+        # Quelques lignes : les colonnes catégorielles sont décodées plutôt que d'unir des catégories
+        # aussi nombreuses que les missions (identifiants)
+        page = pd.concat([decoder_categories(self.reference.take(positions[dans_reference])),
+                          decoder_categories(self.ajouts.take(positions[~dans_reference] - len(self.reference)))],
+                         ignore_index=True)
+        # Les deux morceaux sont dans l'ordre de la page : on les entrelace
+        ordre = np.empty(len(positions), dtype=np.int64)
+        ordre[dans_reference] = np.arange(dans_reference.sum())
+        ordre[~dans_reference] = dans_reference.sum() + np.arange((~dans_reference).sum())
+        return page.take(ordre)
+
+    @property
+    def cube(self):
+        if self._cube is None:
+            self._cube = CubeMissions.depuis_missions(self.colonnes(COLONNES_CUBE))
+        return self._cube
+
+    @property
+    def matrices(self):
+        if self._matrices is None:
+            self._matrices = MatricesContingence.depuis_missions(self.colonnes(COLONNES_MATRICES))
+        return self._matrices
+
+    @property
+    def comparateur(self):
+        if self._comparateur is None:
+            if self._comparateur_reference is not None:
+                partage = self._comparateur_reference()
+            else:
+                partage = ComparateurPeriodes(self.reference[COLONNES_COMPARATEUR])
+            self._comparateur = (partage if self.ajouts is None
+                                 else ComparateurPeriodes(self.ajouts[COLONNES_COMPARATEUR], partage))
+        return self._comparateur
+
+
+# Adresse du stockage persistant ("sqlite:chemin.db", "parquet:dossier" ou "instantane:dossier"),
+# vide = données simulées en mémoire
+ADRESSE_STOCKAGE = os.environ.get('CSG_STOCKAGE', '')
+
+# Colonne de date de chaque table, utilisée pour les filtres de période
+COLONNES_DATE = {'missions': 'date_lancement', 'trafic': 'date'}
+
+# Colonnes nécessaires au cube d'agrégats (projection au chargement)
+COLONNES_CUBE = ['lanceur', 'statut', 'date_lancement']
+
+# Colonnes nécessaires au comparateur de périodes
+COLONNES_COMPARATEUR = ['lanceur', 'statut', 'date_lancement', 'masse_charge_utile']
+
+# Colonnes nécessaires aux matrices de contingence (dimensions et colonnes sources des dimensions dérivées)
+COLONNES_MATRICES = sorted({DIMENSIONS_DERIVEES[dimension][0] if dimension in DIMENSIONS_DERIVEES else dimension
+                            for dimensions in MATRICES_CONTINGENCE.values() for dimension in dimensions})
+
+# Cumuls temporels de chaque table : dimensions et mesures additionnées
+DEFINITION_CUMULS = {
+    'missions': (['lanceur', 'client'], ['masse_charge_utile']),
+    'trafic': (['lanceur'], ['lancements', 'satellites_lances', 'masse_totale'])
+}
+
+
+class StockageDonnees:
+    """Interface des stockages de tables (missions, trafic, clients).
+
+    `charger` applique la projection (colonnes) et les filtres de la sidebar
+    (lanceurs, statuts, clients, debut, fin) au plus près des données ; les
+    stockages sur disque lisent par lots, typés un à un au schéma compact,
+    sans jamais matérialiser l'historique complet en chaînes Python.
+    """
+
+    taille_lot = 100_000
+
+    def __init__(self, lanceurs):
+        self.lanceurs = lanceurs
+
+    def tables(self):
+        """Noms des tables présentes"""
+        raise NotImplementedError
+
+    def ecrire(self, table, donnees):
+        """Remplace le contenu d'une table"""
+        raise NotImplementedError
+
+    def lots(self, table, colonnes, filtres):
+        """Itère sur les lots (DataFrames bruts) retenus par la projection et les filtres"""
+        raise NotImplementedError
+
+    def bornes(self, table):
+        """Première et dernière date de la table"""
+        dates = self.charger(table, [COLONNES_DATE[table]])[COLONNES_DATE[table]]
+        return (dates.min(), dates.max()) if len(dates) else (None, None)
+
+    def typer(self, table, lot):
+        """Convertit un lot lu sur disque au schéma de la table"""
+        colonne_date = COLONNES_DATE.get(table)
+        if colonne_date in lot:
+            lot[colonne_date] = pd.to_datetime(lot[colonne_date])
+        if table == 'missions':
+            lot = typer_missions(lot, self.lanceurs)
+            if 'masse_charge_utile' in lot:
+                lot['masse_charge_utile'] = lot['masse_charge_utile'].astype('int32')
+        return lot
+
+    def charger(self, table, colonnes=None, filtres=None):
+        """Table restreinte aux colonnes et aux lignes demandées"""
+        lots = [self.typer(table, lot) for lot in self.lots(table, colonnes, filtres or {}) if len(lot)]
+        if not lots:
+            return self.vide(table, colonnes)
+        if len(lots) == 1:
+            return lots[0].reset_index(drop=True)
+        return concatener_missions(lots) if table == 'missions' else pd.concat(lots, ignore_index=True)
+
+    def vide(self, table, colonnes=None):
+        """Table sans ligne (aux types du schéma pour les missions)"""
+        if table == 'missions':
+            schema = schema_missions(self.lanceurs)
+            return pd.DataFrame({colonne: pd.Series(dtype=schema[colonne]) for colonne in colonnes or schema})
+        return pd.DataFrame(columns=colonnes or [])
+
+    @staticmethod
+    def contraintes(table, filtres):
+        """Filtres applicables à une table : [(colonne, 'in' | '>=' | '<=', valeur)]"""
+        contraintes = []
+        if table not in COLONNES_DATE:
+            return contraintes
+        for colonne, cle in IndexMissions.COLONNES.items():
+            if filtres.get(cle) is not None and (table == 'missions' or colonne == 'lanceur'):
+                contraintes.append((colonne, 'in', [str(valeur) for valeur in filtres[cle]]))
+        if filtres.get('debut') is not None:
+            contraintes.append((COLONNES_DATE[table], '>=', pd.Timestamp(filtres['debut'])))
+        if filtres.get('fin') is not None:
+            contraintes.append((COLONNES_DATE[table], '<=', pd.Timestamp(filtres['fin'])))
+        return contraintes
+
+
+class StockageMemoire(StockageDonnees):
+    """Tables gardées en mémoire ; les missions sont filtrées par IndexMissions"""
+
+    def __init__(self, lanceurs, tables):
+        super().__init__(lanceurs)
+        self.donnees = dict(tables)
+        self.index = IndexMissions(self.donnees['missions'])
+
+    def tables(self):
+        return list(self.donnees)
+
+    def ecrire(self, table, donnees):
+        self.donnees[table] = donnees
+        if table == 'missions':
+            self.index = IndexMissions(donnees)
+
+    def bornes(self, table):
+        if table == 'missions':
+            dates = self.index.dates_triees
+            return (pd.Timestamp(dates[0]), pd.Timestamp(dates[-1])) if len(dates) else (None, None)
+        return super().bornes(table)
+
+    def charger(self, table, colonnes=None, filtres=None):
+        donnees = self.donnees[table]
+        if filtres and table == 'missions':
+            positions = self.index.selectionner(filtres)
+            if positions is not None:
+                donnees = donnees.take(positions).reset_index(drop=True)
+        elif filtres and table in COLONNES_DATE:
+            donnees = donnees[masque_missions(donnees, filtres, COLONNES_DATE[table])]
+        # Sans filtre ni projection, la table partagée elle-même est retournée
+        return donnees if colonnes is None else donnees[list(colonnes)]
+
+
+class StockageSQLite(StockageDonnees):
+    """Base SQLite locale ; filtres et projection traduits en SQL.
+
+    Les dates sont stockées en entiers (nanosecondes) et indexées, ainsi que
+    la colonne lanceur : une période ou un lanceur ne parcourt que ses lignes.
+    """
+
+    def __init__(self, lanceurs, chemin):
+        super().__init__(lanceurs)
+        self.chemin = chemin
+
+    @contextmanager
+    def connexion(self):
+        """Connexion validée en fin de bloc (annulée sur exception), puis toujours fermée"""
+        connexion = sqlite3.connect(self.chemin)
+        try:
+            with connexion:
+                yield connexion
+        finally:
+            connexion.close()
+
+    def tables(self):
+        with self.connexion() as connexion:
+            return [nom for nom, in connexion.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+
+    def ecrire(self, table, donnees):
+        donnees = donnees.copy()
+        colonne_date = COLONNES_DATE.get(table)
+        if colonne_date in donnees:
+            donnees[colonne_date] = donnees[colonne_date].astype('datetime64[ns]').astype('int64')
+        for colonne in donnees.columns:
+            if isinstance(donnees[colonne].dtype, pd.CategoricalDtype):
+                donnees[colonne] = donnees[colonne].astype(str)
+        with self.connexion() as connexion:
+            donnees.to_sql(table, connexion, if_exists='replace', index=False, chunksize=self.taille_lot)
+            if colonne_date:
+                connexion.execute(f'CREATE INDEX IF NOT EXISTS "{table}_{colonne_date}" ON "{table}" ("{colonne_date}")')
+                connexion.execute(f'CREATE INDEX IF NOT EXISTS "{table}_lanceur" ON "{table}" ("lanceur")')
+
+    def typer(self, table, lot):
+        colonne_date = COLONNES_DATE.get(table)
+        if colonne_date in lot:
+            lot[colonne_date] = pd.to_datetime(lot[colonne_date], unit='ns')
+        return super().typer(table, lot)
+
+    def requete(self, table, colonnes, filtres):
+        """Requête SQL paramétrée (projection et filtres poussés dans la base)"""
+        selection = ', '.join(f'"{colonne}"' for colonne in colonnes) if colonnes else '*'
+        conditions, parametres = [], []
+        for colonne, operateur, valeur in self.contraintes(table, filtres):
+            if operateur == 'in':
+                conditions.append(f'"{colonne}" IN ({", ".join("?" * len(valeur))})' if valeur else '0')
+                parametres += valeur
+            else:
+                conditions.append(f'"{colonne}" {operateur} ?')
+                parametres.append(valeur.value)
+        where = f' WHERE {" AND ".join(conditions)}' if conditions else ''
+        return f'SELECT {selection} FROM "{table}"{where}', parametres
+
+    def lots(self, table, colonnes, filtres):
+        sql, parametres = self.requete(table, colonnes, filtres)
+        with self.connexion() as connexion:
+            yield from pd.read_sql_query(sql, connexion, params=parametres, chunksize=self.taille_lot)
+
+    def bornes(self, table):
+        colonne = COLONNES_DATE[table]
+        with self.connexion() as connexion:
+            debut, fin = connexion.execute(f'SELECT MIN("{colonne}"), MAX("{colonne}") FROM "{table}"').fetchone()
+        return (pd.Timestamp(debut), pd.Timestamp(fin)) if debut is not None else (None, None)
+
+
+class StockageParquet(StockageDonnees):
+    """Dossier de fichiers Parquet (un par table), lus avec pyarrow.dataset.
+
+    Les tables datées sont écrites triées par date, en groupes de lignes :
+    les statistiques min/max des groupes permettent d'ignorer sans les lire
+    ceux qui sortent de la période demandée.
+    """
+
+    def __init__(self, lanceurs, dossier):
+        super().__init__(lanceurs)
+        self.dossier = dossier
+
+    def fichier(self, table):
+        return os.path.join(self.dossier, f'{table}.parquet')
+
+    def tables(self):
+        if not os.path.isdir(self.dossier):
+            return []
+        return [nom[:-len('.parquet')] for nom in os.listdir(self.dossier) if nom.endswith('.parquet')]
+
+    def ecrire(self, table, donnees):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        colonne_date = COLONNES_DATE.get(table)
+        if colonne_date in donnees:
+            donnees = donnees.sort_values(colonne_date, kind='stable')
+        colonnes = {colonne: donnees[colonne].astype(str) for colonne in donnees.columns
+                    if isinstance(donnees[colonne].dtype, pd.CategoricalDtype)}
+        os.makedirs(self.dossier, exist_ok=True)
+        pq.write_table(pa.Table.from_pandas(donnees.assign(**colonnes), preserve_index=False),
+                       self.fichier(table), row_group_size=self.taille_lot)
+
+    def lots(self, table, colonnes, filtres):
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        expression = None
+        for colonne, operateur, valeur in self.contraintes(table, filtres):
+            if operateur == 'in':
+                condition = ds.field(colonne).isin(pa.array(valeur, pa.string()))
+            elif operateur == '>=':
+                condition = ds.field(colonne) >= valeur.to_datetime64()
+            else:
+                condition = ds.field(colonne) <= valeur.to_datetime64()
+            expression = condition if expression is None else expression & condition
+
+        donnees = ds.dataset(self.fichier(table), format='parquet')
+        for lot in donnees.to_batches(columns=colonnes, filter=expression, batch_size=self.taille_lot):
+            if lot.num_rows:
+                yield lot.to_pandas()
+
+
+class StockageInstantane(StockageMemoire):
+    """Instantané en colonnes NumPy (.npy), projetées en mémoire (mmap) à l'ouverture.
+
+    Chaque table est un dossier : un fichier par colonne (codes pour les
+    colonnes catégorielles, entiers nanosecondes pour les dates) et un
+    schema.json. Les DataFrames sont construits sans copie au-dessus des
+    fichiers : l'ouverture ne lit rien, les pages sont chargées à la demande
+    et partagées par tous les processus qui ouvrent le même instantané.
+    L'index des missions y est enregistré pour ne pas retrier au démarrage.
+    """
+
+    def __init__(self, lanceurs, dossier):
+        StockageDonnees.__init__(self, lanceurs)
+        self.dossier = dossier
+        self.donnees = {table: self.lire(table) for table in self.tables()}
+        self.index = self.lire_index() if 'missions' in self.donnees else None
+
+    def chemin(self, table, fichier):
+        return os.path.join(self.dossier, table, fichier)
+
+    def tables(self):
+        if not os.path.isdir(self.dossier):
+            return []
+        return [table for table in sorted(os.listdir(self.dossier))
+                if os.path.exists(self.chemin(table, 'schema.json'))]
+
+    def ecrire(self, table, donnees):
+        os.makedirs(os.path.join(self.dossier, table), exist_ok=True)
+        schema = []
+        for colonne in donnees.columns:
+            serie = donnees[colonne]
+            if pd.api.types.is_datetime64_any_dtype(serie):
+                valeurs, description = serie.astype('datetime64[ns]').to_numpy().view('int64'), {'type': 'date'}
+            elif pd.api.types.is_numeric_dtype(serie) or pd.api.types.is_bool_dtype(serie):
+                valeurs, description = serie.to_numpy(), {'type': 'valeurs'}
+            else:
+                serie = serie if isinstance(serie.dtype, pd.CategoricalDtype) else serie.astype('category')
+                valeurs = serie.cat.codes.to_numpy()
+                description = {'type': 'categorie', 'categories': [str(categorie) for categorie in serie.cat.categories]}
+            np.save(self.chemin(table, f'{len(schema)}.npy'), valeurs)
+            schema.append({'colonne': colonne, **description})
+        with open(self.chemin(table, 'schema.json'), 'w', encoding='utf-8') as fichier:
+            json.dump(schema, fichier, ensure_ascii=False)
+
+        self.donnees[table] = self.lire(table)
+        if table == 'missions':
+            index = IndexMissions(self.donnees[table])
+            for nom, valeurs in index.tableaux().items():
+                np.save(self.chemin(table, f'index_{nom}.npy'), valeurs)
+            self.index = self.lire_index()
+
+    def lire(self, table):
+        """Table construite sans copie au-dessus des colonnes projetées en mémoire"""
+        with open(self.chemin(table, 'schema.json'), encoding='utf-8') as fichier:
+            schema = json.load(fichier)
+        colonnes = {}
+        for position, description in enumerate(schema):
+            valeurs = np.load(self.chemin(table, f'{position}.npy'), mmap_mode='r')
+            if description['type'] == 'date':
+                valeurs = valeurs.view('datetime64[ns]')
+            elif description['type'] == 'categorie':
+                valeurs = pd.Categorical.from_codes(
+                    valeurs, dtype=pd.CategoricalDtype(description['categories']), validate=False)
+            colonnes[description['colonne']] = valeurs
+        return pd.DataFrame(colonnes, copy=False)
+
+    def lire_index(self):
+        prefixe = 'index_'
+        fichiers = [nom for nom in os.listdir(os.path.join(self.dossier, 'missions')) if nom.startswith(prefixe)]
+        tableaux = {nom[len(prefixe):-len('.npy')]: np.load(self.chemin('missions', nom), mmap_mode='r')
+                    for nom in fichiers}
+        return IndexMissions(self.donnees['missions'], tableaux or None)
+
+
+def ouvrir_stockage(adresse, lanceurs):
+    """Stockage persistant désigné par son adresse, None pour les données simulées en mémoire"""
+    if not adresse:
+        return None
+    type_stockage, _, chemin = adresse.partition(':')
+    if type_stockage == 'sqlite':
+        return StockageSQLite(lanceurs, chemin)
+    if type_stockage == 'parquet':
+        return StockageParquet(lanceurs, chemin)
+    if type_stockage == 'instantane':
+        return StockageInstantane(lanceurs, chemin)
+    raise ValueError(f"Stockage inconnu : {adresse} (attendu sqlite:chemin.db, parquet:dossier ou instantane:dossier)")
+
+
+# Source des événements en direct ("fichier:chemin" suivi en fin de fichier, "tcp:hote:port"), vide = simulation
+SOURCE_FLUX = os.environ.get('CSG_FLUX', '')
+
+
+class FluxDirect:
+    """Ingestion asynchrone des événements de lancement et de statut.
+
+    Une boucle asyncio, dans un thread démon, lit la source ligne par ligne
+    (un événement JSON par ligne) et dépose les événements dans une file
+    bornée : quand la file est pleine, la lecture s'interrompt et la
+    contre-pression remonte jusqu'à la source (fichier non lu, socket non
+    drainée). Un consommateur intègre les événements par lots au tampon de
+    missions partagé, puis incrémente la version des données. Le thread du
+    script Streamlit ne fait que lire la version et la vue du tampon.
+
+    Événements acceptés :
+        {"type": "lancement", "mission_id": ..., "lanceur": ..., ...}  (colonnes du schéma des missions)
+        {"type": "statut", "mission_id": ..., "statut": ...}            (dernière mission portant cet identifiant)
+    """
+
+    def __init__(self, source, lanceurs, taille_file=10_000, taille_lot=1_000):
+        self.source = source
+        self.schema = schema_missions(lanceurs)
+        self.taille_file = taille_file
+        self.taille_lot = taille_lot
+        self.tampon = TamponMissions(self.schema)
+        self.version = 0
+        self.statistiques = {'recus': 0, 'lancements': 0, 'statuts': 0, 'rejetes': 0}
+        self.verrou = threading.Lock()
+        # Identifiant de mission → position de sa dernière occurrence dans le tampon
+        self._positions = {}
+        self._boucle = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._demarrer, daemon=True, name='flux-direct')
+        self._thread.start()
+
+    def vue(self):
+        """Missions reçues et version des données correspondante"""
+        with self.verrou:
+            return self.tampon.vue(), self.version
+
+    def etat(self):
+        """Version et copie cohérente des compteurs d'ingestion"""
+        with self.verrou:
+            return self.version, dict(self.statistiques)
+
+    def arreter(self):
+        """Arrête la boucle d'ingestion"""
+        if self._thread.is_alive():
+            self._boucle.call_soon_threadsafe(lambda: [tache.cancel() for tache in asyncio.all_tasks()])
+            self._thread.join(timeout=5)
+
+    def _demarrer(self):
+        try:
+            self._boucle.run_until_complete(self._executer())
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._boucle.close()
+
+    async def _executer(self):
+        file = asyncio.Queue(maxsize=self.taille_file)
+        type_source, _, adresse = self.source.partition(':')
+        if type_source == 'fichier':
+            producteur = self._lire_fichier(adresse, file)
+        elif type_source == 'tcp':
+            hote, _, port = adresse.rpartition(':')
+            producteur = self._ecouter(hote or '127.0.0.1', int(port), file)
+        else:
+            raise ValueError(f"Source de flux inconnue : {self.source} (attendu fichier:chemin ou tcp:hote:port)")
+        await asyncio.gather(producteur, self._consommer(file))
+
+    async def _deposer(self, ligne, file):
+        try:
+            evenement = json.loads(ligne)
+        except ValueError:
+            # Compteurs modifiés sous le verrou qui les protège : l'interface les lit depuis un autre thread
+            with self.verrou:
+                self.statistiques['rejetes'] += 1
+            return
+        await file.put(evenement)
+
+    async def _lire_fichier(self, chemin, file):
+        """Suit un fichier d'événements depuis son début (les événements déjà écrits sont rejoués)"""
+        while not os.path.exists(chemin):
+            await asyncio.sleep(0.5)
+        with open(chemin, encoding='utf-8') as fichier:
+            while True:
+                lignes = fichier.readlines(1 << 16)
+                if not lignes:
+                    await asyncio.sleep(0.1)
+                    continue
+                for ligne in lignes:
+                    if ligne.strip():
+                        await self._deposer(ligne, file)
+
+    async def _ecouter(self, hote, port, file):
+        """Serveur TCP local : chaque connexion envoie des lignes d'événements"""
+        async def connexion(lecteur, ecrivain):
+            async for ligne in lecteur:
+                if ligne.strip():
+                    await self._deposer(ligne, file)
+            ecrivain.close()
+
+        serveur = await asyncio.start_server(connexion, hote, port)
+        async with serveur:
+            await serveur.serve_forever()
+
+    async def _consommer(self, file):
+        while True:
+            lot = [await file.get()]
+            while len(lot) < self.taille_lot and not file.empty():
+                lot.append(file.get_nowait())
+            self.integrer(lot)
+
+    def integrer(self, evenements):
+        """Intègre un lot d'événements, dans l'ordre, et publie une nouvelle version"""
+        with self.verrou:
+            lancements = []
+            # Lancements du lot pas encore intégrés : leurs changements de statut s'appliquent avant l'ajout
+            en_attente = {}
+            for evenement in evenements:
+                self.statistiques['recus'] += 1
+                if evenement.get('type') == 'lancement':
+                    en_attente[evenement.get('mission_id')] = len(lancements)
+                    lancements.append(evenement)
+                elif evenement.get('type') == 'statut' and evenement.get('mission_id') in en_attente:
+                    if evenement.get('statut') in STATUTS_MISSION:
+                        position = en_attente[evenement['mission_id']]
+                        lancements[position] = {**lancements[position], 'statut': evenement['statut']}
+                        self.statistiques['statuts'] += 1
+                    else:
+                        self.statistiques['rejetes'] += 1
+                elif evenement.get('type') == 'statut':
+                    self._changer_statut(evenement)
+                else:
+                    self.statistiques['rejetes'] += 1
+            self._ajouter_lancements(lancements)
+            self.version += 1
+
+    def _ajouter_lancements(self, lancements):
+        if not lancements:
+            return
+        missions = pd.DataFrame.from_records(lancements, columns=list(self.schema))
+        missions['date_lancement'] = pd.to_datetime(missions['date_lancement'], errors='coerce')
+        missions['masse_charge_utile'] = pd.to_numeric(missions['masse_charge_utile'], errors='coerce')
+        valides = missions.notna().all(axis=1)
+        self.statistiques['rejetes'] += int((~valides).sum())
+        missions = missions[valides]
+        missions = missions.assign(masse_charge_utile=missions['masse_charge_utile'].astype('int32'))
+
+        debut = len(self.tampon)
+        self.tampon.ajouter_lot(missions)
+        self._positions.update(zip(missions['mission_id'], range(debut, debut + len(missions))))
+        self.statistiques['lancements'] += len(missions)
+
+    def _changer_statut(self, evenement):
+        position = self._positions.get(evenement.get('mission_id'))
+        if position is None or evenement.get('statut') not in STATUTS_MISSION:
+            self.statistiques['rejetes'] += 1
+            return
+        self.tampon.modifier(position, 'statut', evenement['statut'])
+        self.statistiques['statuts'] += 1
+
+
+# Attributs des clients absents de la table des clients
+PAYS_NON_RENSEIGNE = 'Non renseigné'
+PALETTE_CLIENTS = ['#0d3b66', '#1e5a8a', '#e37222', '#f4a261', '#6f42c1', '#dc3545', '#2a9d8f', '#264653']
+
+
+class DimensionClients:
+    """Dimension des clients : couleur et pays rangés par code catégoriel du client des missions.
+
+    La table des clients est alignée une fois sur les catégories de la
+    colonne `client` des missions (clé commune) : les métriques par client
+    puis par pays sont des bincount et groupby vectorisés sur ces codes,
+    sans parcours ligne à ligne, pour quelques clients comme pour des
+    milliers. Les clients absents de la dimension sont ignorés.
+    """
+
+    def __init__(self, clients, categories):
+        categories = pd.Index(categories)
+        self.categories = categories.append(pd.Index(clients['client']).difference(categories))
+        attributs = clients.drop_duplicates('client').set_index('client').reindex(self.categories)
+        # Couleur de la palette, dans l'ordre des codes, pour les clients sans couleur
+        palette = np.resize(np.array(PALETTE_CLIENTS, dtype=object), len(self.categories))
+        couleurs = attributs['couleur'].to_numpy(dtype=object) if 'couleur' in attributs else palette
+        couleurs = np.where(pd.isna(couleurs), palette, couleurs)
+        self.couleurs = dict(zip(self.categories, couleurs))
+        pays = attributs['pays'] if 'pays' in attributs else pd.Series(index=self.categories, dtype=object)
+        # En objets avant de compléter : le pays lu dans un instantané est catégoriel
+        self.pays = pd.Categorical(pays.astype(object).fillna(PAYS_NON_RENSEIGNE).to_numpy())
+
+    def metriques(self, clients, **mesures):
+        """Mesures sommées par client (une valeur par élément de `clients`), avec pays et part des missions.
+
+        La part de marché est celle de la mesure `missions` dans le total ;
+        les clients sans mission sont exclus.
+        """
+        codes = pd.Categorical(clients, categories=self.categories).codes
+        valides = codes >= 0
+        table = pd.DataFrame({'client': self.categories, 'pays': self.pays})
+        for nom, valeurs in mesures.items():
+            table[nom] = np.bincount(codes[valides], weights=np.asarray(valeurs, dtype=np.float64)[valides],
+                                     minlength=len(self.categories)).round().astype(np.int64)
+        table = table[table['missions'] > 0].reset_index(drop=True)
+        table['part_marche'] = table['missions'] / table['missions'].sum() if len(table) else 0.0
+        return table
+
+    @staticmethod
+    def par_pays(metriques):
+        """Métriques par client regroupées par pays"""
+        return metriques.drop(columns='client').groupby('pays', observed=True).sum().reset_index()
+
+
+class EntrepotDonnees:
+    """Données de référence partagées par toutes les sessions du processus.
+
+    Les tables sont lues dans un stockage (données simulées en mémoire par
+    défaut, SQLite ou Parquet sinon) et les derniers chargements filtrés sont
+    conservés. Les DataFrames exposés ici sont communs à tous les
+    spectateurs : ils ne doivent jamais être modifiés en place.
+    """
+
+    taille_cache = 8
+
+    def __init__(self, dashboard, version, adresse_stockage='', source_flux=''):
+        self.version = version
+        self.lanceurs = dashboard.define_lanceurs()
+        dashboard.lanceurs = self.lanceurs
+        self.stockage = ouvrir_stockage(adresse_stockage, self.lanceurs)
+        if self.stockage is None:
+            self.stockage = StockageMemoire(self.lanceurs, self.simuler(dashboard))
+        elif not {'missions', 'trafic', 'clients'} <= set(self.stockage.tables()):
+            # Stockage vide : il est amorcé avec les données simulées
+            for table, donnees in self.simuler(dashboard).items():
+                self.stockage.ecrire(table, donnees)
+
+        self._chargements = OrderedDict()
+        self._comparateurs = OrderedDict()
+        self._verrou = threading.Lock()
+        self.clients_data = self.stockage.charger('clients')
+        # Dimension des clients, alignée sur les catégories de la colonne client des missions
+        self.clients = DimensionClients(self.clients_data,
+                                        self.charger('missions', ['client'])['client'].cat.categories)
+        self.cube = CubeMissions.depuis_missions(self.charger('missions', COLONNES_CUBE))
+        self.matrices = MatricesContingence.depuis_missions(self.charger('missions', COLONNES_MATRICES))
+        # Cumuls jour / mois / trimestre / année, construits sur les seules colonnes utiles
+        self.cumuls = {
+            table: CumulsTemporels.depuis_table(
+                self.charger(table, dimensions + mesures + [COLONNES_DATE[table]]),
+                dimensions, mesures, COLONNES_DATE[table]
+            )
+            for table, (dimensions, mesures) in DEFINITION_CUMULS.items()
+        }
+        self.bornes_dates = self.stockage.bornes('missions')
+        # Missions reçues en direct, communes à toutes les sessions
+        self.flux = FluxDirect(source_flux, self.lanceurs) if source_flux else None
+
+    @staticmethod
+    def simuler(dashboard):
+        """Tables simulées par le générateur du dashboard"""
+        return {
+            'missions': dashboard.initialize_missions_data(),
+            'trafic': dashboard.initialize_traffic_data(),
+            'clients': dashboard.initialize_clients_data()
+        }
+
+    def charger(self, table, colonnes=None, filtres=None):
+        """Table projetée et filtrée par le stockage, mémorisée pour les derniers chargements"""
+        cle = (table, tuple(colonnes) if colonnes else None, repr(sorted((filtres or {}).items())))
+        with self._verrou:
+            if cle in self._chargements:
+                self._chargements.move_to_end(cle)
+                return self._chargements[cle]
+        donnees = self.stockage.charger(table, colonnes, filtres)
+        with self._verrou:
+            self._chargements[cle] = donnees
+            while len(self._chargements) > self.taille_cache:
+                self._chargements.popitem(last=False)
+        return donnees
+
+    def comparateur(self, filtres):
+        """Comparateur de périodes des missions de référence filtrées, commun à toutes les sessions"""
+        cle = repr(sorted(filtres.items()))
+        with self._verrou:
+            if cle in self._comparateurs:
+                self._comparateurs.move_to_end(cle)
+                return self._comparateurs[cle]
+        comparateur = ComparateurPeriodes(self.charger('missions', COLONNES_COMPARATEUR, filtres))
+        with self._verrou:
+            self._comparateurs[cle] = comparateur
+            while len(self._comparateurs) > self.taille_cache:
+                self._comparateurs.popitem(last=False)
+        return comparateur
+
+
+class DonneesSession:
+    """Modifications propres à une session (missions ajoutées en direct)"""
+
+    def __init__(self, entrepot):
+        self.entrepot = entrepot
+        self.missions_ajoutees = TamponMissions(schema_missions(entrepot.lanceurs))
+        # Le cube et les matrices partagés (quelques Ko) ne sont copiés qu'au premier ajout de la session ;
+        # les cumuls partagés ne le sont jamais : la session ne cumule que ses propres ajouts
+        self.cube = entrepot.cube
+        self.matrices = entrepot.matrices
+        self.cumuls_ajouts = None
+        self._selections = OrderedDict()
+        self._projections = OrderedDict()
+
+    def ajouter_mission(self, mission):
+        """Ajoute une mission à la session et met à jour ses agrégats"""
+        if self.cube is self.entrepot.cube:
+            self.cube = self.cube.copie()
+            self.matrices = self.matrices.copie()
+        if self.cumuls_ajouts is None:
+            partages = self.entrepot.cumuls['missions']
+            self.cumuls_ajouts = CumulsTemporels(list(partages.dimensions), partages.mesures[1:], partages.colonne_date)
+        self.missions_ajoutees.ajouter(mission)
+        self.cube.ajouter(mission['lanceur'], mission['statut'], mission['date_lancement'])
+        self.matrices.ajouter(mission)
+        self.cumuls_ajouts.ajouter(mission)
+
+    def cumuls(self):
+        """Cumuls temporels des missions vues par la session, à jour des missions reçues en direct"""
+        partages = self.entrepot.cumuls['missions']
+        if self.entrepot.flux is not None:
+            recues, _ = self.entrepot.flux.vue()
+            partages.suivre(recues)
+        return partages if self.cumuls_ajouts is None else CumulsComposes(partages, self.cumuls_ajouts)
+
+    def ajouts(self):
+        """Missions reçues par le flux direct et ajoutées par la session, avec la version des données.
+
+        La version (flux, ajouts de la session) ne change que lorsque les
+        données changent : les sélections et leurs agrégats ne sont recalculés
+        qu'à ce moment.
+        """
+        tables, version_flux = [], 0
+        if self.entrepot.flux is not None:
+            recues, version_flux = self.entrepot.flux.vue()
+            if len(recues):
+                tables.append(recues)
+        if len(self.missions_ajoutees):
+            tables.append(self.missions_ajoutees.vue())
+        ajouts = concatener_missions(tables) if len(tables) > 1 else (tables[0] if tables else None)
+        return ajouts, (version_flux, len(self.missions_ajoutees))
+
+    def version(self):
+        """Version des données vues par la session"""
+        version_flux = self.entrepot.flux.version if self.entrepot.flux is not None else 0
+        return version_flux, len(self.missions_ajoutees)
+
+    def selection(self, filtres):
+        """Missions (et cube) retenues par les filtres, mémorisées pour les derniers jeux de filtres"""
+        cle = (repr(sorted(filtres.items())), self.version())
+        if cle in self._selections:
+            self._selections.move_to_end(cle)
+            return self._selections[cle]
+
+        # Projection et filtres sont appliqués par le stockage de l'entrepôt
+        reference = self.entrepot.charger('missions', filtres=filtres)
+        ajouts, version = self.ajouts()
+        cle = (cle[0], version)
+        masque = masque_missions(ajouts, filtres) if ajouts is not None else None
+
+        # La référence partagée n'est jamais recopiée : la sélection garde à part les ajouts retenus
+        comparateur_reference = partial(self.entrepot.comparateur, filtres)
+        # Les filtres ne retirent rien et le flux n'a rien reçu : le cube et les matrices de la session
+        # sont réutilisés tels quels
+        sans_flux = ajouts is None or len(ajouts) == len(self.missions_ajoutees)
+        if len(reference) == self.entrepot.cube.total() and (masque is None or masque.all()) and sans_flux:
+            selection = SelectionMissions(reference, ajouts, self.cube, self.matrices, comparateur_reference)
+        else:
+            selection = SelectionMissions(reference, ajouts[masque] if masque is not None else None,
+                                          comparateur_reference=comparateur_reference)
+
+        self._selections[cle] = selection
+        if len(self._selections) > 8:
+            self._selections.popitem(last=False)
+        return selection
+
+    def projection(self, filtres):
+        """Lancements annuels et leurs bandes de projection, calculés une fois par filtres et version des données"""
+        cle = (repr(sorted(filtres.items())), self.version())
+        if cle in self._projections:
+            self._projections.move_to_end(cle)
+            return self._projections[cle]
+
+        annuels = self.cumuls().requete('annee', filtres=filtres)
+        projection = annuels, projeter_lancements(annuels['date_lancement'], annuels['lignes'])
+        self._projections[cle] = projection
+        if len(self._projections) > 8:
+            self._projections.popitem(last=False)
+        return projection
+
+    def bornes_dates(self):
+        """Première et dernière date de lancement visibles par la session"""
+        dates = [date.to_datetime64() for date in self.entrepot.bornes_dates if date is not None]
+        ajouts, _ = self.ajouts()
+        if ajouts is not None and len(ajouts):
+            dates += [ajouts['date_lancement'].min().to_datetime64(), ajouts['date_lancement'].max().to_datetime64()]
+        if not dates:
+            return pd.Timestamp(2002, 1, 1), pd.Timestamp.now()
+        return pd.Timestamp(min(dates)), pd.Timestamp(max(dates))
+
+
+@st.cache_resource(show_spinner=False)
+def obtenir_entrepot(_dashboard, version=VERSION_DONNEES, adresse_stockage=ADRESSE_STOCKAGE, source_flux=SOURCE_FLUX):
+    """Construit l'entrepôt une seule fois par processus, par version de données, stockage et flux"""
+    return EntrepotDonnees(_dashboard, version, adresse_stockage, source_flux)
+
+
+def obtenir_donnees_session(entrepot):
+    """Récupère (ou crée) les données de la session courante"""
+    donnees = st.session_state.get('donnees_session')
+    if donnees is None or donnees.entrepot is not entrepot:
+        donnees = DonneesSession(entrepot)
+        st.session_state['donnees_session'] = donnees
+    return donnees
+
+
+# Mémoire maximale du cache de figures partagé (Mo)
+CAPACITE_CACHE_FIGURES_MO = int(os.environ.get('CSG_CACHE_FIGURES_MO', 64))
+
+
+def empreinte(*elements):
+    """Empreinte du contenu des données d'une figure et de ses paramètres"""
+    hachage = hashlib.blake2b(digest_size=16)
+    for element in elements:
+        if isinstance(element, (pd.DataFrame, pd.Series, pd.Index)):
+            hachage.update(pd.util.hash_pandas_object(element, index=not isinstance(element, pd.Index)).to_numpy().tobytes())
+            noms = list(element.columns) if isinstance(element, pd.DataFrame) else [element.name]
+            hachage.update(repr(noms).encode())
+        elif isinstance(element, np.ndarray):
+            hachage.update(np.ascontiguousarray(element).tobytes())
+        else:
+            hachage.update(repr(element).encode())
+    return hachage.hexdigest()
+
+
+def signature_constructeur(construire):
+    """Description stable d'un constructeur de figure (fonctions par nom, arguments et paramètres).
+
+    Les paramètres des graphiques sont portés par le partial du constructeur :
+    ils entrent ainsi dans la clé du cache des figures, sans dépendre de
+    l'adresse mémoire des fonctions.
+    """
+    if isinstance(construire, partial):
+        return (signature_constructeur(construire.func),
+                tuple(signature_constructeur(argument) for argument in construire.args),
+                tuple(sorted((cle, signature_constructeur(valeur)) for cle, valeur in construire.keywords.items())))
+    if isinstance(construire, dict):
+        return tuple(sorted((str(cle), signature_constructeur(valeur)) for cle, valeur in construire.items()))
+    if isinstance(construire, (list, tuple)):
+        return tuple(signature_constructeur(valeur) for valeur in construire)
+    if callable(construire) and hasattr(construire, '__qualname__'):
+        return f"{getattr(construire, '__module__', '')}.{construire.__qualname__}"
+    return construire
+
+
+# Nombre de points par série envoyé au navigateur (de l'ordre de la largeur en pixels d'un graphique)
+BUDGET_POINTS_DEFAUT = 1000
+BUDGETS_POINTS = {
+    'lancements_annuels': 600,
+    'masse_annuelle': 600,
+    'lancements_annuels_lanceurs': 1000,
+    'evolution_clients': 1000
+}
+
+
+def lttb(x, y, seuil):
+    """Indices des points retenus par l'algorithme Largest-Triangle-Three-Buckets.
+
+    Le premier et le dernier point sont conservés ; entre les deux, chaque
+    seau garde le point formant le plus grand triangle avec le point retenu
+    précédent et la moyenne du seau suivant, ce qui préserve la forme visuelle
+    de la courbe (pics compris) avec `seuil` points.
+    """
+    n = len(x)
+    if seuil >= n or seuil < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    bornes = np.linspace(1, n - 1, seuil - 1).astype(np.int64)
+    # Moyennes de tous les seaux (le dernier « seau » est le dernier point), calculées en une passe
+    tailles = np.diff(np.append(bornes, n))
+    x_moyens = np.add.reduceat(x, bornes) / tailles
+    y_moyens = np.add.reduceat(y, bornes) / tailles
+    indices = np.empty(seuil, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    x_precedent, y_precedent = x[0], y[0]
+    for seau in range(seuil - 2):
+        debut, fin = bornes[seau], bornes[seau + 1]
+        x_moyen, y_moyen = x_moyens[seau + 1], y_moyens[seau + 1]
+        aires = np.abs((x_precedent - x_moyen) * (y[debut:fin] - y_precedent)
+                       - (x_precedent - x[debut:fin]) * (y_moyen - y_precedent))
+        retenu = debut + int(aires.argmax())
+        indices[seau + 1] = retenu
+        x_precedent, y_precedent = x[retenu], y[retenu]
+    return indices
+
+
+def reduire_series(donnees, x, y, budget, groupe=None, empile=False):
+    """Réduit chaque série (une par valeur de `groupe`) à `budget` points par LTTB.
+
+    Pour les aires empilées (`empile`), les abscisses sont choisies sur la
+    série totale puis conservées pour tous les groupes, afin que les couches
+    restent alignées.
+    """
+    if len(donnees) <= budget:
+        return donnees
+    donnees = donnees.sort_values(x, kind='stable')
+    abscisses = donnees[x]
+    if pd.api.types.is_datetime64_any_dtype(abscisses):
+        abscisses = abscisses.astype('int64')
+
+    if groupe is None or empile:
+        serie = donnees.groupby(abscisses.to_numpy())[y].sum() if groupe is not None else None
+        if serie is not None:
+            retenues = serie.index[lttb(serie.index.to_numpy(), serie.to_numpy(), budget)]
+            return donnees[abscisses.isin(retenues).to_numpy()]
+        return donnees.iloc[lttb(abscisses.to_numpy(), donnees[y].to_numpy(), budget)]
+
+    positions = []
+    for lignes in donnees.groupby(groupe, observed=True, sort=False).indices.values():
+        retenus = lttb(abscisses.to_numpy()[lignes], donnees[y].to_numpy()[lignes], budget)
+        positions.append(lignes[retenus])
+    return donnees.iloc[np.sort(np.concatenate(positions))]
+
+
+class CacheFigures:
+    """Cache LRU de figures Plotly partagé par toutes les sessions.
+
+    Chaque figure est indexée par l'empreinte de ses données d'entrée et de ses
+    paramètres ; sa taille est celle de son JSON sérialisé. Les figures les
+    moins récemment utilisées sont évincées au-delà de la capacité.
+    Les figures en cache ne doivent pas être modifiées après leur insertion.
+    """
+
+    def __init__(self, capacite_octets):
+        self.capacite_octets = capacite_octets
+        self.octets = 0
+        self.succes = 0
+        self.echecs = 0
+        self._figures = OrderedDict()
+        self._verrou = threading.Lock()
+
+    def obtenir(self, cle, construire):
+        """Retourne la figure en cache ou la construit puis la met en cache"""
+        figure = self.lire(cle)
+        if figure is None:
+            figure = construire()
+            self.inserer(cle, figure)
+        return figure
+
+    def lire(self, cle):
+        """Figure en cache (None si absente)"""
+        with self._verrou:
+            if cle in self._figures:
+                self._figures.move_to_end(cle)
+                self.succes += 1
+                return self._figures[cle][0]
+            self.echecs += 1
+        return None
+
+    def inserer(self, cle, figure, taille=None):
+        """Met une figure en cache (`taille` : longueur de son JSON, s'il est déjà connu)"""
+        if taille is None:
+            taille = len(figure.to_json())
+        with self._verrou:
+            if cle not in self._figures and taille <= self.capacite_octets:
+                self._figures[cle] = (figure, taille)
+                self.octets += taille
+                while self.octets > self.capacite_octets:
+                    _, (_, taille_evincee) = self._figures.popitem(last=False)
+                    self.octets -= taille_evincee
+
+    def __len__(self):
+        return len(self._figures)
+
+
+@st.cache_resource(show_spinner=False)
+def obtenir_cache_figures(capacite_mo=CAPACITE_CACHE_FIGURES_MO):
+    """Cache de figures unique pour le processus"""
+    return CacheFigures(capacite_mo * 1024 * 1024)
+
+
+_MODELES_GRAPHIQUES = {}
+
+
+def modele_graphique():
+    """Modèle (template) Plotly par défaut, sous forme de dictionnaire, calculé une fois par nom"""
+    nom = pio.templates.default
+    if nom not in _MODELES_GRAPHIQUES:
+        _MODELES_GRAPHIQUES[nom] = pio.templates[nom].to_plotly_json() if nom else {}
+    return _MODELES_GRAPHIQUES[nom]
+
+
+def couleurs_discretes(valeurs, color_discrete_map=None, color_discrete_sequence=None):
+    """Couleur de chaque valeur, attribuée comme plotly.express (table de correspondance, puis séquence)"""
+    sequence = color_discrete_sequence or modele_graphique().get('layout', {}).get('colorway') \
+        or px.colors.qualitative.Plotly
+    correspondance = dict(color_discrete_map or {})
+    for valeur in valeurs:
+        if valeur not in correspondance:
+            correspondance[valeur] = sequence[len(correspondance) % len(sequence)]
+    return correspondance
+
+
+def echelle_couleurs(echelle):
+    """Échelle continue [[position, couleur], ...] à partir de son nom ou de sa liste de couleurs"""
+    if echelle is None:
+        return modele_graphique().get('layout', {}).get('colorscale', {}).get('sequential') \
+            or couleurs_plotly.get_colorscale('Plasma')
+    if isinstance(echelle, str):
+        return couleurs_plotly.get_colorscale(echelle)
+    return couleurs_plotly.make_colorscale(list(echelle))
+
+
+def mise_en_page_axes(titre_x, titre_y, title=None, **mise_en_page):
+    """Mise en page commune des graphiques cartésiens (axes titrés, titre, modèle)"""
+    return {
+        'xaxis': {'anchor': 'y', 'domain': [0.0, 1.0], 'title': {'text': titre_x}},
+        'yaxis': {'anchor': 'x', 'domain': [0.0, 1.0], 'title': {'text': titre_y}},
+        'legend': {'tracegroupgap': 0},
+        **mise_en_page_titre(title),
+        **mise_en_page
+    }
+
+
+def mise_en_page_titre(title):
+    """Titre et modèle de la figure (marge haute réservée par plotly.express en l'absence de titre)"""
+    titre = {'title': {'text': title}} if title is not None else {'margin': {'t': 60}}
+    return {**titre, 'template': modele_graphique()}
+
+
+def valeurs_uniques(serie):
+    """Valeurs distinctes dans l'ordre d'apparition (ordre des groupes de plotly.express)"""
+    return list(pd.unique(serie.to_numpy()))
+
+
+def spec_barres(donnees, x, y, title=None, color=None, color_discrete_map=None, color_discrete_sequence=None,
+                color_continuous_scale=None, orientation='v', barmode='relative'):
+    """Spécification d'un diagramme en barres (équivalent de px.bar pour les usages du dashboard)"""
+    axe_categories = x if orientation == 'v' else y
+    traces, mise_en_page = [], mise_en_page_axes(x, y, title, barmode=barmode)
+    survol = f'{x}=%{{x}}<br>{y}=%{{y}}'
+    base = {'type': 'bar', 'orientation': orientation, 'textposition': 'auto', 'xaxis': 'x', 'yaxis': 'y',
+            'hovertemplate': survol + '<extra></extra>'}
+    if barmode == 'group':
+        base['alignmentgroup'] = 'True'
+
+    if color is not None and pd.api.types.is_numeric_dtype(donnees[color]):
+        # Couleur continue : une seule trace sur l'axe de couleurs
+        if color not in (x, y):
+            base['hovertemplate'] = f'{survol}<br>{color}=%{{marker.color}}<extra></extra>'
+        traces.append({**base, 'x': donnees[x].to_numpy(), 'y': donnees[y].to_numpy(), 'name': '',
+                       'legendgroup': '', 'offsetgroup': '' if barmode == 'group' else None, 'showlegend': False,
+                       'marker': {'color': donnees[color].to_numpy(), 'coloraxis': 'coloraxis',
+                                  'pattern': {'shape': ''}}})
+        mise_en_page['coloraxis'] = {'colorbar': {'title': {'text': color}},
+                                     'colorscale': echelle_couleurs(color_continuous_scale)}
+    elif color is not None:
+        groupes = valeurs_uniques(donnees[color])
+        couleurs = couleurs_discretes(groupes, color_discrete_map, color_discrete_sequence)
+        for groupe in groupes:
+            lignes = donnees[donnees[color] == groupe]
+            prefixe = '' if color in (x, y) else f'{color}={groupe}<br>'
+            traces.append({**base, 'x': lignes[x].to_numpy(), 'y': lignes[y].to_numpy(), 'name': str(groupe),
+                           'legendgroup': str(groupe), 'showlegend': True,
+                           'offsetgroup': str(groupe) if barmode == 'group' else None,
+                           'hovertemplate': f'{prefixe}{survol}<extra></extra>',
+                           'marker': {'color': couleurs[groupe], 'pattern': {'shape': ''}}})
+        mise_en_page['legend']['title'] = {'text': color}
+        if color == axe_categories:
+            # Catégories dans l'ordre des groupes, comme plotly.express
+            axe = 'xaxis' if orientation == 'v' else 'yaxis'
+            mise_en_page[axe].update(categoryorder='array', categoryarray=[str(groupe) for groupe in groupes])
+    else:
+        couleur = couleurs_discretes([None], None, color_discrete_sequence)[None]
+        traces.append({**base, 'x': donnees[x].to_numpy(), 'y': donnees[y].to_numpy(), 'name': '',
+                       'legendgroup': '', 'offsetgroup': '' if barmode == 'group' else None, 'showlegend': False,
+                       'marker': {'color': couleur, 'pattern': {'shape': ''}}})
+    return {'data': traces, 'layout': mise_en_page}
+
+
+def spec_secteurs(donnees, values, names, title=None, color=None, color_discrete_map=None,
+                  color_discrete_sequence=None):
+    """Spécification d'un diagramme circulaire (équivalent de px.pie)"""
+    trace = {'type': 'pie', 'labels': donnees[names].to_numpy(), 'values': donnees[values].to_numpy(),
+             'domain': {'x': [0.0, 1.0], 'y': [0.0, 1.0]}, 'name': '', 'legendgroup': '', 'showlegend': True,
+             'hovertemplate': f'{names}=%{{label}}<br>{values}=%{{value}}<extra></extra>'}
+    if color is not None or color_discrete_map or color_discrete_sequence:
+        couleurs = couleurs_discretes(valeurs_uniques(donnees[color or names]), color_discrete_map,
+                                      color_discrete_sequence)
+        trace['marker'] = {'colors': [couleurs[valeur] for valeur in donnees[color or names]]}
+    return {'data': [trace], 'layout': {'legend': {'tracegroupgap': 0}, **mise_en_page_titre(title)}}
+
+
+def spec_courbes(donnees, x, y, title=None, color=None, color_discrete_map=None, color_discrete_sequence=None,
+                 markers=False, empile=False):
+    """Spécification de courbes ou d'aires empilées (équivalent de px.line et px.area)"""
+    mise_en_page = mise_en_page_axes(x, y, title)
+    groupes = valeurs_uniques(donnees[color]) if color is not None else [None]
+    couleurs = couleurs_discretes(groupes, color_discrete_map, color_discrete_sequence)
+    traces = []
+    for groupe in groupes:
+        lignes = donnees if groupe is None else donnees[donnees[color] == groupe]
+        prefixe = '' if groupe is None else f'{color}={groupe}<br>'
+        trace = {'type': 'scatter', 'x': lignes[x].to_numpy(), 'y': lignes[y].to_numpy(), 'xaxis': 'x', 'yaxis': 'y',
+                 'mode': 'lines+markers' if markers else 'lines', 'orientation': 'v',
+                 'name': '' if groupe is None else str(groupe), 'legendgroup': '' if groupe is None else str(groupe),
+                 'showlegend': groupe is not None, 'line': {'color': couleurs[groupe]},
+                 'marker': {'symbol': 'circle'},
+                 'hovertemplate': f'{prefixe}{x}=%{{x}}<br>{y}=%{{y}}<extra></extra>'}
+        if empile:
+            trace.update(stackgroup='1', fillpattern={'shape': ''})
+        else:
+            trace['line']['dash'] = 'solid'
+        traces.append(trace)
+    if color is not None:
+        mise_en_page['legend']['title'] = {'text': color}
+    return {'data': traces, 'layout': mise_en_page}
+
+
+def spec_carte_chaleur(donnees, title=None, color_continuous_scale=None):
+    """Spécification d'une carte de chaleur d'un tableau croisé (équivalent de px.imshow)"""
+    titre_x, titre_y = donnees.columns.name, donnees.index.name
+    mise_en_page = mise_en_page_axes(titre_x, titre_y, title)
+    del mise_en_page['legend']
+    mise_en_page['xaxis'].update(scaleanchor='y', constrain='domain')
+    mise_en_page['yaxis'].update(autorange='reversed', constrain='domain')
+    mise_en_page['coloraxis'] = {'colorscale': echelle_couleurs(color_continuous_scale)}
+    trace = {'type': 'heatmap', 'z': donnees.to_numpy(), 'x': [str(colonne) for colonne in donnees.columns],
+             'y': [str(ligne) for ligne in donnees.index], 'coloraxis': 'coloraxis', 'name': '0',
+             'xaxis': 'x', 'yaxis': 'y',
+             'hovertemplate': f'{titre_x}: %{{x}}<br>{titre_y}: %{{y}}<br>color: %{{z}}<extra></extra>'}
+    return {'data': [trace], 'layout': mise_en_page}
+
+
+def spec_bandes(donnees, x, y, title=None, historique=None, couleur='#e37222', couleur_historique='#0d3b66'):
+    """Spécification d'une médiane projetée dans sa bande p5–p95, précédée de la courbe historique.
+
+    `donnees` contient les colonnes p5, p50 et p95 (valeurs manquantes hors
+    projection) et, si `historique` est indiqué, la colonne des valeurs
+    observées (manquantes sur les années projetées).
+    """
+    mise_en_page = mise_en_page_axes(x, y, title)
+    traces = []
+    if historique is not None:
+        lignes = donnees[donnees[historique].notna()]
+        traces.append({'type': 'scatter', 'x': lignes[x].to_numpy(), 'y': lignes[historique].to_numpy(),
+                       'mode': 'lines+markers', 'name': 'Historique', 'line': {'color': couleur_historique},
+                       'hovertemplate': f'{x}=%{{x}}<br>{y}=%{{y}}<extra>Historique</extra>'})
+    lignes = donnees[donnees['p50'].notna()]
+    rouge, vert, bleu = (int(couleur[position:position + 2], 16) for position in (1, 3, 5))
+    traces += [
+        {'type': 'scatter', 'x': lignes[x].to_numpy(), 'y': lignes['p95'].to_numpy(), 'mode': 'lines',
+         'line': {'width': 0, 'color': couleur}, 'showlegend': False, 'name': 'p95',
+         'hovertemplate': f'{x}=%{{x}}<br>p95=%{{y:.1f}}<extra></extra>'},
+        {'type': 'scatter', 'x': lignes[x].to_numpy(), 'y': lignes['p5'].to_numpy(), 'mode': 'lines',
+         'line': {'width': 0, 'color': couleur}, 'fill': 'tonexty',
+         'fillcolor': f'rgba({rouge}, {vert}, {bleu}, 0.25)', 'name': 'Intervalle p5–p95',
+         'hovertemplate': f'{x}=%{{x}}<br>p5=%{{y:.1f}}<extra></extra>'},
+        {'type': 'scatter', 'x': lignes[x].to_numpy(), 'y': lignes['p50'].to_numpy(), 'mode': 'lines+markers',
+         'line': {'color': couleur, 'dash': 'dash'}, 'name': 'Projection (médiane)',
+         'hovertemplate': f'{x}=%{{x}}<br>p50=%{{y:.1f}}<extra></extra>'},
+    ]
+    return {'data': traces, 'layout': mise_en_page}
+
+
+def figure_bandes(donnees, **parametres):
+    """Figure d'une projection et de sa bande de confiance"""
+    return go.Figure(spec_bandes(donnees, **parametres), _validate=False)
+
+
+# Fonction plotly.express (par nom, sans importer plotly) → spécification légère équivalente
+SPECS_GRAPHIQUES = {
+    'bar': spec_barres,
+    'pie': spec_secteurs,
+    'line': spec_courbes,
+    'area': partial(spec_courbes, empile=True),
+    'imshow': spec_carte_chaleur
+}
+
+
+def figure_legere(fonction, donnees, **parametres):
+    """Figure construite directement depuis sa spécification, sans revalidation par graph_objects.
+
+    Retourne None si la fonction ou l'un des paramètres n'a pas d'équivalent
+    léger : la figure est alors construite par plotly.express.
+    """
+    if not getattr(fonction, '__module__', '').startswith('plotly.express'):
+        return None
+    spec = SPECS_GRAPHIQUES.get(fonction.__name__)
+    if spec is None:
+        return None
+    try:
+        specification = spec(donnees, **parametres)
+    except TypeError:
+        return None
+    for trace in specification['data']:
+        for cle in [cle for cle, valeur in trace.items() if valeur is None]:
+            del trace[cle]
+    return go.Figure(specification, _validate=False)
+
+
+def figure_plotly(fonction, donnees, mise_en_page=None, traces=None, **parametres):
+    """Construit une figure (spécification légère si possible, sinon plotly.express) puis la met en forme"""
+    figure = figure_legere(fonction, donnees, **parametres)
+    if figure is None:
+        figure = fonction(donnees, **parametres)
+    if mise_en_page:
+        figure.update_layout(**mise_en_page)
+    if traces:
+        figure.update_traces(**traces)
+    return figure
+
+
+def constructeur(fonction, mise_en_page=None, traces=None, **parametres):
+    """Constructeur de figure (donnees → figure) sérialisable par pickle.
+
+    Contrairement à une lambda, il peut être envoyé à un processus de
+    travail du pipeline de rendu.
+    """
+    return partial(figure_plotly, fonction, mise_en_page=mise_en_page, traces=traces, **parametres)
+
+
+def construire_figure_json(construire, donnees):
+    """Tâche d'un processus de travail : construit la figure et la renvoie sérialisée"""
+    return pio.to_json(construire(donnees), validate=False)
+
+
+# Pipeline de rendu des figures : nombre de travailleurs (1 = construction séquentielle)
+# et nature des travailleurs ("threads" par défaut, ou "processus")
+TRAVAILLEURS_FIGURES = int(os.environ.get('CSG_TRAVAILLEURS_FIGURES', min(4, os.cpu_count() or 1)))
+MODE_FIGURES = os.environ.get('CSG_MODE_FIGURES', 'threads')
+
+
+@st.cache_resource(show_spinner=False)
+def obtenir_travailleurs_figures(travailleurs=TRAVAILLEURS_FIGURES, mode=MODE_FIGURES):
+    """Pool de travailleurs du pipeline de rendu, unique pour le processus (None si séquentiel).
+
+    Les threads sont le mode par défaut. Les processus, sur demande, sont
+    démarrés par spawn et non par fork, que le serveur multithreadé ne
+    supporte pas sans risque : chacun réimporte le script (sans le lancer)
+    pour retrouver les constructeurs qui y sont définis, et charge plotly
+    dès son démarrage. Le pool est arrêté à la sortie de l'interpréteur.
+    """
+    if travailleurs <= 1:
+        return None
+    if mode == 'processus':
+        pool = ProcessPoolExecutor(travailleurs, mp_context=multiprocessing.get_context('spawn'),
+                                   initializer=importlib.import_module, initargs=('plotly.express',))
+    else:
+        pool = ThreadPoolExecutor(travailleurs, thread_name_prefix='figures')
+    atexit.register(pool.shutdown, wait=False, cancel_futures=True)
+    return pool
+
+
+class PipelineFigures:
+    """Construction parallèle des figures d'une section, affichées dans l'ordre de la mise en page.
+
+    Chaque figure absente du cache réserve son emplacement dans la page puis
+    est confiée au pool ; à la fermeture du pipeline, les résultats sont
+    récupérés dans l'ordre de soumission, mis en cache et affichés à leur
+    emplacement. Dans un pool de processus, les figures reviennent sérialisées
+    et sont reconstruites sans revalidation ; un constructeur non sérialisable
+    (lambda) est exécuté sur le thread du script.
+    """
+
+    def __init__(self, travailleurs, cache_figures):
+        self.travailleurs = travailleurs
+        self.cache_figures = cache_figures
+        self.processus = isinstance(travailleurs, ProcessPoolExecutor)
+        self._taches = []
+        self.duree = 0.0
+
+    def soumettre(self, emplacement, cle, construire, donnees):
+        if self.processus:
+            try:
+                pickle.dumps(construire)
+                tache = self.travailleurs.submit(construire_figure_json, construire, donnees)
+            except (pickle.PicklingError, AttributeError, TypeError):
+                tache = None
+        else:
+            tache = self.travailleurs.submit(construire, donnees)
+        self._taches.append((emplacement, cle, construire, donnees, tache))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        taches, self._taches = self._taches, []
+        if exception[0] is not None:
+            for *_, tache in taches:
+                if tache is not None:
+                    tache.cancel()
+            return False
+        debut = time.perf_counter()
+        for emplacement, cle, construire, donnees, tache in taches:
+            taille = None
+            if tache is None:
+                figure = construire(donnees)
+            elif self.processus:
+                figure_json = tache.result()
+                figure, taille = go.Figure(json.loads(figure_json), _validate=False), len(figure_json)
+            else:
+                figure = tache.result()
+            self.cache_figures.inserer(cle, figure, taille)
+            emplacement.plotly_chart(figure, use_container_width=True)
+        self.duree = time.perf_counter() - debut
+        return False
+
+
+class PlanificateurRafraichissement:
+    """Cadence de rafraîchissement des panneaux live d'une session.
+
+    La cadence double à chaque période d'inactivité (aucune exécution complète
+    du script, donc aucune interaction) jusqu'à la cadence maximale.
+    """
+
+    def __init__(self, cadence_base=30, cadence_max=600, delai_inactivite=300):
+        self.cadence_base = cadence_base
+        self.cadence_max = cadence_max
+        self.delai_inactivite = delai_inactivite
+        self.derniere_interaction = time.monotonic()
+        self.cadence_active = None
+        self.replanification = False
+
+    def enregistrer_execution(self, cadence_base):
+        """Enregistre une exécution complète du script et retourne la cadence à appliquer"""
+        self.cadence_base = cadence_base
+        if self.replanification:
+            # Exécution déclenchée par le planificateur lui-même : pas une interaction
+            self.replanification = False
+        else:
+            self.derniere_interaction = time.monotonic()
+        self.cadence_active = self.cadence_courante()
+        return self.cadence_active
+
+    def cadence_courante(self):
+        """Cadence en secondes selon la durée d'inactivité"""
+        inactivite = time.monotonic() - self.derniere_interaction
+        palier = min(int(inactivite // self.delai_inactivite), 10)
+        return min(self.cadence_base * 2 ** palier, max(self.cadence_max, self.cadence_base))
+
+    def verifier_cadence(self):
+        """Relance l'application quand la cadence des fragments doit changer"""
+        if self.cadence_active is not None and self.cadence_courante() != self.cadence_active:
+            self.replanification = True
+            st.rerun(scope='app')
+
+
+def obtenir_planificateur():
+    """Récupère (ou crée) le planificateur de rafraîchissement de la session"""
+    if 'planificateur' not in st.session_state:
+        st.session_state['planificateur'] = PlanificateurRafraichissement()
+    return st.session_state['planificateur']
+
+
+class TamponCirculaire:
+    """Série temporelle de taille fixe, stockée dans des tableaux NumPy circulaires.
+
+    Les points les plus anciens sont écrasés une fois la capacité atteinte :
+    la mémoire reste constante quelle que soit la durée du flux. Un compteur
+    d'écritures monotone permet à chaque lecteur de ne récupérer que les
+    points arrivés depuis sa dernière lecture.
+    """
+
+    def __init__(self, capacite, canaux):
+        self.capacite = capacite
+        self.canaux = list(canaux)
+        self.temps = np.zeros(capacite)
+        self.valeurs = np.zeros((len(self.canaux), capacite))
+        self.ecrits = 0
+        self.verrou = threading.Lock()
+
+    def __len__(self):
+        return min(self.ecrits, self.capacite)
+
+    def ajouter_lot(self, temps, valeurs):
+        """Ajoute n points : `temps` de forme (n,), `valeurs` de forme (canaux, n)"""
+        temps = np.asarray(temps)[-self.capacite:]
+        valeurs = np.asarray(valeurs)[:, -self.capacite:]
+        positions = (self.ecrits + np.arange(len(temps))) % self.capacite
+        with self.verrou:
+            self.temps[positions] = temps
+            self.valeurs[:, positions] = valeurs
+            self.ecrits += len(temps)
+
+    def depuis(self, compteur):
+        """Points écrits après le compteur donné (au plus la capacité), et le nouveau compteur"""
+        with self.verrou:
+            debut = max(compteur, self.ecrits - self.capacite)
+            positions = np.arange(debut, self.ecrits) % self.capacite
+            return self.temps[positions], self.valeurs[:, positions], self.ecrits
+
+    def fenetre(self):
+        """Tous les points conservés, du plus ancien au plus récent"""
+        temps, valeurs, _ = self.depuis(0)
+        return temps, valeurs
+
+    def decimer(self, canal, segments):
+        """Décimation min/max : le minimum et le maximum de chaque segment, dans l'ordre du temps.
+
+        2 × `segments` points au plus, quel que soit le nombre de points
+        conservés, sans perdre les pics qu'une moyenne ou un sous-échantillonnage
+        régulier effaceraient.
+        """
+        temps, valeurs = self.fenetre()
+        valeurs = valeurs[self.canaux.index(canal)]
+        n = len(temps)
+        if n <= 2 * segments:
+            return temps, valeurs
+        taille = -(-n // segments)
+        # Le dernier segment incomplet est complété par répétition de la dernière valeur
+        completees = np.pad(valeurs, (0, segments * taille - n), mode='edge').reshape(segments, taille)
+        decalages = np.arange(segments) * taille
+        positions = np.unique(np.concatenate([decalages + completees.argmin(axis=1),
+                                              decalages + completees.argmax(axis=1)]))
+        positions = positions[positions < n]
+        return temps[positions], valeurs[positions]
+
+
+class SourceTelemetrie:
+    """Source de télémétrie simulée d'un lancement, pour tester le panneau sans liaison réelle.
+
+    Un thread démon produit `frequence` points par seconde (temps relatif à
+    H0, altitude en km, vitesse en m/s) : compte à rebours, vol propulsé
+    jusqu'à la séparation de la charge utile, puis nouveau compte à rebours.
+    """
+
+    EVENEMENTS = [
+        (0, "H0 - Allumage de l'étage principal"),
+        (7, 'Décollage'),
+        (142, 'Séparation des propulseurs à poudre'),
+        (215, 'Largage de la coiffe'),
+        (540, "Extinction de l'étage principal"),
+        (546, "Séparation de l'étage principal"),
+        (1500, "Extinction de l'étage supérieur"),
+        (1800, 'Séparation de la charge utile')
+    ]
+
+    def __init__(self, frequence=50, compte_a_rebours=30, capacite=60_000):
+        self.frequence = frequence
+        self.compte_a_rebours = compte_a_rebours
+        self.tampon = TamponCirculaire(capacite, ['altitude_km', 'vitesse_m_s'])
+        self.generateur = np.random.default_rng(GRAINE_DONNEES)
+        self._depart = time.monotonic()
+        self._thread = threading.Thread(target=self._produire, daemon=True, name='telemetrie')
+        self._thread.start()
+
+    def temps_vol(self, instant=None):
+        """Temps relatif à H0 (négatif pendant le compte à rebours)"""
+        duree_cycle = self.compte_a_rebours + self.EVENEMENTS[-1][0] + 60
+        ecoule = (time.monotonic() if instant is None else instant) - self._depart
+        return ecoule % duree_cycle - self.compte_a_rebours
+
+    def evenements_passes(self, temps):
+        """Événements de vol déjà survenus à ce temps de vol"""
+        return [(instant, libelle) for instant, libelle in self.EVENEMENTS if instant <= temps]
+
+    def mesures(self, temps):
+        """Profil simplifié d'une ascension vers l'orbite, avec bruit de mesure"""
+        vol = np.clip(temps - 7, 0, None)
+        altitude = 200 * (1 - np.exp(-vol / 400)) + self.generateur.normal(0, 0.05, len(temps)) * (vol > 0)
+        vitesse = 7800 * (1 - np.exp(-vol / 600)) + self.generateur.normal(0, 3, len(temps)) * (vol > 0)
+        return np.vstack([altitude, vitesse])
+
+    def _produire(self):
+        periode = 1 / self.frequence
+        while True:
+            temps = np.array([self.temps_vol()])
+            self.tampon.ajouter_lot(temps, self.mesures(temps))
+            time.sleep(periode)
+
+
+@st.cache_resource(show_spinner=False)
+def obtenir_telemetrie():
+    """Source de télémétrie unique pour le processus (démarrée à la première ouverture du panneau)"""
+    return SourceTelemetrie()
+
+
+# Période d'un tick du panneau de télémétrie (s) et durée d'une séquence d'ajouts avant reconstruction
+PERIODE_TELEMETRIE = 0.1
+DUREE_SEQUENCE_TELEMETRIE = 5
+SEGMENTS_TELEMETRIE = 300
+
+
+# Mesures de rendu : exécutions conservées par section/méthode (fenêtre glissante des percentiles)
+FENETRE_MESURES = int(os.environ.get('CSG_FENETRE_MESURES', 500))
+# Canaux d'une mesure (durées en secondes) et bornes (s) de l'histogramme des durées
+CANAUX_MESURES = ['duree', 'preparation', 'figures', 'octets_figures', 'elements']
+BORNES_DUREES = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+QUANTILES_MESURES = [0.5, 0.95, 0.99]
+
+
+class CompteurMessages:
+    """Compte les éléments Streamlit (conteneurs compris) émis par le script et les octets des figures Plotly.
+
+    Installé une seule fois par contexte d'exécution à la place de son
+    `enqueue` : chaque message est compté puis transmis inchangé.
+    """
+
+    def __init__(self, transmettre):
+        self.transmettre = transmettre
+        self.elements = 0
+        self.octets_figures = 0
+
+    def __call__(self, message):
+        if message.WhichOneof('type') == 'delta' and message.delta.WhichOneof('type') in ('new_element', 'add_block'):
+            self.elements += 1
+            element = message.delta.new_element
+            if element.WhichOneof('type') == 'plotly_chart':
+                self.octets_figures += len(element.plotly_chart.spec)
+        self.transmettre(message)
+
+
+def obtenir_compteur_messages():
+    """Compteur de messages de la session courante (None hors exécution Streamlit)"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    contexte = get_script_run_ctx(suppress_warning=True)
+    if contexte is None:
+        return None
+    # Marqueur posé sur le contexte : `enqueue` n'est enveloppé qu'une fois, quel que
+    # soit le nombre d'exécutions du script (qui redéfinissent la classe à chaque fois)
+    compteur = getattr(contexte, 'compteur_messages', None)
+    if compteur is None:
+        compteur = contexte.compteur_messages = CompteurMessages(contexte.enqueue)
+        contexte.enqueue = compteur
+    return compteur
+
+
+def echapper_etiquette(valeur):
+    """Valeur d'étiquette Prometheus (barres obliques inverses, guillemets et retours à la ligne échappés)"""
+    return str(valeur).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class MesuresRendu:
+    """Mesures de rendu des sections et des méthodes du dashboard, partagées par les sessions.
+
+    Chaque rendu (genre "section" ou "methode", nom) ajoute un point à un
+    tampon circulaire par canal : les percentiles portent sur les
+    FENETRE_MESURES dernières exécutions. Sommes, nombres d'exécutions et
+    comptes de l'histogramme des durées sont cumulés depuis le démarrage,
+    comme l'attend le format Prometheus.
+    """
+
+    def __init__(self, fenetre=FENETRE_MESURES):
+        self.fenetre = fenetre
+        self.tampons = {}
+        self.sommes = {}
+        self.histogrammes = {}
+        self.verrou = threading.Lock()
 
-# Configuration de la page
-st.set_page_config(
-    page_title="Centre Spatial Guyanais - Dashboard Live",
-    page_icon="🚀",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+    def enregistrer(self, cle, valeurs):
+        """Ajoute une exécution : `valeurs` dans l'ordre de CANAUX_MESURES"""
+        with self.verrou:
+            if cle not in self.tampons:
+                self.tampons[cle] = TamponCirculaire(self.fenetre, CANAUX_MESURES)
+                self.sommes[cle] = np.zeros(len(CANAUX_MESURES))
+                self.histogrammes[cle] = np.zeros(len(BORNES_DUREES) + 1, dtype=np.int64)
+            self.sommes[cle] += valeurs
+            self.histogrammes[cle][np.searchsorted(BORNES_DUREES, valeurs[0])] += 1
+        self.tampons[cle].ajouter_lot([time.time()], np.asarray(valeurs, dtype=float)[:, None])
 
-# CSS personnalisé
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        background: linear-gradient(45deg, #0d3b66, #1e5a8a, #e37222);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        margin-bottom: 2rem;
-        font-weight: bold;
-    }
-    .live-badge {
-        background: linear-gradient(45deg, #0d3b66, #e37222);
-        color: white;
-        padding: 0.3rem 1rem;
-        border-radius: 20px;
-        font-weight: bold;
-        display: inline-block;
-        animation: pulse 2s infinite;
-    }
-    @keyframes pulse {
-        0% { transform: scale(1); }
-        50% { transform: scale(1.05); }
-        100% { transform: scale(1); }
-    }
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 10px;
-        border-left: 4px solid #0d3b66;
-        margin: 0.5rem 0;
-    }
-    .section-header {
-        color: #0d3b66;
-        border-bottom: 2px solid #e37222;
-        padding-bottom: 0.5rem;
-        margin-top: 2rem;
-    }
-    .mission-card {
-        padding: 1rem;
-        border-radius: 10px;
-        margin: 0.5rem 0;
-        border-left: 5px solid #0d3b66;
-        background-color: #f8f9fa;
-    }
-    .mission-status {
-        padding: 0.5rem;
-        border-radius: 5px;
-        margin: 0.2rem 0;
-        font-size: 0.9rem;
-    }
-    .success { background-color: #d4edda; border-left: 4px solid #28a745; }
-    .failure { background-color: #f8d7da; border-left: 4px solid #dc3545; }
-    .planned { background-color: #cce7ff; border-left: 4px solid #007bff; }
-    .in-progress { background-color: #fff3cd; border-left: 4px solid #ffc107; }
-</style>
-""", unsafe_allow_html=True)
+    def executions(self, cle):
+        return int(self.histogrammes[cle].sum())
+
+    def quantiles(self, cle):
+        """Quantiles de chaque canal sur la fenêtre glissante : tableau (canaux, quantiles)"""
+        _, valeurs = self.tampons[cle].fenetre()
+        return np.quantile(valeurs, QUANTILES_MESURES, axis=1).T
+
+    def resume(self, genre):
+        """Percentiles des rendus d'un genre, du plus lent au plus rapide (p95)"""
+        lignes = []
+        for cle in sorted(self.tampons):
+            if cle[0] != genre:
+                continue
+            quantiles = self.quantiles(cle)
+            duree, preparation, figures, octets, elements = quantiles
+            lignes.append({
+                'nom': cle[1], 'exécutions': self.executions(cle),
+                'p50 (ms)': duree[0] * 1000, 'p95 (ms)': duree[1] * 1000, 'p99 (ms)': duree[2] * 1000,
+                'préparation p50 (ms)': preparation[0] * 1000, 'figures p50 (ms)': figures[0] * 1000,
+                'figures p50 (ko)': octets[0] / 1024, 'éléments p50': elements[0]
+            })
+        resume = pd.DataFrame(lignes)
+        return resume.sort_values('p95 (ms)', ascending=False) if len(resume) else resume
+
+    def exporter_json(self):
+        """Percentiles, cumuls et histogramme de chaque rendu, au format JSON"""
+        mesures = []
+        for cle in sorted(self.tampons):
+            quantiles = self.quantiles(cle)
+            mesures.append({
+                'genre': cle[0], 'nom': cle[1], 'executions': self.executions(cle),
+                'quantiles': {canal: dict(zip([f'p{round(q * 100)}' for q in QUANTILES_MESURES], map(float, ligne)))
+                              for canal, ligne in zip(CANAUX_MESURES, quantiles)},
+                'sommes': dict(zip(CANAUX_MESURES, map(float, self.sommes[cle]))),
+                'histogramme_durees': {'bornes_s': BORNES_DUREES, 'comptes': self.histogrammes[cle].tolist()}
+            })
+        return json.dumps({'fenetre': self.fenetre, 'horodatage': datetime.now().isoformat(), 'mesures': mesures},
+                          indent=2, ensure_ascii=False)
+
+    def exporter_prometheus(self):
+        """Mesures au format texte d'exposition Prometheus.
+
+        Histogramme cumulé des durées, et pour les autres canaux un résumé
+        dont les quantiles portent sur la fenêtre glissante.
+        """
+        def etiquettes(cle, **autres):
+            paires = {'genre': cle[0], 'nom': cle[1], **autres}
+            return '{' + ','.join(f'{nom}="{echapper_etiquette(valeur)}"' for nom, valeur in paires.items()) + '}'
+
+        cles = sorted(self.tampons)
+        lignes = ['# HELP csg_rendu_duree_secondes Durée de rendu des sections et méthodes du dashboard',
+                  '# TYPE csg_rendu_duree_secondes histogram']
+        for cle in cles:
+            cumul = np.cumsum(self.histogrammes[cle])
+            for borne, compte in zip(BORNES_DUREES + ['+Inf'], cumul):
+                lignes.append(f'csg_rendu_duree_secondes_bucket{etiquettes(cle, le=borne)} {compte}')
+            lignes.append(f'csg_rendu_duree_secondes_sum{etiquettes(cle)} {self.sommes[cle][0]}')
+            lignes.append(f'csg_rendu_duree_secondes_count{etiquettes(cle)} {cumul[-1]}')
+
+        for position, canal in enumerate(CANAUX_MESURES[1:], start=1):
+            nom = f'csg_rendu_{canal}' + ('_secondes' if canal in ('preparation', 'figures') else '')
+            lignes += [f'# HELP {nom} Rendu du dashboard : {canal} (quantiles sur la fenêtre glissante)',
+                       f'# TYPE {nom} summary']
+            for cle in cles:
+                for quantile, valeur in zip(QUANTILES_MESURES, self.quantiles(cle)[position]):
+                    lignes.append(f'{nom}{etiquettes(cle, quantile=quantile)} {valeur}')
+                lignes.append(f'{nom}_sum{etiquettes(cle)} {self.sommes[cle][position]}')
+                lignes.append(f'{nom}_count{etiquettes(cle)} {self.executions(cle)}')
+        return '\n'.join(lignes) + '\n'
+
+    def ecrire(self, chemin, format_=None):
+        """Écrit les mesures dans un fichier, remplacé d'un bloc (format déduit de l'extension .prom ou .json)"""
+        if format_ is None:
+            format_ = 'prometheus' if chemin.endswith('.prom') else 'json'
+        contenu = self.exporter_prometheus() if format_ == 'prometheus' else self.exporter_json()
+        temporaire = f'{chemin}.{os.getpid()}.tmp'
+        with open(temporaire, 'w', encoding='utf-8') as fichier:
+            fichier.write(contenu)
+        os.replace(temporaire, chemin)
+
+
+# Fichier réécrit à la fin de chaque exécution (collecteur de fichiers texte Prometheus, benchmarks)
+EXPORT_MESURES = os.environ.get('CSG_EXPORT_MESURES', '')
+
+
+@st.cache_resource(show_spinner=False)
+def obtenir_mesures_rendu(fenetre=FENETRE_MESURES):
+    """Mesures de rendu uniques pour le processus"""
+    return MesuresRendu(fenetre)
+
+
+class MesureRendu:
+    """Mesure d'un rendu : durée, temps de construction des figures et messages émis.
+
+    Les mesures imbriquées forment une pile : le temps de construction des
+    figures est compté dans chaque mesure ouverte, la préparation des
+    données étant le reste de la durée.
+    """
+
+    def __init__(self, mesures, cle, pile, compteur):
+        self.mesures = mesures
+        self.cle = cle
+        self.pile = pile
+        self.compteur = compteur
+        self.figures = 0.0
+        self.duree = 0.0
+
+    def __enter__(self):
+        self.elements = self.compteur.elements if self.compteur else 0
+        self.octets = self.compteur.octets_figures if self.compteur else 0
+        self.pile.append(self)
+        self.debut = time.perf_counter()
+        return self
+
+    def __exit__(self, *exception):
+        self.duree = time.perf_counter() - self.debut
+        self.pile.remove(self)
+        elements = self.compteur.elements - self.elements if self.compteur else 0
+        octets = self.compteur.octets_figures - self.octets if self.compteur else 0
+        self.mesures.enregistrer(self.cle, [self.duree, max(self.duree - self.figures, 0), self.figures,
+                                            octets, elements])
+        return False
+
+
+def mesurer_methode(methode):
+    """Enveloppe une méthode de rendu du dashboard dans une mesure"""
+    @wraps(methode)
+    def mesuree(self, *args, **kwargs):
+        with self.mesurer(('methode', methode.__name__)):
+            return methode(self, *args, **kwargs)
+    return mesuree
+
+
+# Préfixes des méthodes du dashboard mesurées à chaque appel
+METHODES_MESUREES = ('create_', 'display_', 'update_')
+
+
+def instrumenter_rendu(classe):
+    """Mesure chaque méthode create_*, display_* et update_* de la classe à chaque exécution"""
+    for nom, methode in list(vars(classe).items()):
+        if callable(methode) and nom.startswith(METHODES_MESUREES):
+            setattr(classe, nom, mesurer_methode(methode))
+    return classe
+
+
+# Classe CSS associée à chaque statut de mission
+CLASSES_STATUT = {
+    'Succès': 'success',
+    'Échec': 'failure',
+    'Planifié': 'planned',
+    'Succès partiel': 'in-progress'
+}
+MISSIONS_PAR_PAGE = 20
+
+
+def html_calendrier(missions):
+    """Tableau HTML du calendrier des missions, construit par opérations vectorisées"""
+    def texte(colonne):
+        return missions[colonne].astype(str).map(html.escape)
+
+    classes = missions['statut'].astype(str).map(CLASSES_STATUT).fillna('')
+    dates = missions['date_lancement'].dt.strftime('%d/%m/%Y')
+    lignes = (
+        '<tr><td><b>' + texte('mission_id') + '</b><br><i>' + texte('lanceur') + '</i></td>'
+        + '<td><b>' + texte('charge_utile') + '</b><br>Client: ' + texte('client') + '</td>'
+        + '<td><b>Lancement:</b> ' + dates + '<br>Orbite: ' + texte('orbite') + '</td>'
+        + '<td><div class="mission-status ' + classes + '">' + texte('statut') + '</div></td></tr>'
+    )
+    return '<table class="mission-table">' + ''.join(lignes) + '</table>'
 
+
+@instrumenter_rendu
 class GuyaneAerospatialeDashboard:
     def __init__(self):
-        self.lanceurs = self.define_lanceurs()
-        self.missions_data = self.initialize_missions_data()
-        self.traffic_data = self.initialize_traffic_data()
-        self.clients_data = self.initialize_clients_data()
-        
+        self.mesures_rendu = obtenir_mesures_rendu()
+        self.compteur_messages = obtenir_compteur_messages()
+        self.pile_mesures = []
+        with self.mesurer(('methode', '__init__')):
+            # Les données de référence sont construites une fois par processus,
+            # seules les modifications de la session sont conservées par spectateur
+            self.entrepot = obtenir_entrepot(self)
+            self.session = obtenir_donnees_session(self.entrepot)
+            self.planificateur = obtenir_planificateur()
+            self.cache_figures = obtenir_cache_figures()
+            self.lanceurs = self.entrepot.lanceurs
+            self.clients_data = self.entrepot.clients_data
+        self.filtres = {}
+        self.periodes_comparees = PERIODES_COMPAREES
+        self.pipeline = None
+        profil_demarrage.jalon('données')
+
+    @property
+    def missions_data(self):
+        """Missions de la session courante retenues par les filtres de la sidebar"""
+        return self.session.selection(self.filtres).missions
+
+    @property
+    def cube(self):
+        """Agrégats lanceur × statut × année des missions filtrées"""
+        return self.session.selection(self.filtres).cube
+
+    @property
+    def matrices(self):
+        """Tableaux croisés des missions filtrées"""
+        return self.session.selection(self.filtres).matrices
+
+    @property
+    def cumuls(self):
+        """Cumuls temporels des missions de la session (toutes périodes, filtrés à la requête)"""
+        return self.session.cumuls()
+
+    def filtres_sidebar(self, controls):
+        """Filtres du moteur d'index correspondant aux contrôles de la sidebar"""
+        return {
+            'lanceurs': tuple(controls['lanceurs_selectionnes']),
+            'debut': pd.Timestamp(controls['date_debut']),
+            # La date de fin est incluse jusqu'à la dernière nanoseconde du jour
+            'fin': pd.Timestamp(controls['date_fin']) + pd.Timedelta(days=1) - pd.Timedelta(1, 'ns')
+        }
+
+    def combiner_filtres(self, **filtres):
+        """Ajoute des filtres à ceux de la sidebar (intersection pour les lanceurs)"""
+        combines = dict(self.filtres)
+        for cle, valeurs in filtres.items():
+            if valeurs is None:
+                continue
+            if combines.get(cle) is not None:
+                valeurs = tuple(valeur for valeur in valeurs if valeur in combines[cle])
+            combines[cle] = tuple(valeurs)
+        return combines
+
+    def afficher_figure(self, nom, donnees, construire, serie=None, **parametres):
+        """Affiche une figure, reprise du cache partagé si ses données n'ont pas changé.
+
+        `serie` (dictionnaire x, y et éventuellement groupe, empile) désigne une
+        série temporelle : elle est réduite par LTTB au budget de points du
+        graphique avant la construction, sauf si la pleine résolution est
+        demandée sous le graphique.
+        """
+        emplacement = st.container()
+        if serie is not None:
+            reduites = reduire_series(donnees, budget=BUDGETS_POINTS.get(nom, BUDGET_POINTS_DEFAUT), **serie)
+            if len(reduites) < len(donnees):
+                pleine_resolution = st.toggle(
+                    f"🔍 Pleine résolution ({len(reduites)} / {len(donnees)} points affichés)",
+                    key=f'pleine_resolution_{nom}')
+                if not pleine_resolution:
+                    donnees = reduites
+        cle = empreinte(nom, donnees, signature_constructeur(construire), sorted(parametres.items()))
+        figure = self.cache_figures.lire(cle)
+        if figure is None and self.pipeline is not None:
+            # Construite en parallèle, affichée à cet emplacement à la fermeture du pipeline
+            self.pipeline.soumettre(emplacement, cle, construire, donnees)
+            return
+        if figure is None:
+            debut = time.perf_counter()
+            figure = construire(donnees)
+            self.noter_figures(time.perf_counter() - debut)
+            self.cache_figures.inserer(cle, figure)
+        emplacement.plotly_chart(figure, use_container_width=True)
+
+    def selectionner_section(self, cle, libelles):
+        """Navigation paresseuse : retourne la section active, seule à être calculée"""
+        section = st.segmented_control(cle, libelles, default=libelles[0], key=cle,
+                                       label_visibility='collapsed')
+        return section or libelles[0]
+
+    def mesurer(self, cle):
+        """Mesure de rendu (genre, nom) enregistrée dans les mesures du processus"""
+        return MesureRendu(self.mesures_rendu, cle, self.pile_mesures, self.compteur_messages)
+
+    def noter_figures(self, duree):
+        """Ajoute un temps de construction de figures aux mesures ouvertes"""
+        for mesure in self.pile_mesures:
+            mesure.figures += duree
+
+    def enregistrer_temps_section(self, section, duree):
+        """Conserve le dernier temps de rendu (en secondes) de chaque section"""
+        st.session_state.setdefault('temps_sections', {})[section] = duree
+
+    def display_temps_sections(self):
+        """Affiche dans la sidebar les temps de rendu des sections visitées"""
+        temps = st.session_state.get('temps_sections', {})
+        with st.sidebar.expander("⏱️ Temps de rendu des sections"):
+            for section, duree in temps.items():
+                st.markdown(f"- {section} : **{duree * 1000:.0f} ms**")
+
+    def couleurs_lanceurs(self):
+        """Couleur de chaque lanceur pour les graphiques"""
+        return {lanceur: info['couleur'] for lanceur, info in self.lanceurs.items()}
+
     def define_lanceurs(self):
         """Définit les lanceurs utilisés en Guyane"""
         return {
@@ -150,110 +3189,55 @@ class GuyaneAerospatialeDashboard:
             }
         }
     
-    def initialize_missions_data(self):
+    def initialize_missions_data(self, n_missions=NOMBRE_MISSIONS):
         """Initialise les données des missions"""
-        types_mission = ['Commercial', 'Institutionnel', 'Scientifique', 'Militaire', 'Observation Terre']
-        clients = ['ESA', 'NASA', 'CNES', 'Eutelsat', 'SES', 'Intelsat', 'OneWeb', 'Airbus', 'Thales', 'SpaceX (Transports)']
-        orbites = ['GEO', 'LEO', 'SSO', 'MEO', 'HEO', 'Lunar Transfer']
-        
-        missions = []
-        for i in range(100):  # 100 missions simulées
-            annee = random.randint(2002, 2025)
-            mois = random.randint(1, 12)
-            jour = random.randint(1, 28)
-            
-            date_lancement = datetime(annee, mois, jour)
-            lanceur = random.choice(list(self.lanceurs.keys()))
-            
-            if random.random() > 0.1:  # 90% de succès
-                statut = 'Succès'
-            else:
-                statut = random.choices(['Échec', 'Succès partiel'], weights=[0.7, 0.3])[0]
-            
-            missions.append({
-                'mission_id': f'{random.choice(["VA", "VV", "VS", "AR"])}{random.randint(200, 299)}',
-                'lanceur': lanceur,
-                'date_lancement': date_lancement,
-                'client': random.choice(clients),
-                'type_mission': random.choice(types_mission),
-                'orbite': random.choice(orbites),
-                'statut': statut,
-                'charge_utile': f'Satellite {random.choice(["Telecom", "Observation", "Scientifique", "Navigation"])} {random.randint(1, 100)}',
-                'masse_charge_utile': random.randint(100, 10000),
-                'site_lancement': random.choice(['ELA-3', 'ELS', 'ELV'])
-            })
-        
-        return pd.DataFrame(missions)
+        return self.generateur().missions(n_missions)  # 100 missions simulées par défaut
     
     def initialize_traffic_data(self):
         """Initialise les données de trafic historiques"""
-        dates = pd.date_range('2002-01-01', datetime.now(), freq='M')
-        data = []
-        
-        for date in dates:
-            for lanceur, info in self.lanceurs.items():
-                if date.year < int(info['premier_vol']):
-                    continue
-                    
-                # Base de lancements par an
-                if lanceur == 'Ariane 5':
-                    base_lancements = 7
-                elif lanceur == 'Vega':
-                    base_lancements = 3
-                elif lanceur == 'Soyuz':
-                    base_lancements = 2
-                elif lanceur == 'Vega C':
-                    if date.year < 2022:
-                        continue
-                    base_lancements = 2
-                else:
-                    base_lancements = 1
-                
-                # Variation saisonnière et aléatoire
-                lancements_mois = max(0, int(base_lancements / 12 * random.uniform(0.8, 1.2)))
-                
-                data.append({
-                    'date': date,
-                    'lanceur': lanceur,
-                    'lancements': lancements_mois,
-                    'satellites_lances': random.randint(1, 4) * lancements_mois,
-                    'masse_totale': random.randint(1000, 20000) * lancements_mois,
-                    'type_lanceur': info['type']
-                })
-        
-        return pd.DataFrame(data)
+        return self.generateur().trafic('2002-01-01', datetime.now())
+    
+    def generateur(self):
+        """Générateur de données simulées (partagé par les initialisations)"""
+        if getattr(self, '_generateur', None) is None:
+            self._generateur = GenerateurDonnees(self.lanceurs, graine=GRAINE_DONNEES)
+        return self._generateur
     
     def initialize_clients_data(self):
-        """Initialise les données des clients"""
+        """Initialise la table des clients (mêmes noms que la colonne client des missions).
+
+        Les nombres de missions et parts de marché ne sont pas stockés ici :
+        ils sont calculés à partir des missions.
+        """
         clients = {
-            'Commercial': {'part_marche': 65, 'couleur': '#0d3b66', 'pays': 'International'},
-            'ESA': {'part_marche': 15, 'couleur': '#1e5a8a', 'pays': 'Europe'},
-            'NASA': {'part_marche': 8, 'couleur': '#e37222', 'pays': 'USA'},
-            'CNES': {'part_marche': 5, 'couleur': '#f4a261', 'pays': 'France'},
-            'Autres Institutionnels': {'part_marche': 4, 'couleur': '#6f42c1', 'pays': 'International'},
-            'Militaires': {'part_marche': 3, 'couleur': '#dc3545', 'pays': 'International'}
+            'ESA': {'couleur': '#1e5a8a', 'pays': 'Europe'},
+            'NASA': {'couleur': '#e37222', 'pays': 'USA'},
+            'CNES': {'couleur': '#f4a261', 'pays': 'France'},
+            'Eutelsat': {'couleur': '#0d3b66', 'pays': 'France'},
+            'SES': {'couleur': '#2a9d8f', 'pays': 'Luxembourg'},
+            'Intelsat': {'couleur': '#6f42c1', 'pays': 'USA'},
+            'OneWeb': {'couleur': '#dc3545', 'pays': 'Royaume-Uni'},
+            'Airbus': {'couleur': '#264653', 'pays': 'Europe'},
+            'Thales': {'couleur': '#e9c46a', 'pays': 'France'},
+            'SpaceX (Transports)': {'couleur': '#8d99ae', 'pays': 'USA'}
         }
         
-        data = []
-        for client, info in clients.items():
-            data.append({
-                'client': client,
-                'part_marche': info['part_marche'],
-                'couleur': info['couleur'],
-                'pays': info['pays'],
-                'missions_total': random.randint(5, 50),
-                'satellites_lances': random.randint(10, 200)
-            })
-        
-        return pd.DataFrame(data)
+        return pd.DataFrame([{'client': client, **info} for client, info in clients.items()])
     
     def update_live_data(self):
-        """Met à jour les données en temps réel"""
+        """Met à jour les données en temps réel.
+
+        Avec un flux direct (CSG_FLUX), les missions arrivent par l'ingestion
+        asynchrone : il n'y a rien à faire ici, la version des données suffit
+        à invalider les sélections. Sinon, des missions sont simulées.
+        """
+        if self.entrepot.flux is not None:
+            return
+        
         # Simulation de nouvelles missions pour l'année en cours
         current_year = datetime.now().year
-        current_missions = self.missions_data[self.missions_data['date_lancement'].dt.year == current_year]
         
-        if len(current_missions) < 12:  # Ajouter de nouvelles missions si nécessaire
+        if self.session.cube.missions_annee(current_year) < 12:  # Ajouter de nouvelles missions si nécessaire
             new_mission = {
                 'mission_id': f'VV{random.randint(230, 250)}',
                 'lanceur': random.choice(['Vega', 'Vega C', 'Ariane 5']),
@@ -267,7 +3251,7 @@ class GuyaneAerospatialeDashboard:
                 'site_lancement': random.choice(['ELA-3', 'ELV'])
             }
             
-            self.missions_data = pd.concat([self.missions_data, pd.DataFrame([new_mission])], ignore_index=True)
+            self.session.ajouter_mission(new_mission)
     
     def display_header(self):
         """Affiche l'en-tête du dashboard"""
@@ -283,22 +3267,42 @@ class GuyaneAerospatialeDashboard:
         current_time = datetime.now().strftime('%H:%M:%S')
         st.sidebar.markdown(f"**🕐 Dernière mise à jour: {current_time}**")
     
+    def afficher_panneau_live(self, panneau):
+        """Exécute un panneau live dans un fragment rafraîchi par le planificateur.
+
+        Seul le fragment est ré-exécuté à chaque échéance : les autres onglets,
+        la carte et les graphiques statiques ne sont pas redessinés.
+        """
+        cadence = self.cadence_live if self.auto_refresh else None
+        st.fragment(panneau, run_every=cadence)()
+
+    def panneau_metriques_live(self):
+        """Panneau live des indicateurs clés (met à jour les données à chaque échéance)"""
+        self.planificateur.verifier_cadence()
+        self.update_live_data()
+        self.display_key_metrics()
+        if self.auto_refresh:
+            st.caption(f"🔄 Actualisé à {datetime.now().strftime('%H:%M:%S')} "
+                       f"- prochaine mise à jour dans {self.cadence_live} s")
+        if self.entrepot.flux is not None:
+            version, statistiques = self.entrepot.flux.etat()
+            st.caption(f"📡 Flux direct : version {version} - "
+                       f"{statistiques['lancements']} lancements, {statistiques['statuts']} statuts, "
+                       f"{statistiques['rejetes']} rejetés")
+
     def display_key_metrics(self):
         """Affiche les métriques clés du spatial"""
         st.markdown('<h3 class="section-header">📊 INDICATEURS CLÉS DU CENTRE SPATIAL</h3>', 
                    unsafe_allow_html=True)
         
-        # Calcul des métriques
-        missions_total = len(self.missions_data)
-        missions_reussies = len(self.missions_data[self.missions_data['statut'] == 'Succès'])
-        missions_planifiees = len(self.missions_data[
-            (self.missions_data['statut'] == 'Planifié') & 
-            (self.missions_data['date_lancement'] > datetime.now())
-        ])
+        # Calcul des métriques (lues dans le cube d'agrégats)
+        missions_total = self.cube.total()
+        missions_reussies = int(self.cube.par_statut().get('Succès', 0))
+        missions_planifiees = self.cube.planifiees_apres(datetime.now())
         taux_reussite = (missions_reussies / missions_total * 100) if missions_total > 0 else 0
         
-        # Satellites lancés
-        satellites_total = self.traffic_data['satellites_lances'].sum()
+        # Satellites lancés (lus dans les cumuls du trafic, sans parcourir la table)
+        satellites_total = self.entrepot.cumuls['trafic'].somme('satellites_lances', self.filtres)
         
         col1, col2, col3, col4 = st.columns(4)
         
@@ -335,48 +3339,40 @@ class GuyaneAerospatialeDashboard:
         st.markdown('<h3 class="section-header">🏛️ VUE D\'ENSEMBLE DES LANCEURS</h3>', 
                    unsafe_allow_html=True)
         
-        tab1, tab2, tab3, tab4 = st.tabs(["Performance", "Capacités", "Évolution", "Détails Techniques"])
+        onglet = self.selectionner_section('onglet_lanceurs', ["Performance", "Capacités", "Évolution", "Détails Techniques"])
         
-        with tab1:
+        if onglet == "Performance":
             col1, col2 = st.columns(2)
             
             with col1:
                 # Performance des lanceurs
-                success_rates = []
-                for lanceur, info in self.lanceurs.items():
-                    missions_lanceur = self.missions_data[self.missions_data['lanceur'] == lanceur]
-                    if len(missions_lanceur) > 0:
-                        succes = len(missions_lanceur[missions_lanceur['statut'] == 'Succès'])
-                        taux = (succes / len(missions_lanceur)) * 100
-                        success_rates.append({
-                            'lanceur': lanceur,
-                            'taux_reussite': taux,
-                            'vols_total': len(missions_lanceur)
-                        })
-                
-                df_success = pd.DataFrame(success_rates)
-                fig = px.bar(df_success, 
+                vols = self.cube.vols_par_lanceur()
+                succes = self.cube.succes_par_lanceur()
+                df_success = pd.DataFrame({
+                    'lanceur': vols.index,
+                    'taux_reussite': succes / vols.where(vols > 0) * 100,
+                    'vols_total': vols
+                })[vols.to_numpy() > 0]
+                self.afficher_figure('taux_reussite_lanceurs', df_success, constructeur(px.bar, 
                             x='lanceur', 
                             y='taux_reussite',
                             title='Taux de Réussite par Lanceur (%)',
                             color='lanceur',
-                            color_discrete_map={lanceur: info['couleur'] for lanceur, info in self.lanceurs.items()})
-                fig.update_layout(yaxis_range=[0, 100])
-                st.plotly_chart(fig, use_container_width=True)
+                            color_discrete_map=self.couleurs_lanceurs(),
+                            mise_en_page=dict(yaxis_range=[0, 100])))
             
             with col2:
                 # Répartition des vols
-                vol_counts = self.missions_data['lanceur'].value_counts().reset_index()
-                vol_counts.columns = ['lanceur', 'nombre_vols']
-                fig = px.pie(vol_counts, 
+                vol_counts = self.cube.vols_par_lanceur()
+                vol_counts = vol_counts[vol_counts > 0].rename_axis('lanceur').reset_index(name='nombre_vols')
+                self.afficher_figure('vols_lanceurs', vol_counts, constructeur(px.pie, 
                             values='nombre_vols', 
                             names='lanceur',
                             title='Répartition des Vols par Lanceur',
                             color='lanceur',
-                            color_discrete_map={lanceur: info['couleur'] for lanceur, info in self.lanceurs.items()})
-                st.plotly_chart(fig, use_container_width=True)
+                            color_discrete_map=self.couleurs_lanceurs()))
         
-        with tab2:
+        if onglet == "Capacités":
             col1, col2 = st.columns(2)
             
             with col1:
@@ -391,13 +3387,12 @@ class GuyaneAerospatialeDashboard:
                         })
                 
                 df_capacity = pd.DataFrame(capacities)
-                fig = px.bar(df_capacity, 
+                self.afficher_figure('capacite_geo', df_capacity, constructeur(px.bar, 
                             x='lanceur', 
                             y='capacite_kg',
                             title='Capacité en Orbite Géostationnaire (kg)',
                             color='lanceur',
-                            color_discrete_map={lanceur: info['couleur'] for lanceur, info in self.lanceurs.items()})
-                st.plotly_chart(fig, use_container_width=True)
+                            color_discrete_map=self.couleurs_lanceurs()))
             
             with col2:
                 # Comparaison des capacités
@@ -417,37 +3412,34 @@ class GuyaneAerospatialeDashboard:
                         })
                 
                 df_comparison = pd.DataFrame(comparison_data)
-                fig = px.bar(df_comparison, 
+                self.afficher_figure('comparaison_capacites', df_comparison, constructeur(px.bar, 
                             x='lanceur', 
                             y='capacite',
                             color='orbite',
                             barmode='group',
                             title='Comparaison des Capacités par Orbite',
-                            color_discrete_sequence=['#0d3b66', '#e37222'])
-                st.plotly_chart(fig, use_container_width=True)
+                            color_discrete_sequence=['#0d3b66', '#e37222']))
         
-        with tab3:
+        if onglet == "Évolution":
             # Évolution des lancements par type
-            yearly_launches = self.missions_data.groupby([
-                self.missions_data['date_lancement'].dt.year,
-                'lanceur'
-            ]).size().reset_index(name='nombre_lancements')
+            yearly_launches = self.cube.lancements_annuels(par_lanceur=True)
             
-            fig = px.line(yearly_launches, 
+            self.afficher_figure('lancements_annuels_lanceurs', yearly_launches, constructeur(px.line, 
                          x='date_lancement', 
                          y='nombre_lancements',
                          color='lanceur',
                          title='Évolution des Lancements par Lanceur (2002-2025)',
-                         color_discrete_map={lanceur: info['couleur'] for lanceur, info in self.lanceurs.items()})
-            st.plotly_chart(fig, use_container_width=True)
+                         color_discrete_map=self.couleurs_lanceurs()),
+                         serie=dict(x='date_lancement', y='nombre_lancements', groupe='lanceur'))
         
-        with tab4:
+        if onglet == "Détails Techniques":
             # Tableau détaillé des lanceurs
             lanceur_details = []
+            vols = self.cube.vols_par_lanceur()
+            succes_lanceurs = self.cube.succes_par_lanceur()
             for lanceur, info in self.lanceurs.items():
-                missions_lanceur = self.missions_data[self.missions_data['lanceur'] == lanceur]
-                succes = len(missions_lanceur[missions_lanceur['statut'] == 'Succès'])
-                taux_reussite = (succes / len(missions_lanceur) * 100) if len(missions_lanceur) > 0 else 0
+                vols_lanceur = int(vols.get(lanceur, 0))
+                taux_reussite = (succes_lanceurs.get(lanceur, 0) / vols_lanceur * 100) if vols_lanceur > 0 else 0
                 
                 lanceur_details.append({
                     'Lanceur': info['nom_complet'],
@@ -455,7 +3447,7 @@ class GuyaneAerospatialeDashboard:
                     'Constructeur': info['constructeur'],
                     'Premier Vol': info['premier_vol'],
                     'Statut': info['statut'],
-                    'Vols Total': len(missions_lanceur),
+                    'Vols Total': vols_lanceur,
                     'Taux Réussite': f"{taux_reussite:.1f}%",
                     'Capacité LEO (kg)': info.get('capacite_orbite_bas', 'N/A'),
                     'Capacité GTO (kg)': info.get('capacite_orbite_geo', 'N/A')
@@ -468,310 +3460,337 @@ class GuyaneAerospatialeDashboard:
         st.markdown('<h3 class="section-header">🚀 MISSIONS EN TEMPS RÉEL</h3>', 
                    unsafe_allow_html=True)
         
-        tab1, tab2, tab3 = st.tabs(["Calendrier des Missions", "Statistiques", "Analyse des Orbites"])
+        onglet = self.selectionner_section('onglet_missions', ["Calendrier des Missions", "Statistiques", "Analyse des Orbites"])
         
-        with tab1:
-            # Filtres pour les missions
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                lanceur_filtre = st.selectbox("Lanceur:", 
-                                            ['Tous'] + list(self.lanceurs.keys()))
-            with col2:
-                statut_filtre = st.selectbox("Statut:", 
-                                           ['Tous', 'Succès', 'Échec', 'Succès partiel', 'Planifié'])
-            with col3:
-                client_filtre = st.selectbox("Client:", 
-                                           ['Tous'] + list(self.clients_data['client'].unique()))
-            
-            # Application des filtres
-            missions_filtrees = self.missions_data.copy()
-            if lanceur_filtre != 'Tous':
-                missions_filtrees = missions_filtrees[missions_filtrees['lanceur'] == lanceur_filtre]
-            if statut_filtre != 'Tous':
-                missions_filtrees = missions_filtrees[missions_filtrees['statut'] == statut_filtre]
-            if client_filtre != 'Tous':
-                missions_filtrees = missions_filtrees[missions_filtrees['client'] == client_filtre]
-            
-            # Trier par date
-            missions_filtrees = missions_filtrees.sort_values('date_lancement', ascending=False)
-            
-            # Affichage des missions
-            for _, mission in missions_filtrees.head(20).iterrows():
-                status_class = ""
-                if mission['statut'] == 'Succès':
-                    status_class = "success"
-                elif mission['statut'] == 'Échec':
-                    status_class = "failure"
-                elif mission['statut'] == 'Planifié':
-                    status_class = "planned"
-                elif mission['statut'] == 'Succès partiel':
-                    status_class = "in-progress"
-                
-                col1, col2, col3, col4 = st.columns([1, 2, 2, 1])
-                with col1:
-                    st.markdown(f"**{mission['mission_id']}**")
-                    st.markdown(f"*{mission['lanceur']}*")
-                with col2:
-                    st.markdown(f"**{mission['charge_utile']}**")
-                    st.markdown(f"Client: {mission['client']}")
-                with col3:
-                    date_str = mission['date_lancement'].strftime('%d/%m/%Y')
-                    st.markdown(f"**Lancement:** {date_str}")
-                    st.markdown(f"Orbite: {mission['orbite']}")
-                with col4:
-                    st.markdown(f"<div class='mission-status {status_class}'>{mission['statut']}</div>", 
-                               unsafe_allow_html=True)
-                
-                st.markdown("---")
+        if onglet == "Calendrier des Missions":
+            self.afficher_panneau_live(self.create_calendrier_missions)
         
-        with tab2:
+        if onglet == "Statistiques":
             col1, col2 = st.columns(2)
             
             with col1:
-                # Répartition des statuts
-                status_counts = self.missions_data['statut'].value_counts()
-                fig = px.pie(values=status_counts.values, 
-                            names=status_counts.index,
-                            title='Répartition des Statuts de Mission')
-                st.plotly_chart(fig, use_container_width=True)
+                # Répartition des statuts, lue dans le cube des missions filtrées
+                status_counts = self.cube.par_statut().rename_axis('statut')
+                status_counts = status_counts[status_counts > 0].reset_index(name='nombre')
+                self.afficher_figure('statuts_missions', status_counts, constructeur(px.pie, 
+                            values='nombre', 
+                            names='statut',
+                            title='Répartition des Statuts de Mission'))
             
             with col2:
                 # Missions par type
-                type_counts = self.missions_data['type_mission'].value_counts()
-                fig = px.bar(x=type_counts.values, 
-                            y=type_counts.index,
+                type_counts = self.matrices.repartition('type_mission')
+                type_counts = type_counts[type_counts > 0].reset_index(name='nombre')
+                self.afficher_figure('types_missions', type_counts, constructeur(px.bar, 
+                            x='nombre', 
+                            y='type_mission',
                             orientation='h',
                             title='Nombre de Missions par Type',
-                            color=type_counts.values,
-                            color_continuous_scale='Viridis')
-                st.plotly_chart(fig, use_container_width=True)
+                            color='nombre',
+                            color_continuous_scale='Viridis'))
         
-        with tab3:
+        if onglet == "Analyse des Orbites":
             col1, col2 = st.columns(2)
             
             with col1:
                 # Répartition des orbites
-                orbite_counts = self.missions_data['orbite'].value_counts()
-                fig = px.pie(values=orbite_counts.values, 
-                            names=orbite_counts.index,
-                            title='Répartition des Types d\'Orbite')
-                st.plotly_chart(fig, use_container_width=True)
+                orbite_counts = self.matrices.repartition('orbite')
+                orbite_counts = orbite_counts[orbite_counts > 0].reset_index(name='nombre')
+                self.afficher_figure('orbites', orbite_counts, constructeur(px.pie, 
+                            values='nombre', 
+                            names='orbite',
+                            title='Répartition des Types d\'Orbite'))
             
             with col2:
                 # Orbites par lanceur
-                orbite_lanceur = pd.crosstab(self.missions_data['lanceur'], self.missions_data['orbite'])
-                fig = px.imshow(orbite_lanceur,
+                orbite_lanceur = self.matrices.table('lanceur_orbite')
+                self.afficher_figure('heatmap_orbites', orbite_lanceur, constructeur(px.imshow,
                                title='Orbites par Lanceur (Heatmap)',
-                               color_continuous_scale='Blues')
-                st.plotly_chart(fig, use_container_width=True)
+                               color_continuous_scale='Blues'))
+    
+    def create_calendrier_missions(self):
+        """Affiche le calendrier des missions filtrées"""
+        # Filtres pour les missions
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            lanceur_filtre = st.selectbox("Lanceur:", 
+                                        ['Tous'] + list(self.lanceurs.keys()))
+        with col2:
+            statut_filtre = st.selectbox("Statut:", 
+                                       ['Tous', 'Succès', 'Échec', 'Succès partiel', 'Planifié'])
+        with col3:
+            client_filtre = st.selectbox("Client:", 
+                                       ['Tous'] + list(self.clients_data['client'].unique()))
+        
+        # Application des filtres (combinés à ceux de la sidebar, résolus par le moteur d'index)
+        filtres = self.combiner_filtres(
+            lanceurs=None if lanceur_filtre == 'Tous' else [lanceur_filtre],
+            statuts=None if statut_filtre == 'Tous' else [statut_filtre],
+            clients=None if client_filtre == 'Tous' else [client_filtre]
+        )
+        selection = self.session.selection(filtres)
+        
+        # Pagination : seules les missions de la page sont triées et mises en forme
+        nombre_pages = max(1, -(-len(selection) // MISSIONS_PAR_PAGE))
+        if st.session_state.get('page_calendrier', 1) > nombre_pages:
+            st.session_state['page_calendrier'] = nombre_pages
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            page = st.number_input("Page", min_value=1, max_value=nombre_pages, value=1, step=1,
+                                   key='page_calendrier')
+        with col2:
+            st.caption(f"{len(selection)} missions - page {page}/{nombre_pages}")
+        
+        page_missions = selection.page(page, MISSIONS_PAR_PAGE)
+        
+        # Affichage des missions en un seul bloc HTML
+        st.markdown(html_calendrier(page_missions), unsafe_allow_html=True)
     
     def create_clients_analysis(self):
         """Analyse des clients et marchés"""
         st.markdown('<h3 class="section-header">🏢 ANALYSE DES CLIENTS ET MARCHÉS</h3>', 
                    unsafe_allow_html=True)
         
-        tab1, tab2, tab3 = st.tabs(["Parts de Marché", "Évolution Clients", "Analyse Géographique"])
+        onglet = self.selectionner_section('onglet_clients', ["Parts de Marché", "Évolution Clients", "Analyse Géographique"])
+        
+        # Missions et masse par client, lues dans les cumuls, puis rattachées à la dimension des clients
+        if onglet in ("Parts de Marché", "Analyse Géographique"):
+            par_client = self.cumuls.requete('annee', par='client', filtres=self.filtres)
+            metriques_clients = self.entrepot.clients.metriques(par_client['client'], missions=par_client['lignes'],
+                                                                masse=par_client['masse_charge_utile'])
         
-        with tab1:
+        if onglet == "Parts de Marché":
             col1, col2 = st.columns(2)
+            couleurs_clients = self.entrepot.clients.couleurs
             
             with col1:
                 # Parts de marché
-                fig = px.pie(self.clients_data, 
-                            values='part_marche', 
+                self.afficher_figure('parts_marche', metriques_clients, constructeur(px.pie, 
+                            values='missions', 
                             names='client',
                             title='Répartition du Marché des Lancements',
                             color='client',
-                            color_discrete_map={row['client']: row['couleur'] for _, row in self.clients_data.iterrows()})
-                st.plotly_chart(fig, use_container_width=True)
+                            color_discrete_map=couleurs_clients))
             
             with col2:
-                # Satellites lancés par client
-                fig = px.bar(self.clients_data, 
+                # Masse lancée par client
+                self.afficher_figure('masse_clients', metriques_clients, constructeur(px.bar, 
                             x='client', 
-                            y='satellites_lances',
-                            title='Satellites Lancés par Client',
+                            y='masse',
+                            title='Masse Lancée par Client (kg)',
                             color='client',
-                            color_discrete_map={row['client']: row['couleur'] for _, row in self.clients_data.iterrows()})
-                st.plotly_chart(fig, use_container_width=True)
+                            color_discrete_map=couleurs_clients))
         
-        with tab2:
+        if onglet == "Évolution Clients":
             # Évolution des clients dans le temps
-            client_evolution = self.missions_data.groupby([
-                self.missions_data['date_lancement'].dt.year,
-                'client'
-            ]).size().reset_index(name='nombre_missions')
+            client_evolution = self.cumuls.requete('annee', par='client', filtres=self.filtres).rename(
+                columns={'lignes': 'nombre_missions'}
+            )
             
-            fig = px.area(client_evolution, 
+            self.afficher_figure('evolution_clients', client_evolution, constructeur(px.area, 
                          x='date_lancement', 
                          y='nombre_missions',
                          color='client',
                          title='Évolution des Missions par Client',
-                         color_discrete_sequence=px.colors.qualitative.Set3)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with tab3:
-            # Analyse géographique (simulée)
-            pays_data = []
-            for client, info in self.clients_data.iterrows():
-                pays_data.append({
-                    'pays': self.clients_data.loc[client, 'pays'],
-                    'missions': self.clients_data.loc[client, 'missions_total'],
-                    'part_marche': self.clients_data.loc[client, 'part_marche']
-                })
-            
-            df_pays = pd.DataFrame(pays_data)
-            df_pays = df_pays.groupby('pays').agg({
-                'missions': 'sum',
-                'part_marche': 'sum'
-            }).reset_index()
+                         color_discrete_sequence=px.colors.qualitative.Set3),
+                         serie=dict(x='date_lancement', y='nombre_missions', groupe='client', empile=True))
+        
+        if onglet == "Analyse Géographique":
+            # Missions et parts de marché par pays des clients
+            df_pays = self.entrepot.clients.par_pays(metriques_clients)
             
             col1, col2 = st.columns(2)
             
             with col1:
-                fig = px.pie(df_pays, 
+                self.afficher_figure('missions_pays', df_pays, constructeur(px.pie, 
                             values='missions', 
                             names='pays',
-                            title='Répartition Géographique des Missions')
-                st.plotly_chart(fig, use_container_width=True)
+                            title='Répartition Géographique des Missions'))
             
             with col2:
-                fig = px.bar(df_pays, 
+                self.afficher_figure('parts_marche_pays', df_pays, constructeur(px.bar, 
                             x='pays', 
                             y='part_marche',
                             title='Parts de Marché par Zone Géographique (%)',
                             color='pays',
-                            color_discrete_sequence=px.colors.qualitative.Pastel)
-                fig.update_layout(yaxis_tickformat='.0%')
-                st.plotly_chart(fig, use_container_width=True)
+                            color_discrete_sequence=px.colors.qualitative.Pastel,
+                            mise_en_page=dict(yaxis_tickformat='.0%')))
     
     def create_evolution_analysis(self):
         """Analyse de l'évolution du spatial guyanais"""
         st.markdown('<h3 class="section-header">📈 ÉVOLUTION DU CENTRE SPATIAL</h3>', 
                    unsafe_allow_html=True)
         
-        tab1, tab2, tab3 = st.tabs(["Évolution Temporelle", "Impact COVID", "Projections Futures"])
+        onglet = self.selectionner_section('onglet_evolution', ["Évolution Temporelle", "Impact COVID", "Projections Futures"])
         
-        with tab1:
+        if onglet == "Évolution Temporelle":
             col1, col2 = st.columns(2)
             
             with col1:
                 # Évolution du nombre de lancements
-                yearly_launches = self.missions_data.groupby(
-                    self.missions_data['date_lancement'].dt.year
-                ).size().reset_index(name='nombre_lancements')
+                yearly_launches = self.cube.lancements_annuels()
                 
-                fig = px.line(yearly_launches, 
+                self.afficher_figure('lancements_annuels', yearly_launches, constructeur(px.line, 
                              x='date_lancement', 
                              y='nombre_lancements',
                              title='Évolution du Nombre de Lancements Annuels',
-                             markers=True)
-                fig.update_traces(line=dict(color='#0d3b66', width=3))
-                st.plotly_chart(fig, use_container_width=True)
+                             markers=True,
+                             traces=dict(line=dict(color='#0d3b66', width=3))),
+                             serie=dict(x='date_lancement', y='nombre_lancements'))
             
             with col2:
                 # Évolution de la masse lancée
-                yearly_mass = self.missions_data.groupby(
-                    self.missions_data['date_lancement'].dt.year
-                )['masse_charge_utile'].sum().reset_index()
+                yearly_mass = self.cumuls.requete('annee', filtres=self.filtres)
                 
-                fig = px.area(yearly_mass, 
+                self.afficher_figure('masse_annuelle', yearly_mass, constructeur(px.area, 
                              x='date_lancement', 
                              y='masse_charge_utile',
                              title='Évolution de la Masse Totale Lancée (kg)',
-                             color_discrete_sequence=['#e37222'])
-                st.plotly_chart(fig, use_container_width=True)
+                             color_discrete_sequence=['#e37222']),
+                             serie=dict(x='date_lancement', y='masse_charge_utile'))
         
-        with tab2:
-            # Analyse de l'impact COVID sur le spatial
-            st.subheader("Impact de la Pandémie COVID-19 sur les Activités Spatiales")
+        if onglet == "Impact COVID":
+            # Comparaison de deux périodes choisies dans la sidebar (pré-COVID vs COVID par défaut)
+            reference, comparee = self.periodes_comparees
+            libelle_reference, libelle_comparee = (f"{debut:%d/%m/%Y} – {fin:%d/%m/%Y}" for debut, fin in
+                                                   self.periodes_comparees)
+            if self.periodes_comparees == PERIODES_COMPAREES:
+                st.subheader("Impact de la Pandémie COVID-19 sur les Activités Spatiales")
+            else:
+                st.subheader("Comparaison de Périodes")
+            st.caption(f"{libelle_comparee} comparée à {libelle_reference} "
+                       "(périodes modifiables dans la sidebar, lanceurs sélectionnés)")
             
-            # Simulation de l'impact COVID
-            covid_period = self.missions_data[
-                (self.missions_data['date_lancement'] >= '2020-01-01') & 
-                (self.missions_data['date_lancement'] <= '2021-12-31')
-            ]
+            # Les fenêtres ne dépendent que des lanceurs choisis, pas de la période d'analyse
+            filtres = {cle: valeurs for cle, valeurs in self.filtres.items() if cle not in ('debut', 'fin')}
+            avant, apres, detail = self.session.selection(filtres).comparateur.comparer(reference, comparee)
             
-            pre_covid = self.missions_data[
-                (self.missions_data['date_lancement'] >= '2018-01-01') & 
-                (self.missions_data['date_lancement'] <= '2019-12-31')
-            ]
+            def ecart(valeur, unite='%'):
+                return f"{valeur:+.1f}{unite} vs référence" if valeur is not None else None
             
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                lancements_pre = len(pre_covid)
-                lancements_covid = len(covid_period)
-                variation = ((lancements_covid - lancements_pre) / lancements_pre) * 100
-                
                 st.metric(
-                    "Lancements Période COVID",
-                    f"{lancements_covid}",
-                    f"{variation:.1f}% vs pré-COVID"
+                    "Lancements",
+                    f"{apres['lancements']}",
+                    ecart(variation(avant['lancements'], apres['lancements']))
                 )
             
             with col2:
-                masse_pre = pre_covid['masse_charge_utile'].sum()
-                masse_covid = covid_period['masse_charge_utile'].sum()
-                variation_masse = ((masse_covid - masse_pre) / masse_pre) * 100
-                
                 st.metric(
                     "Masse Lancée",
-                    f"{masse_covid:,.0f} kg",
-                    f"{variation_masse:.1f}% vs pré-COVID"
+                    f"{apres['masse_charge_utile']:,.0f} kg",
+                    ecart(variation(avant['masse_charge_utile'], apres['masse_charge_utile']))
                 )
             
             with col3:
-                # Taux de réussite
-                succes_pre = len(pre_covid[pre_covid['statut'] == 'Succès']) / len(pre_covid) * 100
-                succes_covid = len(covid_period[covid_period['statut'] == 'Succès']) / len(covid_period) * 100
-                
+                taux_avant, taux_apres = avant['taux_reussite'], apres['taux_reussite']
                 st.metric(
                     "Taux de Réussite",
-                    f"{succes_covid:.1f}%",
-                    f"{(succes_covid - succes_pre):.1f}% vs pré-COVID"
+                    f"{taux_apres:.1f}%" if taux_apres is not None else "n/d",
+                    ecart(taux_apres - taux_avant if None not in (taux_avant, taux_apres) else None, ' pts')
                 )
-        
-        with tab3:
-            # Projections futures
-            st.subheader("Projections 2024-2030")
-            
-            # Simulation de projections
-            last_year = self.missions_data['date_lancement'].dt.year.max()
-            future_years = list(range(last_year + 1, 2031))
-            
-            projection_data = []
-            for year in future_years:
-                # Croissance basée sur les tendances historiques
-                base_lancements = 10  # Base pour les projections
-                growth_rate = random.uniform(0.05, 0.15)  # Croissance de 5-15% par an
-                
-                lancements_projetes = int(base_lancements * (1 + growth_rate) ** (year - last_year))
-                
-                projection_data.append({
-                    'annee': year,
-                    'lancements': lancements_projetes,
-                    'type': 'Projection'
-                })
-            
-            df_projection = pd.DataFrame(projection_data)
             
-            # Données historiques récentes
-            historical = self.missions_data[self.missions_data['date_lancement'].dt.year >= 2018].copy()
-            historical_yearly = historical.groupby(historical['date_lancement'].dt.year).size().reset_index(name='lancements')
-            historical_yearly['type'] = 'Historique'
-            historical_yearly = historical_yearly.rename(columns={'date_lancement': 'annee'})
-            
-            combined_data = pd.concat([historical_yearly, df_projection])
+            if len(detail):
+                # Détail par lanceur
+                lancements = detail.melt(id_vars='lanceur', value_vars=['lancements_reference', 'lancements_comparee'],
+                                         var_name='periode', value_name='lancements')
+                lancements['periode'] = lancements['periode'].map({'lancements_reference': libelle_reference,
+                                                                   'lancements_comparee': libelle_comparee})
+                self.afficher_figure('comparaison_periodes', lancements, constructeur(px.bar, 
+                             x='lanceur', 
+                             y='lancements',
+                             color='periode',
+                             barmode='group',
+                             title='Lancements par Lanceur sur les Deux Périodes',
+                             color_discrete_sequence=['#0d3b66', '#e37222']))
+                st.dataframe(detail.rename(columns={
+                    'lanceur': 'Lanceur', 'lancements_reference': 'Lancements (référence)',
+                    'lancements_comparee': 'Lancements (comparée)', 'masse_reference': 'Masse (référence, kg)',
+                    'masse_comparee': 'Masse (comparée, kg)', 'variation_lancements': 'Variation lancements (%)'
+                }).round(1), hide_index=True, use_container_width=True)
+            else:
+                st.info("Aucun lancement sur les deux périodes pour les lanceurs sélectionnés")
+        
+        if onglet == "Projections Futures":
+            # Projections futures : tendance ajustée sur l'historique, simulée sur des milliers
+            # de scénarios (recalculée seulement quand les filtres ou les données changent)
+            annuels, projection = self.session.projection(self.filtres)
+            debut_projection = int(projection['annee'].min()) + 1 if len(projection) else ANNEE_FIN_PROJECTION
+            st.subheader(f"Projections {debut_projection}-{ANNEE_FIN_PROJECTION}")
+            st.caption(f"Médiane et intervalle p5–p95 de {SCENARIOS_PROJECTION:,} scénarios de croissance "
+                       "autour de la tendance log-linéaire des lancements annuels".replace(',', ' '))
+            historique = annuels.loc[annuels['date_lancement'] >= 2018, ['date_lancement', 'lignes']].rename(
+                columns={'date_lancement': 'annee', 'lignes': 'lancements'}
+            )
+            combined_data = historique.merge(projection, on='annee', how='outer')
             
-            fig = px.line(combined_data, 
+            self.afficher_figure('projections', combined_data, partial(figure_bandes,
                          x='annee', 
                          y='lancements',
-                         color='type',
-                         title='Projection des Lancements 2024-2030',
-                         markers=True,
-                         color_discrete_map={'Historique': '#0d3b66', 'Projection': '#e37222'})
-            st.plotly_chart(fig, use_container_width=True)
+                         historique='lancements',
+                         title=f'Projection des Lancements {debut_projection}-{ANNEE_FIN_PROJECTION}'))
+    
+    def create_telemetrie(self):
+        """Panneau de télémétrie de lancement (compte à rebours, altitude, vitesse, événements)"""
+        st.markdown('<h3 class="section-header">🛰️ TÉLÉMÉTRIE DE LANCEMENT</h3>', 
+                   unsafe_allow_html=True)
+        st.caption("Source simulée - historique décimé (min/max), puis ajout des seuls nouveaux points "
+                   f"toutes les {PERIODE_TELEMETRIE:g} s")
+        # Exécution complète : les graphiques sont reconstruits, les anciennes références sont périmées
+        st.session_state.pop('telemetrie', None)
+        st.fragment(self.panneau_telemetrie, run_every=PERIODE_TELEMETRIE)()
+    
+    def construire_telemetrie(self, tampon):
+        """Mise en page du panneau et graphiques construits avec l'historique décimé"""
+        _, _, compteur = tampon.depuis(tampon.ecrits)
+        col1, col2, col3 = st.columns(3)
+        etat = {'compteur': compteur,
+                'reconstruction': time.monotonic() + DUREE_SEQUENCE_TELEMETRIE,
+                'chrono': col1.empty(), 'altitude': col2.empty(), 'vitesse': col3.empty(),
+                'derniers': None, 'graphiques': {}}
+        for canal, titre in [('altitude_km', 'Altitude (km)'), ('vitesse_m_s', 'Vitesse (m/s)')]:
+            temps, valeurs = tampon.decimer(canal, SEGMENTS_TELEMETRIE)
+            etat['graphiques'][canal] = st.line_chart(pd.DataFrame({canal: valeurs}, index=pd.Index(temps, name='T (s)')),
+                                                      x_label='T (s)', y_label=titre, height=250)
+        etat['evenements'] = st.empty()
+        st.session_state['telemetrie'] = etat
+        return etat
+    
+    def panneau_telemetrie(self):
+        """Un tick de la télémétrie, ré-exécuté toutes les PERIODE_TELEMETRIE secondes.
+
+        Les graphiques et le compteur de lecture sont conservés dans la session :
+        chaque tick n'envoie au navigateur que les points arrivés depuis le tick
+        précédent (add_rows) et rend la main sans attendre. Toutes les
+        DUREE_SEQUENCE_TELEMETRIE secondes, les graphiques repartent d'un
+        historique décimé, ce qui borne leur taille.
+        """
+        source = obtenir_telemetrie()
+        tampon = source.tampon
+        etat = st.session_state.get('telemetrie')
+        if etat is None or time.monotonic() >= etat['reconstruction']:
+            etat = self.construire_telemetrie(tampon)
+        
+        temps, valeurs, etat['compteur'] = tampon.depuis(etat['compteur'])
+        # Un ajout, même vide, à chaque tick : un élément non mis à jour par un
+        # fragment est retiré de la page à la fin de son exécution
+        for position, canal in enumerate(tampon.canaux):
+            etat['graphiques'][canal].add_rows(pd.DataFrame({canal: valeurs[position]},
+                                                            index=pd.Index(temps, name='T (s)')))
+        if len(temps):
+            etat['derniers'] = valeurs[:, -1]
+        
+        temps_vol = source.temps_vol()
+        etat['chrono'].metric("Compte à rebours" if temps_vol < 0 else "Temps de vol",
+                              f"H0 {'-' if temps_vol < 0 else '+'} {abs(temps_vol):.1f} s")
+        derniers = etat['derniers']
+        etat['altitude'].metric("Altitude", "—" if derniers is None else f"{derniers[0]:.1f} km")
+        etat['vitesse'].metric("Vitesse", "—" if derniers is None else f"{derniers[1]:.0f} m/s")
+        passes = source.evenements_passes(temps_vol)
+        etat['evenements'].markdown("\n".join(f"- **H0 + {instant} s** : {libelle}" for instant, libelle in passes)
+                                    or "_En attente de H0_")
     
     def create_csg_map(self):
         """Crée une carte du Centre Spatial Guyanais"""
@@ -796,21 +3815,20 @@ class GuyaneAerospatialeDashboard:
         df_sites = pd.DataFrame(sites_data)
         
         # Carte interactive
-        fig = px.scatter_mapbox(df_sites, 
-                              lat="Latitude", 
-                              lon="Longitude", 
-                              hover_name="Site",
-                              hover_data={"Description": True, "Status": True, "Lanceurs": True},
-                              color="Status",
-                              size=[20, 15, 15, 20],  # Taille des points
-                              zoom=10,
-                              height=500,
-                              title="Installations du Centre Spatial Guyanais")
-        
-        fig.update_layout(mapbox_style="open-street-map")
-        fig.update_layout(margin={"r":0,"t":30,"l":0,"b":0})
-        
-        st.plotly_chart(fig, use_container_width=True)
+        carte = constructeur(px.scatter_mapbox, 
+                             lat="Latitude", 
+                             lon="Longitude", 
+                             hover_name="Site",
+                             hover_data={"Description": True, "Status": True, "Lanceurs": True},
+                             color="Status",
+                             size=[20, 15, 15, 20],  # Taille des points
+                             zoom=10,
+                             height=500,
+                             title="Installations du Centre Spatial Guyanais",
+                             mise_en_page=dict(mapbox_style="open-street-map",
+                                               margin={"r":0,"t":30,"l":0,"b":0}))
+        
+        self.afficher_figure('carte_csg', df_sites, carte)
         
         # Légende et informations
         col1, col2 = st.columns(2)
@@ -839,24 +3857,40 @@ class GuyaneAerospatialeDashboard:
         
         # Filtres temporels
         st.sidebar.markdown("### 📅 Période d'analyse")
+        premiere_date, derniere_date = self.session.bornes_dates()
         date_debut = st.sidebar.date_input("Date de début", 
-                                         value=datetime(2002, 1, 1))
+                                         value=min(premiere_date, pd.Timestamp(2002, 1, 1)))
         date_fin = st.sidebar.date_input("Date de fin", 
-                                       value=datetime.now())
+                                       value=max(derniere_date, pd.Timestamp.now()))
         
-        # Filtres lanceurs
+        # Filtres lanceurs (appliqués à tous les onglets)
         st.sidebar.markdown("### 🚀 Sélection des lanceurs")
         lanceurs_selectionnes = st.sidebar.multiselect(
             "Lanceurs à afficher:",
             list(self.lanceurs.keys()),
-            default=list(self.lanceurs.keys())[:3]
+            default=list(self.lanceurs.keys())
         )
         
         # Options d'affichage
         st.sidebar.markdown("### ⚙️ Options")
         auto_refresh = st.sidebar.checkbox("Rafraîchissement automatique", value=True)
+        cadence_rafraichissement = st.sidebar.slider(
+            "Cadence de rafraîchissement (s)", 5, 300, 30, step=5,
+            disabled=not auto_refresh,
+            help="Seuls les panneaux live sont actualisés. La cadence ralentit "
+                 "automatiquement lorsque l'écran reste sans interaction."
+        )
         show_projections = st.sidebar.checkbox("Afficher les projections", value=True)
         
+        # Périodes comparées (onglet Évolution ; pré-COVID vs COVID par défaut)
+        st.sidebar.markdown("### ⚖️ Comparaison de périodes")
+        periodes_comparees = []
+        for libelle, defaut in zip(["Période de référence", "Période comparée"], PERIODES_COMPAREES):
+            periode = st.sidebar.date_input(libelle, value=(defaut[0].date(), defaut[1].date()))
+            # Pendant la saisie d'une plage, seule la date de début est renvoyée
+            periodes_comparees.append(tuple(pd.Timestamp(date) for date in periode) if len(periode) == 2
+                                      else defaut)
+        
         # Bouton de rafraîchissement manuel
         if st.sidebar.button("🔄 Rafraîchir les données"):
             self.update_live_data()
@@ -878,140 +3912,182 @@ class GuyaneAerospatialeDashboard:
             'date_fin': date_fin,
             'lanceurs_selectionnes': lanceurs_selectionnes,
             'auto_refresh': auto_refresh,
-            'show_projections': show_projections
+            'cadence_rafraichissement': cadence_rafraichissement,
+            'show_projections': show_projections,
+            'periodes_comparees': tuple(periodes_comparees)
         }
 
-    def run_dashboard(self):
-        """Exécute le dashboard complet"""
-        # Mise à jour des données live
-        self.update_live_data()
-        
-        # Sidebar
-        controls = self.create_sidebar()
-        
-        # Header
-        self.display_header()
+    def display_insights(self):
+        """Affiche les insights stratégiques"""
+        st.markdown("## 📊 INSIGHTS STRATÉGIQUES")
         
-        # Métriques clés
-        self.display_key_metrics()
-        
-        # Navigation par onglets
-        tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
-            "🚀 Lanceurs", 
-            "📅 Missions", 
-            "🏢 Clients", 
-            "📈 Évolution", 
-            "🗺️ CSG",
-            "📊 Insights",
-            "ℹ️ À Propos"
-        ])
-        
-        with tab1:
-            self.create_lanceurs_overview()
-        
-        with tab2:
-            self.create_missions_live()
-        
-        with tab3:
-            self.create_clients_analysis()
-        
-        with tab4:
-            self.create_evolution_analysis()
-        
-        with tab5:
-            self.create_csg_map()
+        col1, col2 = st.columns(2)
         
-        with tab6:
-            st.markdown("## 📊 INSIGHTS STRATÉGIQUES")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("""
-                ### 🎯 TENDANCES DU SPATIAL
-                
-                **📈 Nouveaux Marchés:**
-                - Constellation de satellites (OneWeb, Starlink)
-                - Services de lancement partagés
-                - Développement du spatial commercial
-                
-                **🛰️ Évolution Technologique:**
-                - Lanceurs réutilisables
-                - Miniaturisation des satellites
-                - Propulsion électrique
-                
-                **🌍 Défis Environnementaux:**
-                - Réduction des débris spatiaux
-                - Lanceurs plus écologiques
-                - Surveillance environnementale
-                """)
+        with col1:
+            st.markdown("""
+            ### 🎯 TENDANCES DU SPATIAL
             
-            with col2:
-                st.markdown("""
-                ### 🚨 DÉFIS OPÉRATIONNELS
-                
-                **⚡ Compétition Internationale:**
-                - Concurrence de SpaceX, China Aerospace
-                - Baisse des prix des lancements
-                - Innovation technologique rapide
-                
-                **🌫️ Dépendances Géopolitiques:**
-                - Relations internationales
-                - Contrôles à l'exportation
-                - Sécurité d'approvisionnement
-                
-                **🔧 Maintenance Infrastructure:**
-                - Modernisation des installations
-                - Adaptation aux nouveaux lanceurs
-                - Formation du personnel
-                """)
+            **📈 Nouveaux Marchés:**
+            - Constellation de satellites (OneWeb, Starlink)
+            - Services de lancement partagés
+            - Développement du spatial commercial
             
-            st.markdown("""
-            ### 💡 RECOMMANDATIONS STRATÉGIQUES
+            **🛰️ Évolution Technologique:**
+            - Lanceurs réutilisables
+            - Miniaturisation des satellites
+            - Propulsion électrique
             
-            1. **Innovation:** Développement d'Ariane 6 et nouveaux lanceurs
-            2. **Diversification:** Marchés commerciaux et services
-            3. **Collaboration:** Partenariats internationaux
-            4. **Durabilité:** Lanceurs écologiques et gestion des débris
-            5. **Formation:** Développement des compétences spatiales
+            **🌍 Défis Environnementaux:**
+            - Réduction des débris spatiaux
+            - Lanceurs plus écologiques
+            - Surveillance environnementale
             """)
         
-        with tab7:
-            st.markdown("## 📋 À propos de ce dashboard")
+        with col2:
             st.markdown("""
-            Ce dashboard présente une analyse complète des activités du Centre Spatial Guyanais,
-            port spatial de l'Europe situé en Guyane française.
-            
-            **Couverture des données:**
-            - Période: 2002-2025 (historique et projections)
-            - Lanceurs: Ariane 5, Ariane 6, Vega, Vega C, Soyuz
-            - Missions: Commerciales, institutionnelles, scientifiques
-            - Clients: ESA, NASA, opérateurs commerciaux, etc.
+            ### 🚨 DÉFIS OPÉRATIONNELS
             
-            **Sources des données:**
-            - Agence Spatiale Européenne (ESA)
-            - Centre National d'Études Spatiales (CNES)
-            - Arianespace
-            - Données publiques et modèles prédictifs
+            **⚡ Compétition Internationale:**
+            - Concurrence de SpaceX, China Aerospace
+            - Baisse des prix des lancements
+            - Innovation technologique rapide
             
-            **⚠️ Note:** Les données sont simulées pour la démonstration.
-            Les données réelles sont disponibles sur les sites officiels de l'ESA et du CNES.
+            **🌫️ Dépendances Géopolitiques:**
+            - Relations internationales
+            - Contrôles à l'exportation
+            - Sécurité d'approvisionnement
             
-            **🔒 Confidentialité:** Toutes les données sensibles sont anonymisées.
-            """)
-            
-            st.markdown("---")
-            st.markdown("""
-            **📞 Contact:**
-            - Site web: www.esa.int
-            - Email: contact@esa.int
-            - Centre Spatial Guyanais: Kourou, Guyane française
+            **🔧 Maintenance Infrastructure:**
+            - Modernisation des installations
+            - Adaptation aux nouveaux lanceurs
+            - Formation du personnel
             """)
         
-        # Rafraîchissement automatique
-        if controls['auto_refresh']:
-            time.sleep(30)  # Rafraîchissement toutes les 30 secondes
-            st.rerun()
+        st.markdown("""
+        ### 💡 RECOMMANDATIONS STRATÉGIQUES
+        
+        1. **Innovation:** Développement d'Ariane 6 et nouveaux lanceurs
+        2. **Diversification:** Marchés commerciaux et services
+        3. **Collaboration:** Partenariats internationaux
+        4. **Durabilité:** Lanceurs écologiques et gestion des débris
+        5. **Formation:** Développement des compétences spatiales
+        """)
+    
+    def display_about(self):
+        """Affiche les informations sur le dashboard"""
+        st.markdown("## 📋 À propos de ce dashboard")
+        st.markdown("""
+        Ce dashboard présente une analyse complète des activités du Centre Spatial Guyanais,
+        port spatial de l'Europe situé en Guyane française.
+        
+        **Couverture des données:**
+        - Période: 2002-2025 (historique et projections)
+        - Lanceurs: Ariane 5, Ariane 6, Vega, Vega C, Soyuz
+        - Missions: Commerciales, institutionnelles, scientifiques
+        - Clients: ESA, NASA, opérateurs commerciaux, etc.
+        
+        **Sources des données:**
+        - Agence Spatiale Européenne (ESA)
+        - Centre National d'Études Spatiales (CNES)
+        - Arianespace
+        - Données publiques et modèles prédictifs
+        
+        **⚠️ Note:** Les données sont simulées pour la démonstration.
+        Les données réelles sont disponibles sur les sites officiels de l'ESA et du CNES.
+        
+        **🔒 Confidentialité:** Toutes les données sensibles sont anonymisées.
+        """)
+        
+        st.markdown("---")
+        st.markdown("""
+        **📞 Contact:**
+        - Site web: www.esa.int
+        - Email: contact@esa.int
+        - Centre Spatial Guyanais: Kourou, Guyane française
+        """)
+
+    def display_performance(self):
+        """Onglet caché des mesures de rendu : percentiles par section et par méthode, exports"""
+        st.markdown('<h3 class="section-header">⏱️ PERFORMANCE DU RENDU</h3>',
+                   unsafe_allow_html=True)
+        st.caption(f"Percentiles sur les {self.mesures_rendu.fenetre} dernières exécutions de chaque rendu, "
+                   "toutes sessions confondues ; la préparation est la durée hors construction des figures.")
+
+        formats = {'.2f': ['p50 (ms)', 'p95 (ms)', 'p99 (ms)', 'préparation p50 (ms)', 'figures p50 (ms)',
+                           'figures p50 (ko)'], '.0f': ['éléments p50']}
+        for genre, titre in [('section', "Sections"), ('methode', "Méthodes create_* et display_*")]:
+            st.subheader(titre)
+            resume = self.mesures_rendu.resume(genre)
+            if resume.empty:
+                st.info("Aucune mesure pour le moment.")
+                continue
+            st.dataframe(resume.style.format({colonne: f'{{:{format_}}}' for format_, colonnes in formats.items()
+                                              for colonne in colonnes}),
+                         hide_index=True, use_container_width=True)
+
+        st.subheader("Export")
+        col1, col2 = st.columns(2)
+        for colonne, libelle, format_, extension in [(col1, 'JSON', 'json', 'json'),
+                                                      (col2, 'Prometheus', 'prometheus', 'prom')]:
+            with colonne:
+                chemin = st.text_input(f"Fichier {libelle}", f'mesures_csg.{extension}', key=f'export_{extension}')
+                if st.button(f"💾 Exporter ({libelle})", key=f'bouton_export_{extension}'):
+                    try:
+                        self.mesures_rendu.ecrire(chemin, format_)
+                        st.success(f"Mesures écrites dans {os.path.abspath(chemin)}")
+                    except OSError as erreur:
+                        st.error(f"Écriture impossible : {erreur}")
+
+    def run_dashboard(self):
+        """Exécute le dashboard complet"""
+        # Sidebar (ses filtres s'appliquent à toutes les sections)
+        controls = self.create_sidebar()
+        self.filtres = self.filtres_sidebar(controls)
+        self.periodes_comparees = controls['periodes_comparees']
+        
+        # Cadence des panneaux live (toute exécution complète compte comme une interaction)
+        self.auto_refresh = controls['auto_refresh']
+        self.cadence_live = self.planificateur.enregistrer_execution(controls['cadence_rafraichissement'])
+        
+        # Header
+        self.display_header()
+        
+        # Métriques clés et mise à jour des données live
+        self.afficher_panneau_live(self.panneau_metriques_live)
+        profil_demarrage.jalon('sidebar et métriques')
+        
+        # Navigation par sections : seule la section affichée est calculée
+        sections = {
+            "🚀 Lanceurs": self.create_lanceurs_overview,
+            "📅 Missions": self.create_missions_live,
+            "🏢 Clients": self.create_clients_analysis,
+            "📈 Évolution": self.create_evolution_analysis,
+            "🗺️ CSG": self.create_csg_map,
+            "🛰️ Télémétrie": self.create_telemetrie,
+            "📊 Insights": self.display_insights,
+            "ℹ️ À Propos": self.display_about
+        }
+        # Onglet caché, ouvert par ?performance=1 dans l'adresse
+        if st.query_params.get('performance'):
+            sections["⏱️ Performance"] = self.display_performance
+        section = self.selectionner_section('section_active', list(sections))
+        
+        travailleurs = obtenir_travailleurs_figures()
+        with self.mesurer(('section', section)) as mesure:
+            if travailleurs is None:
+                sections[section]()
+            else:
+                # Les figures de la section sont construites en parallèle
+                with PipelineFigures(travailleurs, self.cache_figures) as self.pipeline:
+                    sections[section]()
+                self.noter_figures(self.pipeline.duree)
+                self.pipeline = None
+        self.enregistrer_temps_section(section, mesure.duree)
+        profil_demarrage.jalon('première section')
+        profil_demarrage.terminer(IMPORTS_DIFFERES)
+        self.display_temps_sections()
+        if EXPORT_MESURES:
+            self.mesures_rendu.ecrire(EXPORT_MESURES)
 
 # Lancement du dashboard
 if __name__ == "__main__":
@@ -0,0 +1,947 @@
+# bench_dashboard.py
+"""Benchmarks du dashboard du Centre Spatial Guyanais (sans navigateur).
+
+Usage :
+    python bench_dashboard.py generateur [--tailles 100 10000 1000000]
+    python bench_dashboard.py memoire [--tailles 100 1000000]
+    python bench_dashboard.py tampon [--tailles 100000 1000000]
+    python bench_dashboard.py filtres [--tailles 10000 1000000]
+    python bench_dashboard.py stockage [--tailles 1000000] [--dossier /tmp/csg_bench]
+    python bench_dashboard.py instantane [--dossier instantane_csg] [--missions 1000000]
+    python bench_dashboard.py flux [--evenements 100000] [--port 8765]
+    python bench_dashboard.py reduction [--frequences ME D] [--budgets 500 1000]
+    python bench_dashboard.py figures [--travailleurs 1 2 4 8] [--figures 16]
+    python bench_dashboard.py specs [--missions 10000]
+    python bench_dashboard.py cumuls [--tailles 10000 1000000]
+    python bench_dashboard.py projections [--scenarios 1000 10000 100000]
+    python bench_dashboard.py periodes [--tailles 10000 1000000]
+    python bench_dashboard.py matrices [--tailles 10000 1000000]
+    python bench_dashboard.py clients [--clients 10 1000 10000]
+    python bench_dashboard.py demarrage [--repetitions 3] [--section "🚀 Lanceurs"]
+    python bench_dashboard.py --json reference.json dashboard [--tailles 100 10000 1000000]
+    python bench_dashboard.py dashboard --reference reference.json [--tolerance 0.25]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import streamlit.logger
+from streamlit import config
+
+# Les appels Streamlit hors `streamlit run` émettent des avertissements sans intérêt ici
+config.set_option('global.showWarningOnDirectExecution', False)
+streamlit.logger.set_log_level('error')
+
+import Dashboard as D  # noqa: E402
+
+
+def chronometrer(fonction, repetitions=3):
+    """Meilleur temps (en secondes) sur plusieurs exécutions"""
+    meilleur = float('inf')
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        fonction()
+        meilleur = min(meilleur, time.perf_counter() - debut)
+    return meilleur
+
+
+def lanceurs_reference():
+    """Lanceurs du dashboard, sans instancier l'application Streamlit"""
+    return D.GuyaneAerospatialeDashboard.define_lanceurs(None)
+
+
+def afficher_resultats(titre, resultats):
+    """Affiche une liste de résultats sous forme de tableau"""
+    print(f"\n=== {titre} ===")
+    print(pd.DataFrame(resultats).to_string(index=False))
+
+
+# Implémentations d'origine (boucles Python), conservées comme référence
+
+def missions_boucle(lanceurs, n):
+    """Génération historique des missions, une mission par itération"""
+    missions = []
+    for _ in range(n):
+        date_lancement = datetime(random.randint(2002, 2025), random.randint(1, 12), random.randint(1, 28))
+        if random.random() > 0.1:
+            statut = 'Succès'
+        else:
+            statut = random.choices(D.STATUTS_ECHEC, weights=D.POIDS_ECHEC)[0]
+        missions.append({
+            'mission_id': f'{random.choice(D.PREFIXES_MISSION)}{random.randint(200, 299)}',
+            'lanceur': random.choice(list(lanceurs.keys())),
+            'date_lancement': date_lancement,
+            'client': random.choice(D.CLIENTS_MISSION),
+            'type_mission': random.choice(D.TYPES_MISSION),
+            'orbite': random.choice(D.ORBITES),
+            'statut': statut,
+            'charge_utile': f'Satellite {random.choice(D.TYPES_CHARGE_UTILE)} {random.randint(1, 100)}',
+            'masse_charge_utile': random.randint(100, 10000),
+            'site_lancement': random.choice(D.SITES_LANCEMENT)
+        })
+    return pd.DataFrame(missions)
+
+
+def trafic_boucle(lanceurs, freq):
+    """Génération historique du trafic, boucles période × lanceur"""
+    data = []
+    for date in pd.date_range('2002-01-01', datetime.now(), freq=freq):
+        for lanceur, info in lanceurs.items():
+            if date.year < int(info['premier_vol']):
+                continue
+            if lanceur == 'Vega C' and date.year < D.DEBUT_VEGA_C:
+                continue
+            base_lancements = D.BASE_LANCEMENTS_ANNUELS.get(lanceur, 1)
+            lancements_mois = max(0, int(base_lancements / 12 * random.uniform(0.8, 1.2)))
+            data.append({
+                'date': date,
+                'lanceur': lanceur,
+                'lancements': lancements_mois,
+                'satellites_lances': random.randint(1, 4) * lancements_mois,
+                'masse_totale': random.randint(1000, 20000) * lancements_mois,
+                'type_lanceur': info['type']
+            })
+    return pd.DataFrame(data)
+
+
+def bench_generateur(args):
+    """Compare le générateur vectorisé aux boucles d'origine"""
+    lanceurs = lanceurs_reference()
+    generateur = D.GenerateurDonnees(lanceurs, graine=0)
+    resultats = []
+
+    for n in args.tailles:
+        vectorise = chronometrer(lambda: generateur.missions(n))
+        boucle = chronometrer(lambda: missions_boucle(lanceurs, n), 1) if n <= args.max_boucle else None
+        resultats.append({'table': 'missions', 'lignes': n, 'boucle_s': boucle, 'vectorise_s': vectorise,
+                          'acceleration': boucle / vectorise if boucle else None})
+
+    for freq in ['ME', 'W', 'D']:
+        lignes = len(generateur.trafic('2002-01-01', datetime.now(), freq))
+        vectorise = chronometrer(lambda: generateur.trafic('2002-01-01', datetime.now(), freq))
+        boucle = chronometrer(lambda: trafic_boucle(lanceurs, freq), 1)
+        resultats.append({'table': f'trafic ({freq})', 'lignes': lignes, 'boucle_s': boucle,
+                          'vectorise_s': vectorise, 'acceleration': boucle / vectorise})
+
+    afficher_resultats("Générateur de données", resultats)
+    return resultats
+
+
+def missions_objet(missions):
+    """Table des missions au format d'origine (chaînes Python, entiers 64 bits)"""
+    colonnes = {colonne: missions[colonne].astype(object) for colonne in missions.columns
+                if isinstance(missions[colonne].dtype, pd.CategoricalDtype)}
+    return missions.assign(masse_charge_utile=missions['masse_charge_utile'].astype('int64'), **colonnes)
+
+
+def bench_memoire(args):
+    """Empreinte mémoire et agrégations : schéma compact vs table d'origine"""
+    generateur = D.GenerateurDonnees(lanceurs_reference(), graine=0)
+    resultats = []
+
+    for n in args.tailles:
+        compacte = generateur.missions(n)
+        objet = missions_objet(compacte)
+        print(f"\n--- {n} missions : mémoire (octets) ---")
+        print(D.rapport_memoire({'objet': objet, 'compact': compacte}).to_string())
+
+        for nom, table in [('objet', objet), ('compact', compacte)]:
+            resultats.append({
+                'lignes': n,
+                'schema': nom,
+                'octets': int(table.memory_usage(index=False, deep=True).sum()),
+                'value_counts_s': chronometrer(lambda: table['lanceur'].value_counts()),
+                'groupby_annee_s': chronometrer(lambda: table.groupby(
+                    [table['date_lancement'].dt.year, 'client'], observed=True).size()),
+                'crosstab_s': chronometrer(lambda: pd.crosstab(table['lanceur'], table['orbite']))
+            })
+
+    afficher_resultats("Schéma compact des missions", resultats)
+    return resultats
+
+
+def bench_tampon(args):
+    """Débit d'ajout de missions : pd.concat par mission vs TamponMissions"""
+    lanceurs = lanceurs_reference()
+    generateur = D.GenerateurDonnees(lanceurs, graine=0)
+    schema = D.schema_missions(lanceurs)
+    resultats = []
+
+    for n in args.tailles:
+        nouvelles = generateur.missions(n)
+        enregistrements = missions_objet(nouvelles).to_dict('records')
+
+        # Ancien chemin : une concaténation (copie complète) par mission, mesurée sur un échantillon
+        table = generateur.missions(n)
+        echantillon = enregistrements[:args.echantillon_concat]
+        debut = time.perf_counter()
+        for mission in echantillon:
+            table = pd.concat([table, pd.DataFrame([mission])], ignore_index=True)
+        concat_par_s = len(echantillon) / (time.perf_counter() - debut)
+
+        tampon = D.TamponMissions(schema)
+        debut = time.perf_counter()
+        for mission in enregistrements:
+            tampon.ajouter(mission)
+        unitaire_par_s = n / (time.perf_counter() - debut)
+        creation_vue = chronometrer(lambda: (setattr(tampon, '_vue', None), tampon.vue()), 1)
+
+        tampon = D.TamponMissions(schema)
+        taille_lot = 1000
+        debut = time.perf_counter()
+        for position in range(0, n, taille_lot):
+            tampon.ajouter_lot(nouvelles.iloc[position:position + taille_lot])
+        lot_par_s = n / (time.perf_counter() - debut)
+
+        resultats.append({'missions': n, 'concat_missions_par_s': concat_par_s,
+                          'tampon_missions_par_s': unitaire_par_s,
+                          'tampon_lots_1000_missions_par_s': lot_par_s, 'creation_vue_s': creation_vue})
+
+    afficher_resultats("Ajout de missions", resultats)
+    return resultats
+
+
+def filtres_masques(missions, filtres):
+    """Filtrage d'origine : masques booléens chaînés sur toute la table"""
+    masque = missions['lanceur'].isin(filtres.get('lanceurs', missions['lanceur'].cat.categories))
+    if 'statuts' in filtres:
+        masque &= missions['statut'].isin(filtres['statuts'])
+    if 'clients' in filtres:
+        masque &= missions['client'].isin(filtres['clients'])
+    masque &= missions['date_lancement'].between(filtres['debut'], filtres['fin'])
+    return missions[masque]
+
+
+def bench_filtres(args):
+    """Résolution des filtres : masques pandas vs IndexMissions"""
+    lanceurs = lanceurs_reference()
+    generateur = D.GenerateurDonnees(lanceurs, graine=0)
+    combinaisons = {
+        'lanceur + période': {'lanceurs': ('Vega',), 'debut': pd.Timestamp(2010, 1, 1),
+                              'fin': pd.Timestamp(2015, 12, 31)},
+        'lanceur + statut + client': {'lanceurs': ('Vega C',), 'statuts': ('Échec',), 'clients': ('ESA',),
+                                      'debut': pd.Timestamp(2002, 1, 1), 'fin': pd.Timestamp(2030, 1, 1)},
+        'période courte': {'debut': pd.Timestamp(2020, 3, 1), 'fin': pd.Timestamp(2020, 3, 31)},
+    }
+    resultats = []
+
+    for n in args.tailles:
+        missions = generateur.missions(n)
+        construction = chronometrer(lambda: D.IndexMissions(missions), 1)
+        index = D.IndexMissions(missions)
+        for nom, filtres in combinaisons.items():
+            positions = index.selectionner(filtres)
+            assert len(positions) == len(filtres_masques(missions, filtres))
+            resultats.append({
+                'missions': n, 'filtres': nom, 'retenues': len(positions),
+                'masques_s': chronometrer(lambda: filtres_masques(missions, filtres)),
+                'index_s': chronometrer(lambda: index.selectionner(filtres)),
+                'index_et_table_s': chronometrer(lambda: missions.take(index.selectionner(filtres))),
+                'construction_index_s': construction
+            })
+
+    afficher_resultats("Moteur de filtres", resultats)
+    return resultats
+
+
+def bench_stockage(args):
+    """Chargement complet vs projection et filtres poussés dans SQLite/Parquet"""
+    lanceurs = lanceurs_reference()
+    generateur = D.GenerateurDonnees(lanceurs, graine=0)
+    vue = {'lanceurs': ('Vega',), 'debut': pd.Timestamp(2015, 1, 1), 'fin': pd.Timestamp(2016, 12, 31)}
+    resultats = []
+
+    for n in args.tailles:
+        missions = generateur.missions(n)
+        shutil.rmtree(args.dossier, ignore_errors=True)
+        os.makedirs(args.dossier)
+        stockages = {
+            'sqlite': D.StockageSQLite(lanceurs, os.path.join(args.dossier, 'csg.db')),
+            'parquet': D.StockageParquet(lanceurs, os.path.join(args.dossier, 'parquet'))
+        }
+        for nom, stockage in stockages.items():
+            ecriture = chronometrer(lambda: stockage.ecrire('missions', missions), 1)
+            resultats.append({
+                'missions': n, 'stockage': nom, 'ecriture_s': ecriture,
+                'complet_s': chronometrer(lambda: stockage.charger('missions'), 1),
+                'cube_projete_s': chronometrer(lambda: stockage.charger('missions', D.COLONNES_CUBE), 1),
+                'vue_filtree_s': chronometrer(lambda: stockage.charger('missions', filtres=vue)),
+                'lignes_vue': len(stockage.charger('missions', filtres=vue))
+            })
+        shutil.rmtree(args.dossier, ignore_errors=True)
+
+    afficher_resultats("Stockage des missions", resultats)
+    return resultats
+
+
+def tables_simulees(lanceurs, n_missions, graine=None):
+    """Tables produites par les générateurs du dashboard"""
+    generateur = D.GenerateurDonnees(lanceurs, graine=graine)
+    return {
+        'missions': generateur.missions(n_missions),
+        'trafic': generateur.trafic('2002-01-01', datetime.now()),
+        'clients': D.GuyaneAerospatialeDashboard.initialize_clients_data(None)
+    }
+
+
+def bench_instantane(args):
+    """Construit l'instantané mmap puis compare son ouverture à la régénération des données"""
+    lanceurs = lanceurs_reference()
+    tables = tables_simulees(lanceurs, args.missions, D.GRAINE_DONNEES)
+    shutil.rmtree(args.dossier, ignore_errors=True)
+    instantane = D.StockageInstantane(lanceurs, args.dossier)
+    construction = chronometrer(lambda: [instantane.ecrire(table, donnees) for table, donnees in tables.items()], 1)
+    print(f"Instantané écrit dans {args.dossier} (utilisation : CSG_STOCKAGE=instantane:{args.dossier})")
+
+    def regenerer():
+        stockage = D.StockageMemoire(lanceurs, tables_simulees(lanceurs, args.missions, D.GRAINE_DONNEES))
+        return D.CubeMissions.depuis_missions(stockage.charger('missions', D.COLONNES_CUBE))
+
+    def ouvrir():
+        stockage = D.StockageInstantane(lanceurs, args.dossier)
+        return D.CubeMissions.depuis_missions(stockage.charger('missions', D.COLONNES_CUBE))
+
+    # Le cube de l'instantané et sa copie de session doivent être identiques
+    cube = ouvrir()
+    assert cube.copie() == cube
+    # L'entrepôt complet (dimensions comprises) se construit sur l'instantané
+    entrepot = D.EntrepotDonnees(SimpleNamespace(define_lanceurs=lanceurs_reference), D.VERSION_DONNEES,
+                                 f'instantane:{args.dossier}')
+    assert entrepot.cube == cube
+    assert not pd.isna(entrepot.clients.pays).any()
+
+    resultats = [{
+        'missions': args.missions, 'construction_s': construction,
+        'regeneration_s': chronometrer(regenerer), 'ouverture_instantane_s': chronometrer(ouvrir),
+        'ouverture_sans_cube_s': chronometrer(lambda: D.StockageInstantane(lanceurs, args.dossier))
+    }]
+    afficher_resultats("Démarrage : régénération vs instantané", resultats)
+    return resultats
+
+
+def evenements_lancement(n, graine=0):
+    """Lignes JSON d'événements de lancement (et un changement de statut sur dix)"""
+    missions = missions_objet(D.GenerateurDonnees(lanceurs_reference(), graine=graine).missions(n))
+    missions['date_lancement'] = missions['date_lancement'].dt.strftime('%Y-%m-%d')
+    lignes = []
+    for position, mission in enumerate(missions.to_dict('records')):
+        lignes.append(json.dumps({'type': 'lancement', **mission}, ensure_ascii=False))
+        if position % 10 == 9:
+            lignes.append(json.dumps({'type': 'statut', 'mission_id': mission['mission_id'], 'statut': 'Succès'},
+                                     ensure_ascii=False))
+    return ''.join(ligne + '\n' for ligne in lignes).encode()
+
+
+def bench_flux(args):
+    """Débit de l'ingestion directe (TCP local) et latence des lectures du thread du script"""
+    donnees = evenements_lancement(args.evenements)
+    attendus = donnees.count(b'\n')
+    flux = D.FluxDirect(f'tcp:127.0.0.1:{args.port}', lanceurs_reference(), taille_file=args.taille_file)
+    time.sleep(0.5)
+
+    # Le thread du script lit la vue pendant l'ingestion, comme un rafraîchissement live
+    latences = []
+    fin_lecture = threading.Event()
+
+    def lire():
+        while not fin_lecture.is_set():
+            debut = time.perf_counter()
+            flux.vue()
+            latences.append(time.perf_counter() - debut)
+            time.sleep(0.01)
+
+    lecteur = threading.Thread(target=lire)
+    lecteur.start()
+    debut = time.perf_counter()
+    with socket.create_connection(('127.0.0.1', args.port)) as connexion:
+        connexion.sendall(donnees)
+    while sum(flux.etat()[1][compteur] for compteur in ('recus', 'rejetes')) < attendus:
+        time.sleep(0.01)
+    duree = time.perf_counter() - debut
+    fin_lecture.set()
+    lecteur.join()
+    flux.arreter()
+    version, statistiques = flux.etat()
+
+    latences = pd.Series(latences)
+    resultats = [{
+        'evenements': attendus, 'duree_s': duree, 'evenements_par_s': attendus / duree,
+        'versions_publiees': version, 'rejetes': statistiques['rejetes'],
+        'lecture_vue_p50_ms': latences.quantile(0.5) * 1000, 'lecture_vue_p99_ms': latences.quantile(0.99) * 1000
+    }]
+    afficher_resultats("Ingestion directe", resultats)
+    return resultats
+
+
+def bench_reduction(args):
+    """Taille et coût des figures de séries temporelles : tous les points vs LTTB au budget"""
+    import plotly.express as px
+
+    generateur = D.GenerateurDonnees(lanceurs_reference(), graine=0)
+    resultats = []
+    for freq in args.frequences:
+        trafic = generateur.trafic('2002-01-01', datetime.now(), freq)
+
+        def figure(donnees):
+            return px.line(donnees, x='date', y='masse_totale', color='lanceur')
+
+        configurations = [('complet', trafic)] + [
+            (f'lttb {budget}', D.reduire_series(trafic, 'date', 'masse_totale', budget, groupe='lanceur'))
+            for budget in args.budgets]
+        for nom, donnees in configurations:
+            resultats.append({
+                'frequence': freq, 'series': nom, 'points': len(donnees),
+                'reduction_s': chronometrer(lambda: D.reduire_series(trafic, 'date', 'masse_totale',
+                                                                     len(donnees), groupe='lanceur')),
+                'figure_s': chronometrer(lambda: figure(donnees).to_json()),
+                'json_octets': len(figure(donnees).to_json())
+            })
+
+    afficher_resultats("Réduction des séries temporelles", resultats)
+    return resultats
+
+
+class EmplacementMuet:
+    """Emplacement de figure sans navigateur"""
+
+    def plotly_chart(self, figure, **parametres):
+        pass
+
+
+def figures_reference(n):
+    """n constructeurs de figures indépendants, du type de ceux des sections du dashboard"""
+    import plotly.express as px
+
+    generateur = D.GenerateurDonnees(lanceurs_reference(), graine=0)
+    missions = generateur.missions(10_000)
+    trafic = generateur.trafic('2002-01-01', datetime.now())
+    modeles = [
+        (px.line, dict(x='date', y='lancements', color='lanceur'), trafic),
+        (px.area, dict(x='date', y='masse_totale', color='lanceur'), trafic),
+        (px.bar, dict(x='client', y='nombre', color='client'), missions['client'].value_counts().reset_index(name='nombre')),
+        (px.pie, dict(values='nombre', names='orbite'), missions['orbite'].value_counts().reset_index(name='nombre')),
+        (px.imshow, dict(text_auto=True), pd.crosstab(missions['lanceur'], missions['orbite'])),
+    ]
+    figures = []
+    for position in range(n):
+        fonction, parametres, donnees = modeles[position % len(modeles)]
+        figures.append((D.constructeur(fonction, title=f'Figure {position}', **parametres), donnees))
+    return figures
+
+
+def bench_figures(args):
+    """Temps de construction d'un lot de figures : séquentiel vs pipeline de rendu parallèle"""
+    figures = figures_reference(args.figures)
+
+    def sequentiel():
+        for construire, donnees in figures:
+            construire(donnees).to_json()
+
+    resultats = [{'mode': 'séquentiel', 'travailleurs': 1, 'duree_s': chronometrer(sequentiel, 1)}]
+    for mode in args.modes:
+        for travailleurs in args.travailleurs:
+            if mode == 'processus':
+                pool = ProcessPoolExecutor(travailleurs, mp_context=multiprocessing.get_context('spawn'))
+            else:
+                pool = ThreadPoolExecutor(travailleurs)
+
+            def pipeline():
+                with D.PipelineFigures(pool, D.CacheFigures(1 << 30)) as rendu:
+                    for position, (construire, donnees) in enumerate(figures):
+                        rendu.soumettre(EmplacementMuet(), position, construire, donnees)
+
+            pipeline()  # démarrage des travailleurs
+            resultats.append({'mode': mode, 'travailleurs': travailleurs, 'duree_s': chronometrer(pipeline, 1)})
+            pool.shutdown()
+
+    reference = resultats[0]['duree_s']
+    for resultat in resultats:
+        resultat['acceleration'] = reference / resultat['duree_s']
+    print(f"\n{os.cpu_count()} cœurs disponibles")
+    afficher_resultats("Pipeline de rendu des figures", resultats)
+    return resultats
+
+
+def bench_specs(args):
+    """Construction de chaque type de graphique : plotly.express vs spécification légère"""
+    import plotly.express as px
+
+    generateur = D.GenerateurDonnees(lanceurs_reference(), graine=0)
+    lanceurs = lanceurs_reference()
+    missions = generateur.missions(args.missions)
+    annuels = missions.groupby([missions['date_lancement'].dt.year, 'lanceur'],
+                               observed=True).size().reset_index(name='nombre_lancements')
+    couleurs = {lanceur: info['couleur'] for lanceur, info in lanceurs.items()}
+    graphiques = [
+        ('barres (couleurs discrètes)', px.bar, missions['lanceur'].value_counts().reset_index(name='vols'),
+         dict(x='lanceur', y='vols', color='lanceur', color_discrete_map=couleurs)),
+        ('barres (échelle continue)', px.bar, missions['type_mission'].value_counts().reset_index(name='nombre'),
+         dict(x='nombre', y='type_mission', orientation='h', color='nombre', color_continuous_scale='Viridis')),
+        ('secteurs', px.pie, missions['orbite'].value_counts().reset_index(name='nombre'),
+         dict(values='nombre', names='orbite')),
+        ('courbes', px.line, annuels,
+         dict(x='date_lancement', y='nombre_lancements', color='lanceur', color_discrete_map=couleurs)),
+        ('aires empilées', px.area, annuels, dict(x='date_lancement', y='nombre_lancements', color='lanceur')),
+        ('carte de chaleur', px.imshow, pd.crosstab(missions['lanceur'], missions['orbite']),
+         dict(color_continuous_scale='Blues')),
+    ]
+
+    resultats = []
+    for nom, fonction, donnees, parametres in graphiques:
+        parametres = dict(parametres, title=nom)
+        express = chronometrer(lambda: fonction(donnees, **parametres).to_json(), 5)
+        legere = chronometrer(lambda: D.figure_legere(fonction, donnees, **parametres).to_json(), 5)
+        resultats.append({'graphique': nom, 'plotly_express_ms': express * 1000, 'specification_ms': legere * 1000,
+                          'acceleration': express / legere})
+    afficher_resultats("Construction des figures par type de graphique", resultats)
+    return resultats
+
+
+def bench_cumuls(args):
+    """Requêtes des graphiques temporels : groupby sur les lignes vs cumuls multi-résolutions"""
+    generateur = D.GenerateurDonnees(lanceurs_reference(), graine=0)
+    dimensions, mesures = D.DEFINITION_CUMULS['missions']
+    periodes_requetes = {
+        '20 ans': {'debut': pd.Timestamp(2004, 1, 1), 'fin': pd.Timestamp(2023, 12, 31, 23, 59, 59)},
+        '20 ans, 2 lanceurs': {'lanceurs': ('Vega', 'Ariane 5'), 'debut': pd.Timestamp(2004, 3, 15),
+                               'fin': pd.Timestamp(2024, 8, 20, 23, 59, 59)},
+        '1 trimestre': {'debut': pd.Timestamp(2020, 1, 1), 'fin': pd.Timestamp(2020, 3, 31, 23, 59, 59)},
+    }
+    resultats = []
+
+    for n in args.tailles:
+        missions = generateur.missions(n)
+        construction = chronometrer(lambda: D.CumulsTemporels.depuis_table(missions, dimensions, mesures,
+                                                                           'date_lancement'), 1)
+        cumuls = D.CumulsTemporels.depuis_table(missions, dimensions, mesures, 'date_lancement')
+        for nom, filtres in periodes_requetes.items():
+            def groupby():
+                retenues = missions[D.masque_missions(missions, filtres)]
+                return retenues.groupby([retenues['date_lancement'].dt.year, 'client'],
+                                        observed=True).size()
+
+            assert groupby().sum() == cumuls.requete('annee', par='client', filtres=filtres)['lignes'].sum()
+            resultats.append({
+                'missions': n, 'requete': nom,
+                'groupby_ms': chronometrer(groupby) * 1000,
+                'cumuls_ms': chronometrer(lambda: cumuls.requete('annee', par='client', filtres=filtres)) * 1000,
+                'construction_s': construction
+            })
+
+        # Mise à jour incrémentale : une mission ajoutée vs reconstruction complète
+        mission = missions.iloc[0].to_dict()
+        resultats.append({
+            'missions': n, 'requete': 'ajout d\'une mission',
+            'groupby_ms': construction * 1000,
+            'cumuls_ms': chronometrer(lambda: cumuls.ajouter(mission)) * 1000,
+            'construction_s': construction
+        })
+
+    afficher_resultats("Cumuls temporels (colonne groupby_ms de l'ajout = reconstruction complète)", resultats)
+    return resultats
+
+
+def bench_projections(args):
+    """Projection des lancements : boucle d'origine (un tirage par année) vs scénarios vectorisés"""
+    import random
+
+    missions = D.GenerateurDonnees(lanceurs_reference(), graine=0).missions(args.missions)
+    annuels = missions.groupby(missions['date_lancement'].dt.year).size()
+
+    def boucle(scenarios):
+        # Boucle d'origine, répétée une fois par scénario
+        derniere = int(annuels.index.max())
+        return [[int(10 * (1 + random.uniform(0.05, 0.15)) ** (annee - derniere))
+                 for annee in range(derniere + 1, D.ANNEE_FIN_PROJECTION + 1)] for _ in range(scenarios)]
+
+    resultats = []
+    for scenarios in args.scenarios:
+        resultats.append({
+            'scenarios': scenarios,
+            'boucle_ms': chronometrer(lambda: boucle(scenarios)) * 1000,
+            'vectorise_ms': chronometrer(lambda: D.projeter_lancements(annuels.index, annuels.to_numpy(),
+                                                                       scenarios=scenarios)) * 1000
+        })
+    afficher_resultats("Projections de Monte Carlo", resultats)
+    return resultats
+
+
+def bench_periodes(args):
+    """Comparaison de deux périodes : deux masques sur toute la table vs sommes préfixes"""
+    generateur = D.GenerateurDonnees(lanceurs_reference(), graine=0)
+    reference, comparee = D.PERIODES_COMPAREES
+    resultats = []
+
+    for n in args.tailles:
+        missions = generateur.missions(n)
+
+        def masques():
+            totaux = []
+            for debut, fin in (reference, comparee):
+                periode = missions[(missions['date_lancement'] >= debut)
+                                   & (missions['date_lancement'] < fin + pd.Timedelta(days=1))]
+                totaux.append((len(periode), periode['masse_charge_utile'].sum(),
+                               (periode['statut'] == 'Succès').mean() * 100,
+                               periode.groupby('lanceur', observed=True).size()))
+            return totaux
+
+        comparateur = D.ComparateurPeriodes(missions)
+        assert masques()[1][0] == comparateur.comparer(reference, comparee)[1]['lancements']
+        assert not comparateur.fenetre(reference[1], reference[0]).any()
+        resultats.append({
+            'missions': n,
+            'masques_ms': chronometrer(masques) * 1000,
+            'sommes_prefixes_ms': chronometrer(lambda: comparateur.comparer(reference, comparee)) * 1000,
+            'construction_ms': chronometrer(lambda: D.ComparateurPeriodes(missions), 1) * 1000
+        })
+    afficher_resultats("Comparaison de périodes", resultats)
+    return resultats
+
+
+def bench_matrices(args):
+    """Tableaux croisés : pd.crosstab à chaque affichage vs cache de matrices de contingence"""
+    generateur = D.GenerateurDonnees(lanceurs_reference(), graine=0)
+    resultats = []
+
+    for n in args.tailles:
+        missions = generateur.missions(n)
+        matrices = D.MatricesContingence.depuis_missions(missions)
+        assert (pd.crosstab(missions['lanceur'], missions['orbite']).to_numpy()
+                == matrices.table('lanceur_orbite').to_numpy()).all()
+        mission = missions.iloc[0].to_dict()
+        resultats.append({
+            'missions': n,
+            'crosstab_ms': chronometrer(lambda: pd.crosstab(missions['lanceur'], missions['orbite'])) * 1000,
+            'matrice_ms': chronometrer(lambda: matrices.table('lanceur_orbite')) * 1000,
+            'ajout_mission_ms': chronometrer(lambda: matrices.ajouter(mission)) * 1000,
+            'construction_ms': chronometrer(lambda: D.MatricesContingence.depuis_missions(missions), 1) * 1000
+        })
+    afficher_resultats("Matrices de contingence", resultats)
+    return resultats
+
+
+def bench_clients(args):
+    """Métriques par client et par pays : iterrows et .loc d'origine vs dimension des clients"""
+    rng = np.random.default_rng(0)
+    resultats = []
+
+    for n in args.clients:
+        clients = pd.DataFrame({'client': [f'Client {i}' for i in range(n)],
+                                'couleur': rng.choice(['#0d3b66', '#e37222'], n),
+                                'pays': [f'Pays {i % 50}' for i in range(n)]})
+        missions = pd.Series(rng.integers(0, 50, n))
+
+        def iterrows():
+            # Chemin d'origine : une ligne puis trois .loc par client, et une table de couleurs par iterrows
+            table = clients.assign(missions_total=missions)
+            couleurs = {info['client']: info['couleur'] for _, info in table.iterrows()}
+            lignes = [{'pays': table.loc[client, 'pays'], 'missions': table.loc[client, 'missions_total']}
+                      for client, _ in table.iterrows()]
+            return couleurs, pd.DataFrame(lignes).groupby('pays').sum()
+
+        def dimension():
+            dimension_clients = D.DimensionClients(clients, pd.Index([]))
+            return dimension_clients.par_pays(dimension_clients.metriques(clients['client'], missions=missions))
+
+        resultats.append({'clients': n, 'iterrows_ms': chronometrer(iterrows) * 1000,
+                          'dimension_ms': chronometrer(dimension) * 1000})
+    afficher_resultats("Métriques par client et par pays", resultats)
+    return resultats
+
+
+# Premier affichage dans un processus neuf (AppTest, sans navigateur)
+CODE_DEMARRAGE = """
+import sys
+from streamlit.testing.v1 import AppTest
+essai = AppTest.from_file(sys.argv[1], default_timeout=600)
+if sys.argv[2]:
+    essai.session_state['section_active'] = sys.argv[2]
+essai.run()
+sys.exit(1 if essai.exception else 0)
+"""
+
+
+def imports_dashboard(nombre):
+    """Coût des imports de Dashboard.py par paquet de premier niveau (python -X importtime)"""
+    sortie = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import Dashboard'],
+                            cwd=os.path.dirname(os.path.abspath(D.__file__)), capture_output=True, text=True)
+    paquets = []
+    for ligne in sortie.stderr.splitlines():
+        correspondance = re.match(r'import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$', ligne)
+        # Un niveau d'indentation : paquets importés directement par le script
+        if correspondance and len(correspondance.group(3)) == 2:
+            paquets.append({'paquet': correspondance.group(4), 'cumul_ms': int(correspondance.group(2)) / 1000})
+    return sorted(paquets, key=lambda paquet: -paquet['cumul_ms'])[:nombre]
+
+
+def bench_demarrage(args):
+    """Temps jusqu'au premier affichage, par étape, et coût des imports du script"""
+    chemin = os.path.abspath(D.__file__)
+    rapports = []
+    for _ in range(args.repetitions):
+        with tempfile.TemporaryDirectory() as dossier:
+            fichier = os.path.join(dossier, 'profil.json')
+            debut = time.time()
+            execution = subprocess.run([sys.executable, '-c', CODE_DEMARRAGE, chemin, args.section],
+                                       env={**os.environ, 'CSG_PROFIL_DEMARRAGE': fichier},
+                                       capture_output=True, text=True)
+            total = time.time() - debut
+            if execution.returncode or not os.path.exists(fichier):
+                raise RuntimeError(f"Échec du premier affichage :\n{execution.stderr[-2000:]}")
+            with open(fichier, encoding='utf-8') as profil:
+                rapports.append(dict(json.load(profil), processus_ms=total * 1000))
+
+    etapes = pd.DataFrame([etape for rapport in rapports for etape in rapport['etapes']])
+    resultats = etapes.groupby('etape', sort=False)['duree_ms'].median().reset_index()
+    resultats = pd.concat([resultats, pd.DataFrame([
+        {'etape': 'premier affichage', 'duree_ms': pd.Series([r['premier_affichage_ms'] for r in rapports]).median()},
+        {'etape': 'processus complet', 'duree_ms': pd.Series([r['processus_ms'] for r in rapports]).median()}
+    ])]).to_dict('records')
+    differes = pd.DataFrame([rapport['imports_differes_ms'] for rapport in rapports]).median()
+    imports = imports_dashboard(args.imports)
+
+    afficher_resultats(f"Premier affichage (médiane sur {args.repetitions} processus)", resultats)
+    afficher_resultats("Imports différés", differes.rename('duree_ms').rename_axis('module').reset_index())
+    afficher_resultats("Imports de Dashboard.py (python -X importtime)", imports)
+    return {'etapes': resultats, 'imports_differes': differes.to_dict(), 'imports': imports}
+
+
+# Vues du dashboard : section et éventuel onglet (clé de session, libellés). La télémétrie, dont la
+# séquence d'affichage dure DUREE_SEQUENCE_TELEMETRIE secondes par construction, n'est pas mesurée.
+VUES_DASHBOARD = {
+    '🚀 Lanceurs': ('onglet_lanceurs', ["Performance", "Capacités", "Évolution", "Détails Techniques"]),
+    '📅 Missions': ('onglet_missions', ["Calendrier des Missions", "Statistiques", "Analyse des Orbites"]),
+    '🏢 Clients': ('onglet_clients', ["Parts de Marché", "Évolution Clients", "Analyse Géographique"]),
+    '📈 Évolution': ('onglet_evolution', ["Évolution Temporelle", "Impact COVID", "Projections Futures"]),
+    '🗺️ CSG': None,
+    '📊 Insights': None,
+    'ℹ️ À Propos': None,
+}
+
+# Exécutions complètes du script (AppTest) dans un processus neuf, pour une taille de données
+CODE_DASHBOARD = """
+import json
+import sys
+import time
+from streamlit.testing.v1 import AppTest
+
+chemin, export, vues, repetitions = sys.argv[1], sys.argv[2], json.loads(sys.argv[3]), int(sys.argv[4])
+
+
+def executer(etat):
+    essai = AppTest.from_file(chemin, default_timeout=3600)
+    for cle, valeur in etat.items():
+        essai.session_state[cle] = valeur
+    debut = time.perf_counter()
+    essai.run()
+    duree = time.perf_counter() - debut
+    if essai.exception:
+        raise RuntimeError(f"{etat} : {essai.exception[0].message}")
+    return duree
+
+
+def mesures():
+    with open(export, encoding='utf-8') as fichier:
+        return json.load(fichier)['mesures']
+
+
+durees = {'premier affichage': executer({})}
+froides = mesures()
+for nom, etat in vues:
+    durees[nom] = sorted(executer(etat) for _ in range(repetitions))[repetitions // 2]
+print(json.dumps({'durees': durees, 'froides': froides, 'chaudes': mesures()}))
+"""
+
+
+def vues_dashboard(sections):
+    """(nom, état de session) de chaque vue retenue"""
+    vues = []
+    for section, onglets in VUES_DASHBOARD.items():
+        if sections and section not in sections:
+            continue
+        if onglets is None:
+            vues.append((section, {'section_active': section}))
+        else:
+            cle, libelles = onglets
+            vues += [(f'{section} / {onglet}', {'section_active': section, cle: onglet}) for onglet in libelles]
+    return vues
+
+
+def comparer_reference(mesures, reference, tolerance, plancher_ms):
+    """Écart de chaque mesure à la référence ; régression au-delà de la tolérance et du plancher absolu"""
+    references = {(ligne['missions'], ligne['mesure']): ligne['ms'] for ligne in reference}
+    comparaison = []
+    for ligne in mesures:
+        ms_reference = references.get((ligne['missions'], ligne['mesure']))
+        if ms_reference is None:
+            continue
+        comparaison.append({
+            'missions': ligne['missions'], 'mesure': ligne['mesure'], 'reference_ms': ms_reference,
+            'ms': ligne['ms'], 'rapport': ligne['ms'] / ms_reference if ms_reference else float('inf'),
+            'regression': ligne['ms'] > ms_reference * (1 + tolerance) and ligne['ms'] - ms_reference > plancher_ms
+        })
+    return comparaison
+
+
+def bench_dashboard(args):
+    """Dashboard complet sans navigateur : __init__, update_live_data, méthodes create_* et exécutions
+    complètes de chaque vue, à plusieurs tailles de données, comparés à une référence"""
+    chemin = os.path.abspath(D.__file__)
+    vues = vues_dashboard(args.sections)
+    mesures = []
+    for n in args.tailles:
+        with tempfile.TemporaryDirectory() as dossier:
+            export = os.path.join(dossier, 'mesures.json')
+            environnement = {**os.environ, 'CSG_MISSIONS': str(n), 'CSG_GRAINE': '0', 'CSG_EXPORT_MESURES': export}
+            execution = subprocess.run([sys.executable, '-c', CODE_DASHBOARD, chemin, export, json.dumps(vues),
+                                        str(args.repetitions)], env=environnement, capture_output=True, text=True)
+        if execution.returncode:
+            raise RuntimeError(f"Échec du dashboard à {n} missions :\n{execution.stderr[-2000:]}")
+        releve = json.loads(execution.stdout.strip().splitlines()[-1])
+
+        # Construction des données de référence : premier __init__ du processus
+        init_froid = next(mesure for mesure in releve['froides']
+                          if (mesure['genre'], mesure['nom']) == ('methode', '__init__'))
+        mesures.append({'missions': n, 'mesure': '__init__ (premier)', 'ms': init_froid['sommes']['duree'] * 1000})
+        mesures += [{'missions': n, 'mesure': f'run_dashboard {vue}', 'ms': duree * 1000}
+                    for vue, duree in releve['durees'].items()]
+        mesures += [{'missions': n, 'mesure': mesure['nom'], 'ms': mesure['quantiles']['duree']['p50'] * 1000,
+                     'p95_ms': mesure['quantiles']['duree']['p95'] * 1000}
+                    for mesure in releve['chaudes'] if mesure['genre'] == 'methode']
+
+    afficher_resultats(f"Dashboard sans navigateur (médianes sur {args.repetitions} exécutions par vue)", mesures)
+    resultats = {'mesures': mesures}
+    if args.reference:
+        with open(args.reference, encoding='utf-8') as fichier:
+            reference = json.load(fichier)
+        reference = reference.get('resultats', reference).get('mesures', [])
+        comparaison = comparer_reference(mesures, reference, args.tolerance, args.plancher_ms)
+        regressions = [ligne for ligne in comparaison if ligne['regression']]
+        afficher_resultats(f"Comparaison à {args.reference} (tolérance {args.tolerance:.0%})", comparaison)
+        print(f"\n{len(regressions)} régression(s)")
+        resultats.update(comparaison=comparaison, regressions=regressions)
+    return resultats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--json', help="Écrit les résultats dans ce fichier JSON")
+    commandes = parser.add_subparsers(dest='commande', required=True)
+
+    generateur = commandes.add_parser('generateur', help="Générateur vectorisé vs boucles d'origine")
+    generateur.add_argument('--tailles', type=int, nargs='+', default=[100, 10_000, 1_000_000])
+    generateur.add_argument('--max-boucle', type=int, default=100_000,
+                            help="Taille maximale mesurée pour la boucle d'origine")
+    generateur.set_defaults(fonction=bench_generateur)
+
+    memoire = commandes.add_parser('memoire', help="Schéma catégoriel compact vs chaînes Python")
+    memoire.add_argument('--tailles', type=int, nargs='+', default=[100, 1_000_000])
+    memoire.set_defaults(fonction=bench_memoire)
+
+    tampon = commandes.add_parser('tampon', help="Débit d'ajout : pd.concat vs TamponMissions")
+    tampon.add_argument('--tailles', type=int, nargs='+', default=[100_000, 1_000_000])
+    tampon.add_argument('--echantillon-concat', type=int, default=200,
+                        help="Nombre d'ajouts mesurés pour le chemin pd.concat")
+    tampon.set_defaults(fonction=bench_tampon)
+
+    filtres = commandes.add_parser('filtres', help="Masques booléens vs index inversés")
+    filtres.add_argument('--tailles', type=int, nargs='+', default=[10_000, 1_000_000])
+    filtres.set_defaults(fonction=bench_filtres)
+
+    stockage = commandes.add_parser('stockage', help="Chargement complet vs projection/filtres poussés")
+    stockage.add_argument('--tailles', type=int, nargs='+', default=[1_000_000])
+    stockage.add_argument('--dossier', default='csg_bench_stockage',
+                          help="Dossier temporaire des fichiers (supprimé après la mesure)")
+    stockage.set_defaults(fonction=bench_stockage)
+
+    instantane = commandes.add_parser('instantane', help="Construit l'instantané mmap et mesure le démarrage")
+    instantane.add_argument('--dossier', default='instantane_csg', help="Dossier de l'instantané (conservé)")
+    instantane.add_argument('--missions', type=int, default=100, help="Nombre de missions simulées")
+    instantane.set_defaults(fonction=bench_instantane)
+
+    flux = commandes.add_parser('flux', help="Débit de l'ingestion asynchrone des événements")
+    flux.add_argument('--evenements', type=int, default=100_000, help="Nombre de lancements envoyés")
+    flux.add_argument('--port', type=int, default=8765)
+    flux.add_argument('--taille-file', type=int, default=10_000, help="Capacité de la file bornée")
+    flux.set_defaults(fonction=bench_flux)
+
+    reduction = commandes.add_parser('reduction', help="Séries temporelles complètes vs réduites par LTTB")
+    reduction.add_argument('--frequences', nargs='+', default=['ME', 'D'], help="Pas du trafic simulé")
+    reduction.add_argument('--budgets', type=int, nargs='+', default=[500, 1000], help="Points par série")
+    reduction.set_defaults(fonction=bench_reduction)
+
+    figures = commandes.add_parser('figures', help="Construction des figures : séquentielle vs parallèle")
+    figures.add_argument('--travailleurs', type=int, nargs='+', default=[1, 2, 4, 8])
+    figures.add_argument('--modes', nargs='+', default=['threads', 'processus'], choices=['threads', 'processus'])
+    figures.add_argument('--figures', type=int, default=16, help="Nombre de figures construites")
+    figures.set_defaults(fonction=bench_figures)
+
+    specs = commandes.add_parser('specs', help="plotly.express vs spécifications légères, par graphique")
+    specs.add_argument('--missions', type=int, default=10_000, help="Nombre de missions simulées")
+    specs.set_defaults(fonction=bench_specs)
+
+    cumuls = commandes.add_parser('cumuls', help="Graphiques temporels : groupby vs cumuls multi-résolutions")
+    cumuls.add_argument('--tailles', type=int, nargs='+', default=[10_000, 1_000_000])
+    cumuls.set_defaults(fonction=bench_cumuls)
+
+    projections = commandes.add_parser('projections', help="Projections : boucle par année vs scénarios vectorisés")
+    projections.add_argument('--scenarios', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    projections.add_argument('--missions', type=int, default=10_000, help="Nombre de missions simulées")
+    projections.set_defaults(fonction=bench_projections)
+
+    periodes = commandes.add_parser('periodes', help="Comparaison de périodes : masques vs sommes préfixes")
+    periodes.add_argument('--tailles', type=int, nargs='+', default=[10_000, 1_000_000])
+    periodes.set_defaults(fonction=bench_periodes)
+
+    matrices = commandes.add_parser('matrices', help="Tableaux croisés : pd.crosstab vs matrices en cache")
+    matrices.add_argument('--tailles', type=int, nargs='+', default=[10_000, 1_000_000])
+    matrices.set_defaults(fonction=bench_matrices)
+
+    clients = commandes.add_parser('clients', help="Métriques clients : iterrows vs dimension vectorisée")
+    clients.add_argument('--clients', type=int, nargs='+', default=[10, 1_000, 10_000])
+    clients.set_defaults(fonction=bench_clients)
+
+    demarrage = commandes.add_parser('demarrage', help="Temps jusqu'au premier affichage et coût des imports")
+    demarrage.add_argument('--repetitions', type=int, default=3, help="Nombre de processus mesurés")
+    demarrage.add_argument('--section', default='', help="Section affichée (par défaut, la première)")
+    demarrage.add_argument('--imports', type=int, default=12, help="Nombre de paquets listés")
+    demarrage.set_defaults(fonction=bench_demarrage)
+
+    dashboard = commandes.add_parser('dashboard', help="Dashboard complet sans navigateur, comparé à une référence")
+    dashboard.add_argument('--tailles', type=int, nargs='+', default=[100, 10_000, 1_000_000],
+                           help="Nombres de missions simulées")
+    dashboard.add_argument('--repetitions', type=int, default=3, help="Exécutions mesurées par vue")
+    dashboard.add_argument('--sections', nargs='+', choices=list(VUES_DASHBOARD), help="Sections mesurées")
+    dashboard.add_argument('--reference', help="Résultats JSON de référence (produits avec --json)")
+    dashboard.add_argument('--tolerance', type=float, default=0.25,
+                           help="Ralentissement relatif toléré avant de signaler une régression")
+    dashboard.add_argument('--plancher-ms', type=float, default=5,
+                           help="Écart absolu minimal (ms) pour signaler une régression")
+    dashboard.set_defaults(fonction=bench_dashboard)
+
+    args = parser.parse_args()
+    resultats = args.fonction(args)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as fichier:
+            json.dump({'commande': args.commande, 'resultats': resultats}, fichier, indent=2, default=str)
+    if isinstance(resultats, dict) and resultats.get('regressions'):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()